@@ -0,0 +1,82 @@
+"""Compare two benchmark results written by benchmarks.suite.
+
+Usage, from the root of the repository:
+
+    python -m benchmarks.compare baseline.json results.json --threshold 1.2
+
+Exits with 1 if any benchmark is slower than the baseline by more than the
+threshold.
+"""
+
+import argparse
+import json
+import sys
+import typing
+
+Key = typing.Tuple[str, str, int]
+
+
+def _load(filename: str) -> typing.Dict[Key, float]:
+    """Load the results by benchmark, spec and size."""
+    with open(filename) as in_file:
+        report = json.load(in_file)
+    return {
+        (result["benchmark"], result["spec"], result["size"]): result["seconds"]
+        for result in report["results"]
+    }
+
+
+def compare(
+    *,
+    baseline: typing.Dict[Key, float],
+    results: typing.Dict[Key, float],
+    threshold: float,
+) -> typing.Tuple[typing.List[str], bool]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        baseline: The seconds of the baseline by benchmark, spec and size.
+        results: The seconds of the results by benchmark, spec and size.
+        threshold: The ratio of the seconds of a result to the baseline above which
+            the result is a regression.
+
+    Returns:
+        The lines of the comparison and whether there is any regression.
+
+    """
+    lines = [f"{'benchmark':<60} {'baseline':>10} {'result':>10} {'ratio':>7}"]
+    regression = False
+    for key in sorted(baseline.keys() & results.keys()):
+        benchmark, spec, size = key
+        ratio = results[key] / baseline[key] if baseline[key] else float("inf")
+        flag = ""
+        if ratio > threshold:
+            flag = " regression"
+            regression = True
+        lines.append(
+            f"{f'{benchmark} {spec} {size}':<60} {baseline[key]:>10.6f} "
+            f"{results[key]:>10.6f} {ratio:>7.2f}{flag}"
+        )
+    return lines, regression
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """Compare results from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("results")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    lines, regression = compare(
+        baseline=_load(args.baseline),
+        results=_load(args.results),
+        threshold=args.threshold,
+    )
+    print("\n".join(lines))
+    return 1 if regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+"""Generate specifications of any size that OpenAlchemy can construct models for.
+
+Usage, from the root of the repository:
+
+    python -m benchmarks.generator --models 1000 --one-to-many 2 --output spec.yaml
+
+The specification is written as YAML unless the output ends with .json.
+"""
+
+import argparse
+import dataclasses
+import json
+import sys
+import typing
+
+import yaml
+
+Schema = typing.Dict[str, typing.Any]
+
+# The schemas of the non-relationship properties, used in turn for the properties
+# of a model
+PROPERTY_SCHEMAS: typing.Tuple[Schema, ...] = (
+    {"type": "string", "maxLength": 255},
+    {"type": "integer"},
+    {"type": "number"},
+    {"type": "boolean"},
+    {"type": "string", "format": "date-time"},
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    """The shape of a generated specification."""
+
+    # The number of models
+    models: int
+    # The number of properties of each model that are not relationships or the id
+    properties: int = 5
+    # The number of schemas each model inherits its id through using allOf
+    all_of_depth: int = 0
+    # The number of schemas the properties of a model reference in turn before
+    # reaching the schema of the property
+    ref_chain: int = 0
+    # The number of one to many relationships of each model to the models after it
+    one_to_many: int = 0
+    # The number of many to many relationships of each model to the models after it
+    many_to_many: int = 0
+    # Whether the relationships have a back reference
+    backrefs: bool = False
+    # The number of composite indexes of each model
+    composite_indexes: int = 0
+    # Whether to add a path per model that references it
+    paths: bool = False
+
+    def __post_init__(self) -> None:
+        """Raise ValueError if the configuration cannot be generated."""
+        for field in dataclasses.fields(self):
+            value = getattr(self, field.name)
+            if field.type is int and value < 0:
+                raise ValueError(f"{field.name} must not be negative, got {value}.")
+        if self.composite_indexes and self.properties < 2:
+            raise ValueError("composite indexes require at least 2 properties.")
+
+
+def _model_name(index: int) -> str:
+    """Calculate the name of the schema of a model."""
+    return f"Model{index}"
+
+
+def _tablename(index: int) -> str:
+    """Calculate the name of the table of a model."""
+    return f"model_{index}"
+
+
+def _ref(name: str) -> Schema:
+    """Create a reference to a schema."""
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def _properties(*, index: int, config: Config, schemas: Schema) -> Schema:
+    """
+    Generate the properties of a model that are not relationships or the id.
+
+    Any schemas of a $ref chain are added to schemas.
+
+    """
+    properties = {}
+    for prop in range(config.properties):
+        prop_schema = dict(PROPERTY_SCHEMAS[prop % len(PROPERTY_SCHEMAS)])
+        if config.ref_chain:
+            # Model0Property0Ref0 -> Model0Property0Ref1 -> ... -> the schema
+            chain = [
+                f"{_model_name(index)}Property{prop}Ref{link}"
+                for link in range(config.ref_chain)
+            ]
+            for link, next_link in zip(chain, chain[1:]):
+                schemas[link] = _ref(next_link)
+            schemas[chain[-1]] = prop_schema
+            prop_schema = _ref(chain[0])
+        properties[f"property_{prop}"] = prop_schema
+    return properties
+
+
+def _relationships(*, index: int, config: Config) -> Schema:
+    """
+    Generate the relationships of a model.
+
+    Relationships only reference the models after the model so that the foreign keys
+    of the tables do not form a cycle.
+
+    """
+    relationships: Schema = {}
+    kinds = (("one_to_many", config.one_to_many), ("many_to_many", config.many_to_many))
+    for kind, count in kinds:
+        targets = range(index + 1, min(index + 1 + count, config.models))
+        for target in targets:
+            name = f"{kind}_{target}"
+            items: Schema = _ref(_model_name(target))
+            extensions: Schema = {}
+            if config.backrefs:
+                extensions["x-backref"] = f"{kind}_backref_{index}"
+            if kind == "many_to_many":
+                extensions["x-secondary"] = f"{_tablename(index)}_{_tablename(target)}"
+            if extensions:
+                items = {"allOf": [items, extensions]}
+            relationships[name] = {"type": "array", "items": items}
+    return relationships
+
+
+def _composite_indexes(*, index: int, config: Config) -> typing.List[Schema]:
+    """Generate named composite indexes over pairs of the properties of a model."""
+    return [
+        {
+            "name": f"ix_{_tablename(index)}_{composite}",
+            "expressions": [
+                f"property_{composite % config.properties}",
+                f"property_{(composite + 1) % config.properties}",
+            ],
+        }
+        for composite in range(config.composite_indexes)
+    ]
+
+
+def _path(index: int) -> Schema:
+    """Generate a path that lists the instances of a model."""
+    return {
+        "get": {
+            "summary": f"List {_model_name(index)}.",
+            "responses": {
+                "200": {
+                    "description": "OK",
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "array",
+                                "items": _ref(_model_name(index)),
+                            }
+                        }
+                    },
+                }
+            },
+        }
+    }
+
+
+def generate(config: Config) -> Schema:
+    """
+    Generate a specification.
+
+    Args:
+        config: The shape of the specification.
+
+    Returns:
+        The specification.
+
+    """
+    schemas: Schema = {}
+    paths: Schema = {}
+    for index in range(config.models):
+        name = _model_name(index)
+        id_schema: Schema = {
+            "type": "object",
+            "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        }
+        model: Schema = {
+            "type": "object",
+            "x-tablename": _tablename(index),
+            "properties": {
+                **_properties(index=index, config=config, schemas=schemas),
+                **_relationships(index=index, config=config),
+            },
+        }
+        if config.composite_indexes:
+            model["x-composite-index"] = _composite_indexes(index=index, config=config)
+
+        if config.all_of_depth:
+            # Model0Base0 defines the id and Model0Base<n> inherits from Model0Base<n-1>
+            bases = [f"{name}Base{depth}" for depth in range(config.all_of_depth)]
+            schemas[bases[0]] = id_schema
+            for base, next_base in zip(bases, bases[1:]):
+                schemas[next_base] = {"allOf": [_ref(base), {"type": "object"}]}
+            # define_all only defines the schemas with a top level x-tablename
+            model = {
+                "allOf": [_ref(bases[-1]), model],
+                "x-tablename": model["x-tablename"],
+            }
+        else:
+            model["properties"] = {**id_schema["properties"], **model["properties"]}
+        schemas[name] = model
+
+        if config.paths:
+            paths[f"/model-{index}"] = _path(index)
+
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Generated", "version": "1"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> None:
+    """Generate a specification from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    for field in dataclasses.fields(Config):
+        option = f"--{field.name.replace('_', '-')}"
+        if field.type is bool:
+            parser.add_argument(option, action="store_true")
+        elif field.default is dataclasses.MISSING:
+            parser.add_argument(option, type=int, required=True)
+        else:
+            parser.add_argument(option, type=int, default=field.default)
+    parser.add_argument("--output", help="The file to write the specification to.")
+    args = parser.parse_args(argv)
+
+    spec = generate(
+        Config(
+            **{
+                field.name: getattr(args, field.name)
+                for field in dataclasses.fields(Config)
+            }
+        )
+    )
+    if args.output is None:
+        yaml.dump(spec, sys.stdout, sort_keys=False)
+        return
+    with open(args.output, "w") as out_file:
+        if args.output.endswith(".json"):
+            json.dump(spec, out_file)
+        else:
+            yaml.dump(
+                spec,
+                out_file,
+                Dumper=getattr(yaml, "CSafeDumper", yaml.Dumper),
+                sort_keys=False,
+            )
+
+
+if __name__ == "__main__":
+    main()
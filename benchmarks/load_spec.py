@@ -0,0 +1,82 @@
+"""Compare the time to load a large specification using the available loaders.
+
+Usage, from the root of the repository:
+
+    python -m benchmarks.load_spec --models 2000 --repeat 3
+
+The results are printed as JSON.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import typing
+
+import yaml
+
+from open_alchemy import loader
+
+from . import generator
+
+
+def _time(func: typing.Callable[[], typing.Any], *, repeat: int) -> float:
+    """Return the fastest time in seconds to call a function."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=1000)
+    parser.add_argument("--properties", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    spec = generator.generate(
+        generator.Config(models=args.models, properties=args.properties, paths=True)
+    )
+    results: typing.Dict[str, typing.Any] = {
+        "models": args.models,
+        "properties": args.properties,
+        "libyaml": yaml.__with_libyaml__,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        yaml_filename = os.path.join(directory, "spec.yaml")
+        with open(yaml_filename, "w") as out_file:
+            yaml.dump(spec, out_file, Dumper=getattr(yaml, "CSafeDumper", yaml.Dumper))
+        json_filename = os.path.join(directory, "spec.json")
+        with open(json_filename, "w") as out_file:
+            json.dump(spec, out_file)
+        results["yaml_bytes"] = os.path.getsize(yaml_filename)
+
+        def load_safe_loader() -> None:
+            with open(yaml_filename) as in_file:
+                yaml.load(in_file, Loader=yaml.SafeLoader)
+
+        timings = {
+            "yaml SafeLoader": load_safe_loader,
+            "yaml fastest loader": lambda: loader.load_yaml(yaml_filename),
+            "yaml fastest loader schemas only": lambda: loader.load_yaml(
+                yaml_filename, schemas_only=True
+            ),
+            "json": lambda: loader.load_json(json_filename),
+            "json schemas only": lambda: loader.load_json(
+                json_filename, schemas_only=True
+            ),
+        }
+        results["seconds"] = {
+            name: _time(func, repeat=args.repeat) for name, func in timings.items()
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
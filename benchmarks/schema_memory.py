@@ -0,0 +1,77 @@
+"""Measure the memory used by the schemas recorded on the models.
+
+Usage, from the root of the repository:
+
+    python -m benchmarks.schema_memory --models 1000 --per-model
+
+The results are printed as JSON. The unshared size of a schema is the size of a
+copy of the schema that does not share any values with other schemas, which is how
+the schemas were stored before they were interned. The shared size includes the
+entries of the table used to find the values to share, as if the table only had the
+values of the measured schemas.
+"""
+
+import argparse
+import dataclasses
+import json
+import typing
+
+from open_alchemy import helpers
+
+from . import generator
+from . import suite
+
+
+def measure(*, models: typing.Sequence[typing.Type]) -> typing.Dict[str, typing.Any]:
+    """
+    Measure the memory used by the schemas of models.
+
+    Args:
+        models: The models.
+
+    Returns:
+        The unshared and the shared size of the schemas, the size of the entries of
+        the schemas in the table of interned values, which is included in the shared
+        size, and the unshared and
+        the shared size of the schema of each model by name. The shared size of a
+        model only includes the values not shared with any of the models before it.
+
+    """
+    seen: typing.Set[int] = set()
+    schemas = []
+    per_model = {}
+    for model in models:
+        schema = model._schema  # pylint: disable=protected-access
+        schemas.append(schema)
+        per_model[model.__name__] = {
+            "unshared": helpers.intern.size_of(json.loads(json.dumps(schema))),
+            "shared": helpers.intern.size_of(schema, seen=seen),
+        }
+    intern_table = helpers.intern.table_size(schemas=schemas, seen=seen)
+    return {
+        "unshared_bytes": sum(size["unshared"] for size in per_model.values()),
+        "shared_bytes": (
+            sum(size["shared"] for size in per_model.values()) + intern_table
+        ),
+        "intern_table_bytes": intern_table,
+        "per_model": per_model,
+    }
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> None:
+    """Run the measurement from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=1000)
+    parser.add_argument("--per-model", action="store_true")
+    args = parser.parse_args(argv)
+
+    spec = generator.generate(dataclasses.replace(suite.GENERATED, models=args.models))
+    sizes = measure(models=suite.get_models(suite.define_all(spec)))
+    if not args.per_model:
+        del sizes["per_model"]
+    results: typing.Dict[str, typing.Any] = {"models": args.models, **sizes}
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Specifications used by the benchmarks."""
+
+import glob
+import os
+import typing
+
+import yaml
+
+EXAMPLES_DIRECTORY = os.path.join(os.path.dirname(__file__), "..", "examples")
+
+
+def synthetic(*, size: int, properties: int = 5) -> typing.Dict[str, typing.Any]:
+    """
+    Generate a specification with a one to many relationship per pair of models.
+
+    Args:
+        size: The number of Parent and Child model pairs.
+        properties: The number of string properties per model.
+
+    Returns:
+        The specification.
+
+    """
+    schemas: typing.Dict[str, typing.Any] = {}
+    for index in range(size):
+        string_properties = {
+            f"property_{prop}": {"type": "string", "maxLength": 32}
+            for prop in range(properties)
+        }
+        schemas[f"Child{index}"] = {
+            "type": "object",
+            "x-tablename": f"child_{index}",
+            "properties": {
+                "id": {"type": "integer", "x-primary-key": True},
+                **string_properties,
+            },
+        }
+        schemas[f"Parent{index}"] = {
+            "type": "object",
+            "x-tablename": f"parent_{index}",
+            "properties": {
+                "id": {"type": "integer", "x-primary-key": True},
+                **string_properties,
+                "children": {
+                    "type": "array",
+                    "items": {"$ref": f"#/components/schemas/Child{index}"},
+                },
+            },
+        }
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Synthetic", "version": "1"},
+        "paths": {},
+        "components": {"schemas": schemas},
+    }
+
+
+def examples() -> typing.Dict[str, typing.Any]:
+    """
+    Load the example specifications.
+
+    Returns:
+        The specifications by the name of their file.
+
+    """
+    filenames = sorted(glob.glob(os.path.join(EXAMPLES_DIRECTORY, "*-spec.yml")))
+    loaded = {}
+    for filename in filenames:
+        with open(filename) as in_file:
+            loaded[os.path.basename(filename)] = yaml.safe_load(in_file)
+    return loaded
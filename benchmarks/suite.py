@@ -0,0 +1,412 @@
+"""Benchmark loading specifications, constructing models and using the models.
+
+Usage, from the root of the repository:
+
+    python -m benchmarks.suite --sizes 10 100 1000 --output results.json
+
+The results are written as JSON and can be compared using benchmarks.compare.
+"""
+
+import argparse
+import dataclasses
+import datetime
+import itertools
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import types
+import typing
+
+import sqlalchemy
+import yaml
+from sqlalchemy import orm
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import helpers
+
+from . import generator
+from . import specs
+
+# The number of children of each parent for the relationship benchmarks
+CHILDREN = 10
+
+# The shape of the generated specifications, which use every kind of relationship
+GENERATED = generator.Config(
+    models=0,
+    properties=5,
+    all_of_depth=1,
+    ref_chain=1,
+    one_to_many=2,
+    many_to_many=1,
+    backrefs=True,
+    composite_indexes=1,
+)
+
+Setup = typing.Callable[[], typing.Any]
+Run = typing.Callable[[typing.Any], typing.Any]
+
+
+def measure(*, setup: Setup, run: Run, repeat: int) -> float:
+    """
+    Measure the fastest time to run a benchmark.
+
+    Args:
+        setup: Prepares the state for a run which is not included in the time.
+        run: Runs the benchmark with the state returned by setup.
+        repeat: The number of times to run the benchmark.
+
+    Returns:
+        The fastest time in seconds.
+
+    """
+    times = []
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def define_all(
+    spec: typing.Dict[str, typing.Any], *, every_model: bool = False
+) -> types.SimpleNamespace:
+    """
+    Define all the models of a specification in a separate namespace.
+
+    Args:
+        spec: The specification.
+        every_model: Whether to also construct the models that define_all skips
+            because their x-tablename is only defined under allOf.
+
+    Returns:
+        The namespace with the models.
+
+    """
+    namespace = types.SimpleNamespace()
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec=spec,
+        define_all=True,
+        namespace=namespace,
+    )
+    if every_model:
+        schemas = spec["components"]["schemas"]
+        for name, schema in list(schemas.items()):
+            prepared = helpers.prepare_schema(schema=schema, schemas=schemas)
+            tablename = prepared.get("x-tablename")
+            # Schemas may reference a model without defining another model
+            if tablename is not None and tablename not in base.metadata.tables:
+                model_factory(name=name)
+    return namespace
+
+
+def get_models(namespace: types.SimpleNamespace) -> typing.List[typing.Type]:
+    """Get the models defined on a namespace."""
+    return [
+        value
+        for name, value in vars(namespace).items()
+        if name != "Base" and isinstance(value, type)
+    ]
+
+
+def _scalar_value(*, spec: typing.Dict[str, typing.Any], index: int) -> typing.Any:
+    """Generate a value for a property that is not a relationship."""
+    type_ = spec.get("type")
+    if type_ == "integer":
+        return index
+    if type_ == "number":
+        return index + 0.5
+    if type_ == "boolean":
+        return index % 2 == 0
+    if spec.get("format") == "date-time":
+        return datetime.datetime(2020, 1, 1).isoformat()
+    value = f"value {index}"
+    return value[: spec.get("maxLength", len(value))]
+
+
+def scalar_dict(*, model: typing.Type, index: int) -> typing.Dict[str, typing.Any]:
+    """Generate a dictionary for from_dict of a model without any relationships."""
+    return {
+        name: _scalar_value(spec=spec, index=index)
+        for name, spec in model._schema[  # pylint: disable=protected-access
+            "properties"
+        ].items()
+        if not spec.get("readOnly") and spec.get("type") not in ("object", "array")
+    }
+
+
+def example_dict(
+    *, model: typing.Type, namespace: types.SimpleNamespace, index: typing.Iterator[int]
+) -> typing.Dict[str, typing.Any]:
+    """
+    Generate a dictionary for from_dict of a model with any required relationships.
+
+    Args:
+        model: The model.
+        namespace: The namespace with the referenced models.
+        index: Generates unique values for the properties of every dictionary.
+
+    Returns:
+        The dictionary.
+
+    """
+    schema = model._schema  # pylint: disable=protected-access
+    value = scalar_dict(model=model, index=next(index))
+    for name in schema.get("required", []):
+        spec = schema["properties"][name]
+        if spec.get("type") == "object":
+            value[name] = example_dict(
+                model=getattr(namespace, spec["x-de-$ref"]),
+                namespace=namespace,
+                index=index,
+            )
+    return value
+
+
+def _round_trip(
+    *, namespace: types.SimpleNamespace, instances: typing.List[typing.Any]
+) -> None:
+    """Store instances in an in-memory SQLite database and read them back."""
+    engine = sqlalchemy.create_engine("sqlite://")
+    namespace.Base.metadata.create_all(engine)
+    session = orm.sessionmaker(bind=engine)()
+    session.add_all(instances)
+    session.commit()
+    session.expunge_all()
+    for model in {type(instance) for instance in instances}:
+        for instance in session.query(model).all():
+            instance.to_dict()
+    session.close()
+
+
+Result = typing.Dict[str, typing.Any]
+
+
+def _result(*, benchmark: str, spec: str, size: int, seconds: float) -> Result:
+    """Create a result."""
+    return {"benchmark": benchmark, "spec": spec, "size": size, "seconds": seconds}
+
+
+def synthetic_benchmarks(*, size: int, repeat: int) -> typing.List[Result]:
+    """
+    Run the benchmarks for a synthetic specification.
+
+    Args:
+        size: The number of parent and child pairs of the specification.
+        repeat: The number of times to run each benchmark.
+
+    Returns:
+        The results.
+
+    """
+    spec = specs.synthetic(size=size)
+    results = []
+
+    def _record(benchmark: str, setup: Setup, run: Run) -> None:
+        seconds = measure(setup=setup, run=run, repeat=repeat)
+        results.append(
+            _result(benchmark=benchmark, spec="synthetic", size=size, seconds=seconds)
+        )
+
+    with tempfile.TemporaryDirectory() as directory:
+        spec_filename = os.path.join(directory, "spec.yaml")
+        with open(spec_filename, "w") as out_file:
+            yaml.dump(spec, out_file, Dumper=getattr(yaml, "CSafeDumper", yaml.Dumper))
+        _record(
+            "init_yaml",
+            lambda: None,
+            lambda _: open_alchemy.init_yaml(
+                spec_filename,
+                base=declarative.declarative_base(),
+                namespace=types.SimpleNamespace(),
+            ),
+        )
+    _record("define_all", lambda: spec, define_all)
+
+    namespace = define_all(spec)
+    children = [getattr(namespace, f"Child{index}") for index in range(size)]
+    parents = [getattr(namespace, f"Parent{index}") for index in range(size)]
+    child_dicts = [
+        scalar_dict(model=child, index=index) for index, child in enumerate(children)
+    ]
+    parent_dicts = [
+        {
+            **scalar_dict(model=parent, index=index),
+            "children": [
+                scalar_dict(model=children[index], index=index * CHILDREN + child)
+                for child in range(CHILDREN)
+            ],
+        }
+        for index, parent in enumerate(parents)
+    ]
+
+    def _from_dicts(
+        models: typing.List[typing.Type], dicts: typing.List[typing.Dict]
+    ) -> typing.List[typing.Any]:
+        return [model.from_dict(**value) for model, value in zip(models, dicts)]
+
+    _record("from_dict", lambda: None, lambda _: _from_dicts(children, child_dicts))
+    _record(
+        "from_dict_relationships",
+        lambda: None,
+        lambda _: _from_dicts(parents, parent_dicts),
+    )
+    _record(
+        "to_dict",
+        lambda: _from_dicts(children, child_dicts),
+        lambda instances: [instance.to_dict() for instance in instances],
+    )
+    _record(
+        "to_dict_relationships",
+        lambda: _from_dicts(parents, parent_dicts),
+        lambda instances: [instance.to_dict() for instance in instances],
+    )
+    _record(
+        "sqlite_round_trip",
+        lambda: _from_dicts(parents, parent_dicts),
+        lambda instances: _round_trip(namespace=namespace, instances=instances),
+    )
+
+    return results
+
+
+def generated_benchmarks(*, size: int, repeat: int) -> typing.List[Result]:
+    """
+    Run the benchmarks for a generated specification.
+
+    Args:
+        size: The number of models of the specification.
+        repeat: The number of times to run each benchmark.
+
+    Returns:
+        The results.
+
+    """
+    spec = generator.generate(dataclasses.replace(GENERATED, models=size))
+    seconds = measure(setup=lambda: spec, run=define_all, repeat=repeat)
+    return [
+        _result(benchmark="define_all", spec="generated", size=size, seconds=seconds)
+    ]
+
+
+def example_benchmarks(
+    *, name: str, spec: typing.Dict[str, typing.Any], repeat: int
+) -> typing.List[Result]:
+    """
+    Run the benchmarks for an example specification.
+
+    Args:
+        name: The name of the example.
+        spec: The example specification.
+        repeat: The number of times to run each benchmark.
+
+    Returns:
+        The results.
+
+    """
+    namespace = define_all(spec, every_model=True)
+    models = get_models(namespace)
+    size = len(models)
+    index = itertools.count(1)
+    dicts = [
+        example_dict(model=model, namespace=namespace, index=index) for model in models
+    ]
+
+    def _from_dicts(_: typing.Any = None) -> typing.List[typing.Any]:
+        return [model.from_dict(**value) for model, value in zip(models, dicts)]
+
+    benchmarks: typing.List[typing.Tuple[str, Setup, Run]] = [
+        ("define_all", lambda: spec, define_all),
+        ("from_dict", lambda: None, _from_dicts),
+        (
+            "to_dict",
+            _from_dicts,
+            lambda instances: [instance.to_dict() for instance in instances],
+        ),
+        (
+            "sqlite_round_trip",
+            _from_dicts,
+            lambda instances: _round_trip(namespace=namespace, instances=instances),
+        ),
+    ]
+    return [
+        _result(
+            benchmark=benchmark,
+            spec=name,
+            size=size,
+            seconds=measure(setup=setup, run=run, repeat=repeat),
+        )
+        for benchmark, setup, run in benchmarks
+    ]
+
+
+def _version() -> typing.Optional[str]:
+    """Get the version of OpenAlchemy if it is installed."""
+    try:
+        # pylint: disable=import-outside-toplevel
+        from importlib import metadata
+
+        return metadata.version("OpenAlchemy")
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def run(
+    *, sizes: typing.Sequence[int], repeat: int, examples: bool = True
+) -> typing.Dict[str, typing.Any]:
+    """
+    Run all the benchmarks.
+
+    Args:
+        sizes: The sizes of the synthetic specifications.
+        repeat: The number of times to run each benchmark.
+        examples: Whether to run the benchmarks for the example specifications.
+
+    Returns:
+        The environment and the results of the benchmarks.
+
+    """
+    results = []
+    for size in sizes:
+        results.extend(synthetic_benchmarks(size=size, repeat=repeat))
+        results.extend(generated_benchmarks(size=size, repeat=repeat))
+    if examples:
+        for name, spec in specs.examples().items():
+            results.extend(example_benchmarks(name=name, spec=spec, repeat=repeat))
+    return {
+        "environment": {
+            "open_alchemy": _version(),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> None:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-examples", action="store_true")
+    parser.add_argument("--output", help="The file to write the results to.")
+    args = parser.parse_args(argv)
+
+    report = run(sizes=args.sizes, repeat=args.repeat, examples=not args.no_examples)
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    with open(args.output, "w") as out_file:
+        json.dump(report, out_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
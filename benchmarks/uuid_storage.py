@@ -0,0 +1,154 @@
+"""Measure the storage used by uuid keys in SQLite.
+
+Usage, from the root of the repository:
+
+    python -m benchmarks.uuid_storage --rows 10000
+
+The results are printed as JSON. The keys are stored once as strings of 36
+characters and once with the uuid format, which stores them as 16 bytes. Each child
+references a parent with an indexed foreign key. The sizes are calculated using the
+dbstat virtual table of SQLite.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import types
+import typing
+import uuid
+
+import sqlalchemy
+from sqlalchemy import orm
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+# The number of children of each parent
+CHILDREN = 4
+
+
+def specification(
+    *, key_schema: typing.Dict[str, typing.Any]
+) -> typing.Dict[str, typing.Any]:
+    """
+    Create the specification of parents and children with keys of a schema.
+
+    Args:
+        key_schema: The schema of the primary keys.
+
+    Returns:
+        The specification.
+
+    """
+    return {
+        "components": {
+            "schemas": {
+                "Parent": {
+                    "properties": {"id": {**key_schema, "x-primary-key": True}},
+                    "x-tablename": "parent",
+                    "type": "object",
+                },
+                "Child": {
+                    "properties": {
+                        "id": {**key_schema, "x-primary-key": True},
+                        "parent_id": {
+                            **key_schema,
+                            "x-foreign-key": "parent.id",
+                            "x-index": True,
+                        },
+                    },
+                    "x-tablename": "child",
+                    "type": "object",
+                },
+            }
+        }
+    }
+
+
+SPECS = {
+    "string": specification(key_schema={"type": "string", "maxLength": 36}),
+    "uuid": specification(key_schema={"type": "string", "format": "uuid"}),
+}
+
+
+def measure(*, spec: typing.Dict[str, typing.Any], rows: int) -> typing.Dict[str, int]:
+    """
+    Measure the storage used by parents and their children in SQLite.
+
+    Args:
+        spec: The specification of the parents and children.
+        rows: The number of parents.
+
+    Returns:
+        The bytes used by the tables, the indexes and the whole database.
+
+    """
+    namespace = types.SimpleNamespace()
+    base = declarative.declarative_base()
+    open_alchemy.init_model_factory(
+        base=base, spec=spec, define_all=True, namespace=namespace
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "uuid_storage.sqlite")
+        engine = sqlalchemy.create_engine(f"sqlite:///{filename}")
+        base.metadata.create_all(engine)
+        session = orm.sessionmaker(bind=engine)()
+        for _ in range(rows):
+            parent_id = str(uuid.uuid4())
+            session.add(namespace.Parent.from_dict(id=parent_id))
+            session.add_all(
+                namespace.Child.from_dict(id=str(uuid.uuid4()), parent_id=parent_id)
+                for _ in range(CHILDREN)
+            )
+        session.commit()
+        session.close()
+
+        with engine.connect() as connection:
+            connection.execute(sqlalchemy.text("VACUUM"))
+            indexes = {
+                name
+                for (name,) in connection.execute(
+                    sqlalchemy.text(
+                        "SELECT name FROM sqlite_master WHERE type = 'index'"
+                    )
+                )
+            }
+            sizes = {
+                name: size
+                for name, size in connection.execute(
+                    sqlalchemy.text(
+                        "SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"
+                    )
+                )
+            }
+        engine.dispose()
+        total = os.path.getsize(filename)
+
+    return {
+        "table_bytes": sizes["parent"] + sizes["child"],
+        "index_bytes": sum(size for name, size in sizes.items() if name in indexes),
+        "total_bytes": total,
+    }
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> None:
+    """Run the measurement from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    results: typing.Dict[str, typing.Any] = {
+        "rows": args.rows,
+        "children": CHILDREN,
+        **{
+            name: measure(spec=spec, rows=args.rows)
+            for name, spec in SPECS.items()
+        },
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
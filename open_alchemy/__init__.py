@@ -2,6 +2,7 @@
 
 import functools
 import sys
+import threading
 import types as py_types
 import typing
 
@@ -11,29 +12,68 @@ from sqlalchemy.ext import declarative
 from open_alchemy import types as oa_types
 
 from . import exceptions
+from . import facades
 from . import helpers as _helpers
+from . import loader as _loader
 from . import model_factory as _model_factory
+from . import compiled_validators as _compiled_validators
+from . import profiling
+from . import shared_artifacts as _shared_artifacts
+from . import watch as _watch
+from .helpers.define_all import check_patterns as _check_patterns
+from .helpers.intern import freeze as freeze_spec
+from .shared_artifacts import SharedArtifacts
+from .validation import validate_spec
 
 models = py_types.ModuleType("models")  # pylint: disable=invalid-name
 sys.modules["open_alchemy.models"] = models
 
 
 def init_model_factory(
-    *, base: typing.Type, spec: oa_types.Schema, define_all: bool = False
+    *,
+    base: typing.Type,
+    spec: oa_types.Schema,
+    define_all: bool = False,
+    include: typing.Optional[oa_types.Patterns] = None,
+    exclude: typing.Optional[oa_types.Patterns] = None,
+    namespace: typing.Any = None,
+    shared_artifacts: typing.Optional[SharedArtifacts] = None,
+    compile_validators: bool = False,
+    collect_all_errors: bool = False,
 ) -> oa_types.ModelFactory:
     """
     Create factory that generates SQLAlchemy models based on OpenAPI specification.
 
     Args:
         base: The declarative base for the models.
-        spec: The OpenAPI specification in the form of a dictionary.
+        spec: The OpenAPI specification in the form of a dictionary. It is not
+            modified, so it may be shared or frozen using freeze_spec.
         define_all: Whether to define all the models during initialization.
+        include: Glob patterns of the names of the schemas to define during
+            initialization. Any model they require is also defined. Requires
+            define_all.
+        exclude: Glob patterns of the names of the schemas not to define during
+            initialization, unless they are required by another defined model.
+            Requires define_all.
+        namespace: The object on which the Base, models and association tables are
+            set. Defaults to open_alchemy.models. Passing a separate namespace, with a
+            separate base, isolates the models from any other models in the process.
+        shared_artifacts: Artifacts of the models shared with model factories for the
+            same specification but with other bases. The checks and calculations that
+            do not depend on the base are only done once for all the bases.
+        compile_validators: Whether to compile the schema of each model into a Python
+            function that from_dict uses to validate dictionaries instead of
+            jsonschema.
+        collect_all_errors: Whether from_dict reports all the ways in which a
+            dictionary does not satisfy the schema of a model instead of only the
+            first.
 
     Returns:
         A factory that returns SQLAlchemy models derived from the base based on the
         OpenAPI specification.
 
     """
+    _check_patterns(define_all=define_all, include=include, exclude=exclude)
     # Retrieving the schema from the specification
     if "components" not in spec:
         raise exceptions.MalformedSpecificationError(
@@ -47,24 +87,62 @@ def init_model_factory(
     schemas = components.get("schemas", {})
 
     # Binding the base and schemas
-    bound_model_factories = functools.partial(
-        _model_factory.model_factory, schemas=schemas, base=base
-    )
-    # Caching calls
-    cached_model_factories = functools.lru_cache(maxsize=None)(bound_model_factories)
+    if shared_artifacts is None:
+        # Foreign keys required by the models replace the schemas they are added to in
+        # a copy of the schemas so that the specification is not modified
+        bound_model_factories = functools.partial(
+            _model_factory.model_factory, schemas=dict(schemas), base=base
+        )
+    else:
+        bound_model_factories = functools.partial(
+            _shared_artifacts.model_factory,
+            schemas=schemas,
+            base=base,
+            shared_artifacts=shared_artifacts,
+        )
+    # Caching calls. Constructing a model modifies the schemas and the metadata of the
+    # base, so construction is serialized and every model is only constructed once.
+    constructed_models: typing.Dict[str, typing.Type] = {}
+    lock = threading.RLock()
+
+    if namespace is None:
+        namespace = models
 
     # Making Base importable
-    setattr(models, "Base", base)
+    setattr(namespace, "Base", base)
 
     # Intercepting factory calls to make models available
     def _register_model(*, name: str) -> typing.Type:
         """Intercept calls to model factory and register model on models."""
-        model = cached_model_factories(name=name)
-        setattr(models, name, model)
+        model = constructed_models.get(name)
+        if model is not None:
+            return model
+
+        with lock:
+            # Another thread may have constructed the model while waiting for the lock
+            model = constructed_models.get(name)
+            if model is None:
+                with profiling.record_model(name=name):
+                    with facades.models.bind(models=namespace):
+                        model = bound_model_factories(name=name)
+                    # pylint: disable=protected-access
+                    if compile_validators:
+                        validate = _compiled_validators.compile_validator(model._schema)
+                        if validate is not None:
+                            model._validate = staticmethod(validate)
+                    if collect_all_errors:
+                        model._collect_all_errors = True
+                setattr(namespace, name, model)
+                constructed_models[name] = model
         return model
 
     if define_all:
-        _helpers.define_all(model_factory=_register_model, schemas=schemas)
+        _helpers.define_all(
+            model_factory=_register_model,
+            schemas=schemas,
+            include=include,
+            exclude=exclude,
+        )
 
     return _register_model
 
@@ -73,12 +151,62 @@ BaseAndModelFactory = typing.Tuple[typing.Type, oa_types.ModelFactory]
 
 
 def _init_optional_base(
-    *, base: typing.Optional[typing.Type], spec: oa_types.Schema, define_all: bool
+    *,
+    base: typing.Optional[typing.Type],
+    spec: oa_types.Schema,
+    define_all: bool,
+    include: typing.Optional[oa_types.Patterns] = None,
+    exclude: typing.Optional[oa_types.Patterns] = None,
+    namespace: typing.Any = None,
+    compile_validators: bool = False,
+    collect_all_errors: bool = False,
 ) -> BaseAndModelFactory:
     """Wrap init_model_factory with optional base."""
     if base is None:
         base = declarative.declarative_base()
-    return base, init_model_factory(base=base, spec=spec, define_all=define_all)
+    return (
+        base,
+        init_model_factory(
+            base=base,
+            spec=spec,
+            define_all=define_all,
+            include=include,
+            exclude=exclude,
+            namespace=namespace,
+            compile_validators=compile_validators,
+            collect_all_errors=collect_all_errors,
+        ),
+    )
+
+
+def _init_watcher(
+    spec_filename: str,
+    *,
+    load: _watch.Load,
+    base: typing.Optional[typing.Type],
+    define_all: bool,
+    include: typing.Optional[oa_types.Patterns],
+    exclude: typing.Optional[oa_types.Patterns],
+    namespace: typing.Any,
+    interval: float,
+    compile_validators: bool,
+    collect_all_errors: bool,
+) -> BaseAndModelFactory:
+    """Construct the models of a file and rebuild them when it changes."""
+    watcher = _watch.Watcher(
+        spec_filename,
+        load=load,
+        base=base,
+        define_all=define_all,
+        include=include,
+        exclude=exclude,
+        namespace=namespace,
+        interval=interval,
+        compile_validators=compile_validators,
+        collect_all_errors=collect_all_errors,
+    )
+    watcher.start()
+    return watcher.base, watcher
 
 
 def init_json(
@@ -86,6 +214,14 @@ def init_json(
     *,
     base: typing.Optional[typing.Type] = None,
     define_all: bool = True,
+    include: typing.Optional[oa_types.Patterns] = None,
+    exclude: typing.Optional[oa_types.Patterns] = None,
+    namespace: typing.Any = None,
+    schemas_only: bool = False,
+    watch: bool = False,
+    watch_interval: float = 1.0,
+    compile_validators: bool = False,
+    collect_all_errors: bool = False,
 ) -> BaseAndModelFactory:
     """
     Create SQLAlchemy models factory based on an OpenAPI specification as a JSON file.
@@ -93,6 +229,22 @@ def init_json(
     Args:
         spec_filename: filename of an OpenAPI spec in JSON format
         base: The declarative base for the models.
+        define_all: (optional) Whether to define all the models during initialization.
+        include: (optional) Glob patterns of the names of the schemas to define.
+        exclude: (optional) Glob patterns of the names of the schemas not to define.
+        namespace: (optional) The object on which the Base and models are set.
+            Defaults to open_alchemy.models.
+        schemas_only: (optional) Whether to only load components.schemas from the
+            file, skipping the paths and any other parts of the specification.
+        watch: (optional) Whether to rebuild the models affected by changes to the
+            file in a background thread, which is meant for development. The
+            model factory is then an open_alchemy.watch.Watcher.
+        watch_interval: (optional) The number of seconds between checks for changes.
+        compile_validators: (optional) Whether to compile the schema of each model
+            into a Python function that from_dict uses instead of jsonschema.
+        collect_all_errors: (optional) Whether from_dict reports all the ways in which
+            a dictionary does not satisfy the schema of a model instead of only the
+            first.
 
     Returns:
         A tuple (Base, model_factory), where:
@@ -103,14 +255,31 @@ def init_json(
         define_all: (optional) Whether to define all the models during initialization.
 
     """
-    # Most OpenAPI specs are YAML, so, for efficiency, we only import json if we
-    # need it:
-    import json  # pylint: disable=import-outside-toplevel
-
-    with open(spec_filename) as spec_file:
-        spec = json.load(spec_file)
+    load = functools.partial(_loader.load_json, schemas_only=schemas_only)
+    if watch:
+        return _init_watcher(
+            spec_filename,
+            load=load,
+            base=base,
+            define_all=define_all,
+            include=include,
+            exclude=exclude,
+            namespace=namespace,
+            interval=watch_interval,
+            compile_validators=compile_validators,
+            collect_all_errors=collect_all_errors,
+        )
 
-    return _init_optional_base(base=base, spec=spec, define_all=define_all)
+    return _init_optional_base(
+        base=base,
+        spec=load(spec_filename),
+        define_all=define_all,
+        include=include,
+        exclude=exclude,
+        namespace=namespace,
+        compile_validators=compile_validators,
+        collect_all_errors=collect_all_errors,
+    )
 
 
 def init_yaml(
@@ -118,6 +287,14 @@ def init_yaml(
     *,
     base: typing.Optional[typing.Type] = None,
     define_all: bool = True,
+    include: typing.Optional[oa_types.Patterns] = None,
+    exclude: typing.Optional[oa_types.Patterns] = None,
+    namespace: typing.Any = None,
+    schemas_only: bool = False,
+    watch: bool = False,
+    watch_interval: float = 1.0,
+    compile_validators: bool = False,
+    collect_all_errors: bool = False,
 ) -> BaseAndModelFactory:
     """
     Create SQLAlchemy models factory based on an OpenAPI specification as a YAML file.
@@ -129,6 +306,21 @@ def init_yaml(
         base: (optional) The declarative base for the models.
               If base=None, construct a new SQLAlchemy declarative base.
         define_all: (optional) Whether to define all the models during initialization.
+        include: (optional) Glob patterns of the names of the schemas to define.
+        exclude: (optional) Glob patterns of the names of the schemas not to define.
+        namespace: (optional) The object on which the Base and models are set.
+            Defaults to open_alchemy.models.
+        schemas_only: (optional) Whether to only load components.schemas from the
+            file, skipping the paths and any other parts of the specification.
+        watch: (optional) Whether to rebuild the models affected by changes to the
+            file in a background thread, which is meant for development. The
+            model factory is then an open_alchemy.watch.Watcher.
+        watch_interval: (optional) The number of seconds between checks for changes.
+        compile_validators: (optional) Whether to compile the schema of each model
+            into a Python function that from_dict uses instead of jsonschema.
+        collect_all_errors: (optional) Whether from_dict reports all the ways in which
+            a dictionary does not satisfy the schema of a model instead of only the
+            first.
 
     Returns:
         A tuple (Base, model_factory), where:
@@ -140,17 +332,38 @@ def init_yaml(
 
     """
 
-    try:
-        import yaml  # pylint: disable=import-outside-toplevel
-    except ImportError:
-        raise ImportError(
-            "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
+    load = functools.partial(_loader.load_yaml, schemas_only=schemas_only)
+    if watch:
+        return _init_watcher(
+            spec_filename,
+            load=load,
+            base=base,
+            define_all=define_all,
+            include=include,
+            exclude=exclude,
+            namespace=namespace,
+            interval=watch_interval,
+            compile_validators=compile_validators,
+            collect_all_errors=collect_all_errors,
         )
 
-    with open(spec_filename) as spec_file:
-        spec = yaml.load(spec_file, Loader=yaml.SafeLoader)
-
-    return _init_optional_base(base=base, spec=spec, define_all=define_all)
+    return _init_optional_base(
+        base=base,
+        spec=load(spec_filename),
+        define_all=define_all,
+        include=include,
+        exclude=exclude,
+        namespace=namespace,
+        compile_validators=compile_validators,
+        collect_all_errors=collect_all_errors,
+    )
 
 
-__all__ = ["init_model_factory", "init_json", "init_yaml"]
+__all__ = [
+    "init_model_factory",
+    "init_json",
+    "init_yaml",
+    "SharedArtifacts",
+    "freeze_spec",
+    "validate_spec",
+]
@@ -0,0 +1,7 @@
+"""Run the command line interface using python -m open_alchemy."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
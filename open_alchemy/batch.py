@@ -0,0 +1,178 @@
+"""Load the relationships and upsert the instances of models in batches."""
+
+import collections
+import typing
+
+import sqlalchemy
+from sqlalchemy import orm
+
+from . import types
+
+# The number of primary keys in a single IN clause, which keeps the number of bound
+# parameters below the limits of the databases
+BATCH_SIZE = 500
+
+# Instances grouped by their model
+Groups = typing.Dict[typing.Type, typing.List[typing.Any]]
+
+
+def _chunks(
+    values: typing.Sequence[typing.Any], *, size: int
+) -> typing.Iterator[typing.Sequence[typing.Any]]:
+    """Split values into chunks of at most size values."""
+    for start in range(0, len(values), size):
+        end = start + size
+        yield values[start:end]
+
+
+def _primary_key_filter(
+    *, mapper: typing.Any, keys: typing.Sequence[typing.Tuple[typing.Any, ...]]
+) -> typing.Any:
+    """Create the filter selecting the rows with the primary keys."""
+    columns = mapper.primary_key
+    if len(columns) == 1:
+        return columns[0].in_([key[0] for key in keys])
+    return sqlalchemy.tuple_(*columns).in_(keys)
+
+
+def _relationship_keys(model: typing.Type) -> typing.List[str]:
+    """Calculate the relationships of a model that to_dict returns."""
+    properties = model._get_properties()  # pylint: disable=protected-access
+    mapper = sqlalchemy.inspect(model)
+    return [
+        relationship.key
+        for relationship in mapper.relationships
+        if relationship.key in properties
+    ]
+
+
+def load_relationships(
+    session: orm.Session,
+    instances: typing.Iterable[typing.Any],
+    *,
+    batch_size: int = BATCH_SIZE,
+) -> None:
+    """
+    Load the relationships that to_dict returns of instances and related instances.
+
+    The instances are grouped by model and every relationship that is not loaded yet
+    is loaded for all instances of a model with one query per batch. The related
+    instances are then loaded in the same way, level by level. The relationships of
+    instances referenced by readOnly properties are not loaded since to_dict only
+    returns some of their columns.
+
+    Args:
+        session: The session of the instances.
+        instances: The instances to load the relationships for.
+        batch_size: The maximum number of instances loaded by a query.
+
+    """
+    visited: typing.Set[int] = set()
+    pending: Groups = collections.defaultdict(list)
+    for instance in instances:
+        if id(instance) not in visited:
+            visited.add(id(instance))
+            pending[type(instance)].append(instance)
+
+    while pending:
+        related: Groups = collections.defaultdict(list)
+        for model, group in pending.items():
+            mapper = sqlalchemy.inspect(model)
+            properties = model._get_properties()  # pylint: disable=protected-access
+            for key in _relationship_keys(model):
+                # Only persistent instances can be loaded from the database
+                states = [
+                    state
+                    for state in map(sqlalchemy.inspect, group)
+                    if key in state.unloaded and state.identity is not None
+                ]
+                for chunk in _chunks(states, size=batch_size):
+                    # The unloaded relationships of the instances in the identity
+                    # map are populated by the query
+                    session.query(model).filter(
+                        _primary_key_filter(
+                            mapper=mapper, keys=[state.identity for state in chunk]
+                        )
+                    ).options(orm.selectinload(getattr(model, key))).all()
+
+                if properties[key].get("readOnly"):
+                    continue
+                for instance in group:
+                    value = getattr(instance, key)
+                    values = value if isinstance(value, list) else [value]
+                    for related_instance in values:
+                        if related_instance is None or id(related_instance) in visited:
+                            continue
+                        visited.add(id(related_instance))
+                        related[type(related_instance)].append(related_instance)
+        pending = related
+
+
+def to_dicts(
+    session: orm.Session,
+    instances: typing.Sequence[typing.Any],
+    *,
+    batch_size: int = BATCH_SIZE,
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    Convert instances to dictionaries after loading their relationships in batches.
+
+    Args:
+        session: The session of the instances.
+        instances: The instances to convert.
+        batch_size: The maximum number of instances loaded by a query.
+
+    Returns:
+        The dictionaries of the instances.
+
+    """
+    load_relationships(session, instances, batch_size=batch_size)
+    return [instance.to_dict() for instance in instances]
+
+
+def upsert(
+    session: orm.Session,
+    model: typing.Type,
+    dicts: typing.Sequence[types.Schema],
+    *,
+    batch_size: int = BATCH_SIZE,
+) -> typing.List[typing.Any]:
+    """
+    Insert or update instances of a model constructed from dictionaries.
+
+    The existing rows are loaded with one query per batch. The instances of existing
+    rows are merged into the session and the other instances are added to it.
+
+    Args:
+        session: The session to add the instances to.
+        model: The model of the instances.
+        dicts: The dictionaries to construct the instances with using from_dict.
+        batch_size: The maximum number of rows loaded by a query.
+
+    Returns:
+        The instances in the session in the order of the dictionaries.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    instances = [model.from_dict(**model_dict) for model_dict in dicts]
+    keys = [tuple(mapper.primary_key_from_instance(instance)) for instance in instances]
+
+    existing: typing.Set[typing.Tuple[typing.Any, ...]] = set()
+    complete_keys = list({key for key in keys if None not in key})
+    for chunk in _chunks(complete_keys, size=batch_size):
+        existing.update(
+            tuple(mapper.primary_key_from_instance(instance))
+            for instance in session.query(model).filter(
+                _primary_key_filter(mapper=mapper, keys=chunk)
+            )
+        )
+
+    results = []
+    for key, instance in zip(keys, instances):
+        if key in existing:
+            instance = session.merge(instance)
+        else:
+            session.add(instance)
+        results.append(instance)
+    session.flush()
+    return results
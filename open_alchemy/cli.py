@@ -0,0 +1,75 @@
+"""Command line interface of OpenAlchemy.
+
+Usage:
+
+    python -m open_alchemy lint spec.yaml
+    openalchemy lint spec.json --format json
+"""
+
+import argparse
+import dataclasses
+import json
+import sys
+import typing
+
+from . import loader
+from . import validation
+
+
+def _lint(args: argparse.Namespace) -> int:
+    """Lint a specification file and print the errors."""
+    try:
+        spec = loader.load(args.spec_filename, schemas_only=True)
+    except loader.load_errors() as exc:
+        print(f"{args.spec_filename} could not be loaded: {exc}", file=sys.stderr)
+        return 2
+
+    report = validation.lint_spec(spec=spec, max_workers=args.max_workers)
+
+    if args.format == "json":
+        print(
+            json.dumps([dataclasses.asdict(error) for error in report.errors], indent=2)
+        )
+    else:
+        print(report)
+    return 0 if report.valid else 1
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """
+    Run the command line interface.
+
+    Args:
+        argv: The arguments. Defaults to the arguments of the process.
+
+    Returns:
+        The exit code, which is 1 if errors were found and 2 if the specification
+        could not be loaded.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="openalchemy", description=__doc__.splitlines()[0]
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    lint_parser = subparsers.add_parser(
+        "lint",
+        help="Report all the errors in the schemas of a specification at once.",
+    )
+    lint_parser.add_argument(
+        "spec_filename", help="The YAML or, if it ends in .json, JSON specification."
+    )
+    lint_parser.add_argument(
+        "--format", choices=["text", "json"], default="text", help="The output format."
+    )
+    lint_parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="The number of processes. Defaults to the number of CPUs.",
+    )
+    lint_parser.set_defaults(func=_lint)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
@@ -47,7 +47,13 @@ def column_factory(
     # Check type
     type_ = helpers.peek.type_(schema=spec, schemas=schemas)
 
-    if type_ == "object":
+    # Objects and arrays stored in a JSON column and arrays of primitive types are
+    # handled like other columns
+    as_column = helpers.peek.json(schema=spec, schemas=schemas) or (
+        type_ == "array" and _primitive_items(spec=spec, schemas=schemas)
+    )
+
+    if type_ == "object" and not as_column:
         # Handle objects
         return object_ref.handle_object(
             spec=spec,
@@ -57,7 +63,7 @@ def column_factory(
             model_schema=model_schema,
         )
 
-    if type_ == "array":
+    if type_ == "array" and not as_column:
         # Handle arrays
         return array_ref.handle_array(
             spec=spec,
@@ -66,8 +72,21 @@ def column_factory(
             logical_name=logical_name,
         )
 
-    # Handle columns
+    # Handle columns, the database types of enums are named after the column
+    tablename = helpers.get_ext_prop(source=model_schema, name="x-tablename")
     spec, spec_column = column.handle_column(
-        schema=spec, schemas=schemas, required=required
+        schema=spec,
+        schemas=schemas,
+        required=required,
+        enum_name=logical_name if tablename is None else f"{tablename}_{logical_name}",
     )
     return ([(logical_name, spec_column)], spec)
+
+
+def _primitive_items(*, spec: types.Schema, schemas: types.Schemas) -> bool:
+    """Determine whether the items of an array are not objects."""
+    items = helpers.peek.items(schema=spec, schemas=schemas)
+    if items is None:
+        return False
+    items_type = helpers.peek.peek_key(schema=items, schemas=schemas, key="type")
+    return items_type is not None and items_type != "object"
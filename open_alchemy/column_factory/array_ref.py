@@ -8,6 +8,7 @@ import sqlalchemy
 from open_alchemy import exceptions
 from open_alchemy import facades
 from open_alchemy import helpers
+from open_alchemy import profiling
 from open_alchemy import types
 
 from ..utility_base import TOptUtilityBase
@@ -74,7 +75,7 @@ def handle_array(
     # Construct relationship
     relationship_return = (
         logical_name,
-        sqlalchemy.orm.relationship(
+        helpers.relationships.construct(
             obj_artifacts.ref_logical_name,
             backref=obj_artifacts.backref,
             secondary=obj_artifacts.secondary,
@@ -157,6 +158,9 @@ def _set_foreign_key(
         # Construct foreign key
         _, fk_column = column.handle_column(schema=fk_spec)
         setattr(ref_model, fk_logical_name, fk_column)
+        profiling.record_foreign_key(
+            model=ref_model_name, column=fk_logical_name, constructed=True
+        )
         return
 
     # Handle model not constructed
@@ -169,6 +173,9 @@ def _set_foreign_key(
             },
         ]
     }
+    profiling.record_foreign_key(
+        model=ref_model_name, column=fk_logical_name, constructed=False
+    )
 
 
 @dataclasses.dataclass
@@ -3,17 +3,22 @@
 import typing
 
 import sqlalchemy
+from sqlalchemy.dialects import postgresql
 
 from open_alchemy import exceptions
 from open_alchemy import helpers
 from open_alchemy import types
 
+from . import enum_code_type
+from . import uuid_type
+
 
 def handle_column(
     *,
     schema: types.Schema,
     schemas: typing.Optional[types.Schemas] = None,
     required: typing.Optional[bool] = None,
+    enum_name: typing.Optional[str] = None,
 ) -> sqlalchemy.Column:
     """
     Generate column based on OpenAPI schema property.
@@ -24,6 +29,7 @@ def handle_column(
         schema: The schema for the column.
         schemas: Used to resolve any $ref.
         required: Whether the object property is required.
+        enum_name: The name of the database type of a string enum.
 
     Returns:
         The logical name and the SQLAlchemy column based on the schema.
@@ -32,7 +38,15 @@ def handle_column(
     if schemas is None:
         schemas = {}
     schema = helpers.prepare_schema(schema=schema, schemas=schemas)
+    # The items of arrays of primitive types are part of the column
+    items = schema.get("items")
+    if items is not None and not helpers.get_ext_prop(source=schema, name="x-json"):
+        schema = {
+            **schema,
+            "items": helpers.prepare_schema(schema=items, schemas=schemas),
+        }
     column_schema, artifacts = check_schema(schema=schema, required=required)
+    artifacts.enum_name = enum_name
     column = construct_column(artifacts=artifacts)
     return column_schema, column
 
@@ -44,8 +58,8 @@ def check_schema(
     Check schema and transform into consistent schema and get the column artifacts.
 
     Raise TypeMissingError of the type is not in the schema or is not a string.
-    Raise MalformedSchemaError if format, maxLength or nullable are not of the correct
-    type.
+    Raise MalformedSchemaError if format, maxLength, nullable or enum are not of the
+    correct type or if x-enum-code is defined for a schema that is not a string enum.
     Raise MalformedExtensionPropertyError if an extension property is of the wrong
     type.
 
@@ -62,12 +76,19 @@ def check_schema(
     format_ = helpers.peek.format_(schema=schema, schemas={})
     max_length = helpers.peek.max_length(schema=schema, schemas={})
     nullable = helpers.peek.nullable(schema=schema, schemas={})
+    enum = helpers.peek.enum(schema=schema, schemas={})
     primary_key = helpers.get_ext_prop(source=schema, name="x-primary-key")
     autoincrement = helpers.get_ext_prop(source=schema, name="x-autoincrement")
     index = helpers.get_ext_prop(source=schema, name="x-index")
     unique = helpers.get_ext_prop(source=schema, name="x-unique")
     foreign_key = helpers.get_ext_prop(source=schema, name="x-foreign-key")
     dict_ignore = helpers.get_ext_prop(source=schema, name="x-dict-ignore")
+    json = helpers.get_ext_prop(source=schema, name="x-json")
+    enum_code = helpers.get_ext_prop(source=schema, name="x-enum-code")
+    if enum_code and (type_ != "string" or enum is None):
+        raise exceptions.MalformedSchemaError(
+            "The x-enum-code property is only supported for strings with an enum."
+        )
 
     # Construct schema to return
     return_schema: types.ColumnSchema = {"type": type_}
@@ -77,8 +98,24 @@ def check_schema(
         return_schema["maxLength"] = max_length
     if nullable is not None:
         return_schema["nullable"] = nullable
+    if enum is not None:
+        return_schema["enum"] = enum
     if dict_ignore is not None:
         return_schema["x-dict-ignore"] = dict_ignore
+    if json:
+        return_schema["x-json"] = json
+    if enum_code:
+        return_schema["x-enum-code"] = enum_code
+
+    # Check the items of arrays that are not stored as JSON
+    items_artifacts: typing.Optional[types.ColumnArtifacts] = None
+    if type_ == "array" and not json:
+        items = schema.get("items")
+        if items is None:
+            raise exceptions.MalformedSchemaError(
+                "An array property must include items property."
+            )
+        return_schema["items"], items_artifacts = check_schema(schema=items)
 
     # Construct return artifacts
     nullable_artefact = _calculate_nullable(nullable=nullable, required=required)
@@ -87,11 +124,15 @@ def check_schema(
         format=format_,
         max_length=max_length,
         nullable=nullable_artefact,
+        enum=enum,
         primary_key=primary_key,
         autoincrement=autoincrement,
         index=index,
         unique=unique,
         foreign_key=foreign_key,
+        json=json,
+        enum_code=enum_code,
+        items=items_artifacts,
     )
 
     return return_schema, return_artifacts
@@ -179,7 +220,9 @@ def _determine_type(
     """
     # Determining the type
     type_: typing.Optional[sqlalchemy.sql.type_api.TypeEngine] = None
-    if artifacts.type == "integer":
+    if artifacts.json:
+        type_ = _handle_json(artifacts=artifacts)
+    elif artifacts.type == "integer":
         type_ = _handle_integer(artifacts=artifacts)
     elif artifacts.type == "number":
         type_ = _handle_number(artifacts=artifacts)
@@ -187,6 +230,8 @@ def _determine_type(
         type_ = _handle_string(artifacts=artifacts)
     elif artifacts.type == "boolean":
         type_ = _handle_boolean(artifacts=artifacts)
+    elif artifacts.type == "array":
+        type_ = _handle_array(artifacts=artifacts)
 
     if type_ is None:
         raise exceptions.FeatureNotImplementedError(
@@ -272,17 +317,52 @@ def _handle_string(*, artifacts: types.ColumnArtifacts) -> sqlalchemy.String:
         raise exceptions.MalformedSchemaError(
             "The string type does not support autoincrement."
         )
+    if artifacts.enum is not None:
+        return _handle_enum(artifacts=artifacts)
     if artifacts.format is None:
         if artifacts.max_length is None:
             return sqlalchemy.String
         return sqlalchemy.String(length=artifacts.max_length)
     if artifacts.format == "date-time":
         return sqlalchemy.DateTime
+    if artifacts.format == "uuid":
+        return uuid_type.UUID()
     raise exceptions.FeatureNotImplementedError(
         f"{artifacts.format} format for string is not supported."
     )
 
 
+def _handle_enum(
+    *, artifacts: types.ColumnArtifacts
+) -> sqlalchemy.sql.type_api.TypeEngine:
+    """
+    Handle artifacts for a string with an enum.
+
+    Raises MalformedSchemaError if a value of the enum is not a string.
+    Raise FeatureNotImplementedError if a format is defined.
+
+    Args:
+        artifacts: The artifacts for the column.
+
+    Returns:
+        The SQLAlchemy Enum type of the column, which is a native enum on PostgreSQL,
+        or small integer codes if x-enum-code is defined.
+
+    """
+    values = artifacts.enum or []
+    if not all(isinstance(value, str) for value in values):
+        raise exceptions.MalformedSchemaError(
+            "The values of the enum of a string must be strings."
+        )
+    if artifacts.format is not None:
+        raise exceptions.FeatureNotImplementedError(
+            "Enums with a format are not supported."
+        )
+    if artifacts.enum_code:
+        return enum_code_type.EnumCode(values)
+    return sqlalchemy.Enum(*values, name=artifacts.enum_name)
+
+
 def _handle_boolean(*, artifacts: types.ColumnArtifacts) -> sqlalchemy.Boolean:
     """
     Handle artifacts for an boolean type.
@@ -309,3 +389,82 @@ def _handle_boolean(*, artifacts: types.ColumnArtifacts) -> sqlalchemy.Boolean:
             "The boolean type does not support a maximum length."
         )
     return sqlalchemy.Boolean
+
+
+def _handle_json(
+    *, artifacts: types.ColumnArtifacts
+) -> sqlalchemy.sql.type_api.TypeEngine:
+    """
+    Handle artifacts for a property stored in a JSON column.
+
+    Raises MalformedSchemaError if format, autoincrement or max length is defined.
+
+    Args:
+        artifacts: The artifacts for the column.
+
+    Returns:
+        The SQLAlchemy JSON type of the column, which is JSONB on PostgreSQL.
+
+    """
+    if artifacts.format is not None:
+        raise exceptions.MalformedSchemaError(
+            "The JSON column does not support format."
+        )
+    if artifacts.autoincrement is not None:
+        raise exceptions.MalformedSchemaError(
+            "The JSON column does not support autoincrement."
+        )
+    if artifacts.max_length is not None:
+        raise exceptions.MalformedSchemaError(
+            "The JSON column does not support a maximum length."
+        )
+    return sqlalchemy.JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+
+def _handle_array(
+    *, artifacts: types.ColumnArtifacts
+) -> sqlalchemy.sql.type_api.TypeEngine:
+    """
+    Handle artifacts for an array of primitive types.
+
+    Raises MalformedSchemaError if format, autoincrement or max length is defined or
+    if the items are not defined.
+    Raise FeatureNotImplementedError if the items are arrays, objects, enums or have
+    the date-time or uuid format.
+
+    Args:
+        artifacts: The artifacts for the column.
+
+    Returns:
+        The SQLAlchemy type of the column, which is ARRAY on PostgreSQL and JSON on
+        other databases.
+
+    """
+    if artifacts.format is not None:
+        raise exceptions.MalformedSchemaError("The array type does not support format.")
+    if artifacts.autoincrement is not None:
+        raise exceptions.MalformedSchemaError(
+            "The array type does not support autoincrement."
+        )
+    if artifacts.max_length is not None:
+        raise exceptions.MalformedSchemaError(
+            "The array type does not support a maximum length."
+        )
+    if artifacts.items is None:
+        raise exceptions.MalformedSchemaError(
+            "An array property must include items property."
+        )
+    if artifacts.items.type in {"array", "object"}:
+        raise exceptions.FeatureNotImplementedError(
+            "Arrays of arrays or objects can only be stored with x-json."
+        )
+    if artifacts.items.enum is not None:
+        raise exceptions.FeatureNotImplementedError(
+            "Arrays of enums can only be stored with x-json."
+        )
+    if artifacts.items.format in {"date-time", "uuid"}:
+        raise exceptions.FeatureNotImplementedError(
+            f"Arrays of the {artifacts.items.format} format are not supported."
+        )
+    items_type = _determine_type(artifacts=artifacts.items)
+    return sqlalchemy.JSON().with_variant(postgresql.ARRAY(items_type), "postgresql")
@@ -0,0 +1,55 @@
+"""Column type for string enums stored as small integer codes."""
+
+import typing
+
+import sqlalchemy
+
+
+class EnumCode(sqlalchemy.types.TypeDecorator):  # pylint: disable=abstract-method
+    """
+    Store the values of a string enum as their positions in the enum.
+
+    The mappings between the values and the codes are calculated once when the type
+    is constructed. Values can only be added to the end of the enum without changing
+    the meaning of the codes already stored.
+
+    """
+
+    impl = sqlalchemy.types.SmallInteger
+    cache_ok = True
+
+    def __init__(self, values: typing.Sequence[str]) -> None:
+        """
+        Construct the type.
+
+        Args:
+            values: The values of the enum.
+
+        """
+        super().__init__()
+        self.values = tuple(values)
+        self._codes = {value: code for code, value in enumerate(self.values)}
+
+    @property
+    def python_type(self) -> typing.Type[str]:
+        """The Python type of the values."""
+        return str
+
+    def process_bind_param(
+        self, value: typing.Optional[str], dialect: typing.Any
+    ) -> typing.Optional[int]:
+        """Convert a value to its code."""
+        if value is None:
+            return None
+        code = self._codes.get(value)
+        if code is None:
+            raise ValueError(f"{value!r} is not one of {self.values!r}.")
+        return code
+
+    def process_result_value(
+        self, value: typing.Optional[int], dialect: typing.Any
+    ) -> typing.Optional[str]:
+        """Convert a code to its value."""
+        if value is None:
+            return None
+        return self.values[value]
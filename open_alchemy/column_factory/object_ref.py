@@ -78,7 +78,7 @@ def handle_object(
     return_value.append(
         (
             logical_name,
-            sqlalchemy.orm.relationship(
+            helpers.relationships.construct(
                 obj_artifacts.ref_logical_name, backref=backref
             ),
         )
@@ -286,7 +286,12 @@ def handle_object_reference(
             f"Referenced object {fk_logical_name} property does not have a type."
         )
 
-    return {"type": fk_type, "x-foreign-key": f"{tablename}.{fk_logical_name}"}
+    return_spec = {"type": fk_type, "x-foreign-key": f"{tablename}.{fk_logical_name}"}
+    # The format determines the type of the column, for example for uuid
+    fk_format = prepared_fk_spec.get("format")
+    if fk_format is not None:
+        return_spec["format"] = fk_format
+    return return_spec
 
 
 def check_foreign_key_required(
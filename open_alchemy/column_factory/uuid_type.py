@@ -0,0 +1,57 @@
+"""Column type for the uuid format."""
+
+import typing
+import uuid
+
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+
+
+class UUID(sqlalchemy.types.TypeDecorator):  # pylint: disable=abstract-method
+    """
+    Store UUIDs natively on PostgreSQL and as 16 bytes on other databases.
+
+    Values are bound as uuid.UUID or as their string representation and are always
+    returned as uuid.UUID.
+
+    """
+
+    impl = sqlalchemy.types.BINARY
+    cache_ok = True
+
+    def __init__(self) -> None:
+        """Construct the type with the length of the binary representation."""
+        super().__init__(length=16)
+
+    @property
+    def python_type(self) -> typing.Type[uuid.UUID]:
+        """The Python type of the values."""
+        return uuid.UUID
+
+    def load_dialect_impl(self, dialect: typing.Any) -> typing.Any:
+        """Use the native type on PostgreSQL."""
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(sqlalchemy.types.BINARY(16))
+
+    def process_bind_param(
+        self, value: typing.Optional[typing.Union[uuid.UUID, str]], dialect: typing.Any
+    ) -> typing.Optional[typing.Union[uuid.UUID, bytes]]:
+        """Convert a value to the representation of the database."""
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(value)
+        if dialect.name == "postgresql":
+            return value
+        return value.bytes
+
+    def process_result_value(
+        self,
+        value: typing.Optional[typing.Union[uuid.UUID, bytes]],
+        dialect: typing.Any,
+    ) -> typing.Optional[uuid.UUID]:
+        """Convert a value of the database to uuid.UUID."""
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(bytes=bytes(value))
@@ -0,0 +1,246 @@
+"""Compile the schemas recorded on models into Python validation functions.
+
+The compiled functions make the same decisions as jsonschema.validate, which
+from_dict uses otherwise, for the keywords OpenAlchemy records on the models. Like
+jsonschema.validate, they do not check format and ignore the nullable and readOnly
+properties and any extension property. Objects with x-de-$ref are only checked to be
+objects since they are validated by the from_dict of the referenced model.
+"""
+
+import numbers
+import threading
+import typing
+import weakref
+
+from . import types
+
+Validator = typing.Callable[[typing.Any], bool]
+
+# Keywords that do not affect the decisions of jsonschema.validate
+_ANNOTATIONS = {
+    "format",
+    "nullable",
+    "readOnly",
+    "writeOnly",
+    "description",
+    "title",
+    "example",
+    "default",
+}
+_KEYWORDS = {
+    "type",
+    "maxLength",
+    "enum",
+    "properties",
+    "items",
+    "required",
+    *_ANNOTATIONS,
+}
+
+# The expression checking the type of a value, formatted with the name of the value
+_TYPE_CHECKS = {
+    "integer": (
+        "((isinstance({0}, int) and not isinstance({0}, bool)) or "
+        "(isinstance({0}, float) and {0}.is_integer()))"
+    ),
+    "number": "(isinstance({0}, Number) and not isinstance({0}, bool))",
+    "string": "isinstance({0}, str)",
+    "boolean": "isinstance({0}, bool)",
+    "object": "isinstance({0}, dict)",
+    "array": "isinstance({0}, list)",
+    "null": "({0} is None)",
+}
+
+# The compiled validators by the identity of the schema, which is shared by models
+# with identical schemas. The schema is only referenced weakly so that the interned
+# schemas are not kept alive and the entry is removed once the schema is collected.
+_CACHE: typing.Dict[
+    int, typing.Tuple["weakref.ReferenceType[types.Schema]", typing.Optional[Validator]]
+] = {}
+_LOCK = threading.Lock()
+
+
+class _Unsupported(Exception):
+    """Raised when a schema uses a keyword that is not compiled."""
+
+
+class _Generator:
+    """Generate the source of a validation function."""
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.lines: typing.List[str] = []
+        self._names = 0
+
+    def name(self) -> str:
+        """Generate a unique variable name."""
+        self._names += 1
+        return f"value_{self._names}"
+
+    def emit(self, line: str, *, depth: int) -> None:
+        """Add a line of code."""
+        self.lines.append("    " * depth + line)
+
+    def schema(self, *, schema: typing.Any, value: str, depth: int) -> None:
+        """
+        Generate the checks of a schema for a value.
+
+        Raise _Unsupported if the schema cannot be compiled.
+
+        Args:
+            schema: The schema to check the value against.
+            value: The name of the variable with the value.
+            depth: The indentation of the code.
+
+        """
+        if not isinstance(schema, dict):
+            raise _Unsupported
+        for key in schema:
+            if key not in _KEYWORDS and not key.startswith("x-"):
+                raise _Unsupported
+
+        type_ = schema.get("type")
+        if type_ is not None:
+            if not isinstance(type_, str) or type_ not in _TYPE_CHECKS:
+                raise _Unsupported
+            self.emit(f"if not {_TYPE_CHECKS[type_].format(value)}:", depth=depth)
+            self.emit("return False", depth=depth + 1)
+
+        max_length = schema.get("maxLength")
+        if max_length is not None:
+            # jsonschema rejects the schema itself for other values
+            if (
+                isinstance(max_length, bool)
+                or not isinstance(max_length, int)
+                or max_length < 0
+            ):
+                raise _Unsupported
+            guard = "" if type_ == "string" else f"isinstance({value}, str) and "
+            self.emit(f"if {guard}len({value}) > {max_length}:", depth=depth)
+            self.emit("return False", depth=depth + 1)
+
+        enum = schema.get("enum")
+        if enum is not None:
+            # Only enums of strings are compiled, which are only equal to strings
+            if (
+                not isinstance(enum, list)
+                or not enum
+                or not all(isinstance(item, str) for item in enum)
+            ):
+                raise _Unsupported
+            # The set of constants is compiled into a frozenset once
+            values = "{" + ", ".join(map(repr, enum)) + "}"
+            guard = "" if type_ == "string" else f"isinstance({value}, str) and "
+            self.emit(f"if not ({guard}{value} in {values}):", depth=depth)
+            self.emit("return False", depth=depth + 1)
+
+        self.object(schema=schema, value=value, type_=type_, depth=depth)
+
+        items = schema.get("items")
+        if items is not None:
+            if type_ != "array":
+                self.emit(f"if isinstance({value}, list):", depth=depth)
+                depth += 1
+            item = self.name()
+            self.emit(f"for {item} in {value}:", depth=depth)
+            self.block(schema=items, value=item, depth=depth + 1)
+
+    def block(self, *, schema: typing.Any, value: str, depth: int) -> None:
+        """Generate the checks of a schema as the body of a statement."""
+        lines = len(self.lines)
+        self.schema(schema=schema, value=value, depth=depth)
+        # The schema accepts any value
+        if len(self.lines) == lines:
+            self.emit("pass", depth=depth)
+
+    def object(
+        self, *, schema: types.Schema, value: str, type_: typing.Any, depth: int
+    ) -> None:
+        """Generate the checks of the required and properties keywords."""
+        required = schema.get("required")
+        properties = schema.get("properties")
+        if required is None and properties is None:
+            return
+        if required is not None and (
+            not isinstance(required, list)
+            or not all(isinstance(key, str) for key in required)
+            or len(set(required)) != len(required)
+        ):
+            raise _Unsupported
+        if properties is not None and not isinstance(properties, dict):
+            raise _Unsupported
+        if not required and not properties:
+            return
+
+        if type_ != "object":
+            self.emit(f"if isinstance({value}, dict):", depth=depth)
+            depth += 1
+        for key in required or []:
+            self.emit(f"if {key!r} not in {value}:", depth=depth)
+            self.emit("return False", depth=depth + 1)
+        for key, prop_schema in (properties or {}).items():
+            prop = self.name()
+            self.emit(f"{prop} = {value}.get({key!r}, MISSING)", depth=depth)
+            self.emit(f"if {prop} is not MISSING:", depth=depth)
+            self.block(schema=prop_schema, value=prop, depth=depth + 1)
+
+
+def _compile(schema: types.Schema) -> typing.Optional[Validator]:
+    """Compile a schema or return None if it uses keywords that are not compiled."""
+    generator = _Generator()
+    generator.emit("def validate(instance):", depth=0)
+    try:
+        generator.schema(schema=schema, value="instance", depth=1)
+    except _Unsupported:
+        return None
+    generator.emit("return True", depth=1)
+
+    namespace: typing.Dict[str, typing.Any] = {
+        "Number": numbers.Number,
+        "MISSING": object(),
+    }
+    source = "\n".join(generator.lines)
+    # The source only contains literals derived from the schema using repr
+    exec(compile(source, "<open_alchemy validator>", "exec"), namespace)  # nosec
+    validate: Validator = namespace["validate"]
+    setattr(validate, "source", source)
+    return validate
+
+
+def compile_validator(schema: types.Schema) -> typing.Optional[Validator]:
+    """
+    Compile the schema recorded on a model into a validation function.
+
+    The function is called with an instance and returns whether jsonschema.validate
+    would accept the instance for the schema. The validator of a schema that can be
+    referenced weakly, such as the interned schemas recorded on the models, is only
+    compiled once.
+
+    Args:
+        schema: The schema recorded on the model.
+
+    Returns:
+        The validation function or None if the schema uses keywords that are not
+        compiled, in which case jsonschema has to be used.
+
+    """
+    key = id(schema)
+    cached = _CACHE.get(key)
+    if cached is not None and cached[0]() is schema:
+        return cached[1]
+    validate = _compile(schema)
+
+    def _forget(reference: "weakref.ReferenceType[types.Schema]") -> None:
+        """Remove the entry of the schema once it is collected."""
+        with _LOCK:
+            if _CACHE.get(key, (None, None))[0] is reference:
+                del _CACHE[key]
+
+    try:
+        reference = weakref.ref(schema, _forget)
+    except TypeError:
+        # Plain dictionaries cannot be referenced weakly
+        return validate
+    with _LOCK:
+        _CACHE[key] = (reference, validate)
+    return validate
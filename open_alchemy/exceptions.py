@@ -1,5 +1,9 @@
 """All custom exceptions that OpenAlchemy can raise."""
 
+import typing
+
+from . import types
+
 
 class BaseError(Exception):
     """All exceptions derive at least from this exception."""
@@ -46,4 +50,29 @@ class InvalidModelInstanceError(ValueError, BaseError):
 
 
 class MalformedModelDictionaryError(ValueError, BaseError):
-    """Raised when an dictionary of a model does not satisfy the model schema."""
+    """
+    Raised when an dictionary of a model does not satisfy the model schema.
+
+    The message is only rendered from the errors when it is requested so that large
+    dictionaries and schemas are not converted to strings when the error is handled.
+
+    Attrs:
+        errors: The ways in which the dictionary does not satisfy the schema.
+
+    """
+
+    def __init__(
+        self, *args: typing.Any, errors: typing.Sequence[types.DictionaryError] = ()
+    ) -> None:
+        """Construct."""
+        super().__init__(*args)
+        self.errors = tuple(errors)
+
+    def __str__(self) -> str:
+        """Render the message."""
+        if self.args or not self.errors:
+            return super().__str__()
+        return (
+            "The dictionary passed to from_dict is not a valid instance of the model "
+            "schema. " + "; ".join(map(str, self.errors)) + "."
+        )
@@ -1,13 +1,55 @@
 """Functions for interacting with the OpenAlchemy models."""
 
+import contextlib
+import threading
 import typing
 
 import sqlalchemy
 
 import open_alchemy
+from open_alchemy import hooks
 
 from ..utility_base import TUtilityBase
 
+# The namespace bound to the current thread
+_BOUND = threading.local()
+
+
+def get_models() -> typing.Any:
+    """
+    Get the namespace models are read from and written to.
+
+    Returns:
+        The namespace bound to the current thread or open_alchemy.models if no
+        namespace is bound.
+
+    """
+    models = getattr(_BOUND, "models", None)
+    if models is None:
+        return open_alchemy.models
+    return models
+
+
+@contextlib.contextmanager
+def bind(*, models: typing.Any) -> typing.Iterator[None]:
+    """
+    Bind a namespace for models to the current thread.
+
+    While the namespace is bound, all functions of the facade operate on it instead of
+    on open_alchemy.models.
+
+    Args:
+        models: The namespace to bind. None does not change the bound namespace.
+
+    """
+    previous = getattr(_BOUND, "models", None)
+    if models is not None:
+        _BOUND.models = models
+    try:
+        yield
+    finally:
+        _BOUND.models = previous
+
 
 def get_base() -> typing.Any:
     """
@@ -17,8 +59,7 @@ def get_base() -> typing.Any:
         The models.Base.
 
     """
-    # pylint: disable=no-member
-    return open_alchemy.models.Base  # type: ignore
+    return get_models().Base
 
 
 def set_association(*, table: sqlalchemy.Table, name: str) -> None:
@@ -30,7 +71,9 @@ def set_association(*, table: sqlalchemy.Table, name: str) -> None:
         name: The attribute name to use.
 
     """
-    setattr(open_alchemy.models, name, table)
+    setattr(get_models(), name, table)
+    if hooks.REGISTRY[hooks.AFTER_ASSOCIATION]:
+        hooks.call(hooks.AFTER_ASSOCIATION, name=name, table=table)
 
 
 def get_model(*, name: str) -> typing.Optional[typing.Type[TUtilityBase]]:
@@ -44,7 +87,7 @@ def get_model(*, name: str) -> typing.Optional[typing.Type[TUtilityBase]]:
         The model with the name.
 
     """
-    return getattr(open_alchemy.models, name, None)
+    return getattr(get_models(), name, None)
 
 
 def set_model(*, name: str, model: TUtilityBase) -> None:
@@ -56,4 +99,4 @@ def set_model(*, name: str, model: TUtilityBase) -> None:
         name: The name of the model.
 
     """
-    setattr(open_alchemy.models, name, model)
+    setattr(get_models(), name, model)
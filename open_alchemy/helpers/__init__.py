@@ -1,9 +1,13 @@
 """Helper functions."""
 # pylint: disable=useless-import-alias
 
+from . import dependencies as dependencies
+from . import intern as intern
 from . import peek as peek
+from . import relationships as relationships
 from .define_all import define_all as define_all
 from .get_ext_prop import get_ext_prop as get_ext_prop
 from .merge_all_of import merge_all_of as merge_all_of
 from .prepare_schema import prepare_schema as prepare_schema
+from .resolve_ref import get_ref as get_ref
 from .resolve_ref import resolve_ref as resolve_ref
@@ -1,18 +1,140 @@
 """Define all the models with x-tablename properties."""
 
+import fnmatch
+import typing
+
 from open_alchemy import types
 
+from . import dependencies
+from .resolve_ref import resolve_ref
+
+
+def _matches(*, name: str, patterns: types.Patterns) -> bool:
+    """Check whether a name matches any of the glob patterns."""
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def check_patterns(
+    *,
+    define_all: bool,
+    include: typing.Optional[types.Patterns] = None,
+    exclude: typing.Optional[types.Patterns] = None,
+) -> None:
+    """
+    Check the include and exclude patterns passed to the initialization interfaces.
+
+    Raise TypeError if include or exclude is a string instead of a sequence of
+    strings.
+    Raise ValueError if include or exclude is passed without define_all since they
+    only select the models to define during initialization.
+
+    Args:
+        define_all: Whether all the models are defined during initialization.
+        include: Glob patterns of the names of the schemas to include.
+        exclude: Glob patterns of the names of the schemas to exclude.
+
+    """
+    for name, patterns in (("include", include), ("exclude", exclude)):
+        if isinstance(patterns, str):
+            raise TypeError(
+                f"{name} must be a sequence of glob patterns, not a string, for "
+                f"example [{patterns!r}]."
+            )
+    if not define_all and (include is not None or exclude is not None):
+        raise ValueError("include and exclude can only be passed with define_all.")
+
+
+def is_model(*, schema: types.Schema, schemas: types.Schemas) -> bool:
+    """
+    Check whether a schema in the schemas defines a model.
+
+    A schema defines a model if it has the x-tablename property. A schema that
+    references a schema in another file defines a model if the referenced schema has
+    the x-tablename property.
+
+    Args:
+        schema: The schema to check.
+        schemas: Used to resolve any $ref.
+
+    Returns:
+        Whether the schema defines a model.
+
+    """
+    if schema.get("x-tablename") is not None:
+        return True
+    ref = schema.get("$ref")
+    if not isinstance(ref, str) or ref.startswith("#"):
+        return False
+    _, ref_schema = resolve_ref(name="", schema=schema, schemas=schemas)
+    return ref_schema.get("x-tablename") is not None
+
+
+def select(
+    *,
+    schemas: types.Schemas,
+    include: typing.Optional[types.Patterns] = None,
+    exclude: typing.Optional[types.Patterns] = None,
+) -> typing.List[str]:
+    """
+    Select the names of the models to define.
+
+    Only schemas that define models, as checked by is_model, are considered. If
+    include is passed, only schemas whose name matches at least one of the include
+    patterns are selected.
+    Any schema whose name matches one of the exclude patterns is removed from the
+    selection. Any model required by the relationships of a selected model is added
+    back to the selection, even if it was excluded, since the selected models cannot
+    be used without it.
+
+    Raise TypeError if include or exclude is a string.
+
+    Args:
+        schemas: The schemas from which to select.
+        include: Glob patterns of the names of the schemas to include.
+        exclude: Glob patterns of the names of the schemas to exclude.
+
+    Returns:
+        The names of the selected models in the order they appear in the schemas.
+
+    """
+    check_patterns(define_all=True, include=include, exclude=exclude)
+    names = [
+        name
+        for name, schema in schemas.items()
+        if is_model(schema=schema, schemas=schemas)
+    ]
+    if include is None and exclude is None:
+        return names
+
+    selected = names
+    if include is not None:
+        selected = [name for name in selected if _matches(name=name, patterns=include)]
+    if exclude is not None:
+        selected = [
+            name for name in selected if not _matches(name=name, patterns=exclude)
+        ]
+    required = dependencies.closure(names=selected, schemas=schemas)
+    return [name for name in names if name in required]
+
 
-def define_all(*, model_factory: types.ModelFactory, schemas: types.Schemas) -> None:
+def define_all(
+    *,
+    model_factory: types.ModelFactory,
+    schemas: types.Schemas,
+    include: typing.Optional[types.Patterns] = None,
+    exclude: typing.Optional[types.Patterns] = None,
+) -> None:
     """
     Define all the models with x-tablename properties.
 
     Args:
         model_factory: Factory used to construct models.
         schemas: The schemas from which to define all.
+        include: Glob patterns of the names of the schemas to define, together with
+            any models they require.
+        exclude: Glob patterns of the names of the schemas not to define, unless they
+            are required by another defined model.
 
     """
-    for name, schema in schemas.items():
-        if schema.get("x-tablename") is None:
-            continue
+    for name in select(schemas=schemas, include=include, exclude=exclude):
         model_factory(name=name)
@@ -0,0 +1,103 @@
+"""Calculate the models a model depends on through its relationships."""
+
+import typing
+
+from open_alchemy import types
+
+from . import peek
+from .prepare_schema import prepare_schema
+from .resolve_ref import resolve_ref
+
+
+def _collect_refs(
+    *,
+    value: typing.Any,
+    schemas: types.Schemas,
+    seen: typing.Set[str],
+    models: typing.Set[str],
+) -> None:
+    """
+    Collect the names of models referenced anywhere in a value.
+
+    References to schemas with x-tablename are recorded as models. References to any
+    other schema are followed since they may reference models in turn.
+
+    Args:
+        value: The value to search for $ref.
+        schemas: Used to resolve any $ref.
+        seen: The names of the schemas that have already been visited.
+        models: The names of the referenced models.
+
+    """
+    if isinstance(value, list):
+        for item in value:
+            _collect_refs(value=item, schemas=schemas, seen=seen, models=models)
+        return
+    if not isinstance(value, dict):
+        return
+
+    ref = value.get("$ref")
+    if isinstance(ref, str):
+        # Models are named after the schema at the end of a chain of references
+        ref_name, ref_schema = resolve_ref(name="", schema=value, schemas=schemas)
+        if ref_name not in seen:
+            seen.add(ref_name)
+            if ref_schema.get("x-tablename") is not None:
+                models.add(ref_name)
+            else:
+                _collect_refs(
+                    value=ref_schema, schemas=schemas, seen=seen, models=models
+                )
+    for key, sub_value in value.items():
+        if key == "$ref":
+            continue
+        _collect_refs(value=sub_value, schemas=schemas, seen=seen, models=models)
+
+
+def dependencies(*, name: str, schemas: types.Schemas) -> typing.Set[str]:
+    """
+    Calculate the names of the models a model directly depends on.
+
+    A model depends on any model referenced by its properties, except for readOnly
+    properties which do not define relationships.
+
+    Args:
+        name: The name of the model.
+        schemas: All the schemas.
+
+    Returns:
+        The names of the models referenced by the properties of the model.
+
+    """
+    schema = prepare_schema(schema=schemas[name], schemas=schemas)
+    models: typing.Set[str] = set()
+    seen: typing.Set[str] = set()
+    for prop_schema in schema.get("properties", {}).values():
+        if peek.read_only(schema=prop_schema, schemas=schemas):
+            continue
+        _collect_refs(value=prop_schema, schemas=schemas, seen=seen, models=models)
+    models.discard(name)
+    return models
+
+
+def closure(*, names: typing.Iterable[str], schemas: types.Schemas) -> typing.Set[str]:
+    """
+    Calculate the names of the models and all the models they transitively require.
+
+    Args:
+        names: The names of the models to start with.
+        schemas: All the schemas.
+
+    Returns:
+        The names of the models and of every model they depend on.
+
+    """
+    required: typing.Set[str] = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name in required:
+            continue
+        required.add(name)
+        pending.extend(dependencies(name=name, schemas=schemas) - required)
+    return required
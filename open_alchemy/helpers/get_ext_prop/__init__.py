@@ -1,23 +1,12 @@
 """Read the value of an extension property, validate the schema and return it."""
 
 import json
-import os
 import typing
 
-import jsonschema
-
 from open_alchemy import exceptions
+from open_alchemy import profiling
 
-_DIRECTORY = os.path.dirname(__file__)
-_SCHEMAS_FILE = os.path.join(_DIRECTORY, "extension-schemas.json")
-with open(_SCHEMAS_FILE) as in_file:
-    _SCHEMAS = json.load(in_file)
-_COMMON_SCHEMAS_FILE = os.path.join(_DIRECTORY, "common-schemas.json")
-with open(_COMMON_SCHEMAS_FILE) as in_file:
-    _COMMON_SCHEMAS = json.load(in_file)
-_resolver = jsonschema.RefResolver.from_schema(  # pylint: disable=invalid-name
-    _COMMON_SCHEMAS
-)
+from . import schemas
 
 
 def get_ext_prop(
@@ -43,14 +32,13 @@ def get_ext_prop(
         The value of the property or the default value if it does not exist.
 
     """
+    profiling.count(profiling.GET_EXT_PROP)
     value = source.get(name)
     if value is None:
         return default
 
-    schema = _SCHEMAS.get(name)
-    try:
-        jsonschema.validate(instance=value, schema=schema, resolver=_resolver)
-    except jsonschema.ValidationError:
+    if not schemas.validator(name).is_valid(value):
+        schema = schemas.extension_schemas().get(name)
         raise exceptions.MalformedExtensionPropertyError(
             f"The value of the {json.dumps(name)} extension property is not "
             "valid. "
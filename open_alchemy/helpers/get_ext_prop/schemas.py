@@ -0,0 +1,79 @@
+"""Registry of the schemas of the extension properties, loaded when first used."""
+
+import functools
+import json
+import os
+import typing
+
+from open_alchemy import types
+
+_DIRECTORY = os.path.dirname(__file__)
+_SCHEMAS_FILE = os.path.join(_DIRECTORY, "extension-schemas.json")
+_COMMON_SCHEMAS_FILE = os.path.join(_DIRECTORY, "common-schemas.json")
+
+
+def _load(filename: str) -> types.Schemas:
+    """Load a JSON file with schemas."""
+    with open(filename) as in_file:
+        return json.load(in_file)
+
+
+@functools.lru_cache(maxsize=None)
+def extension_schemas() -> types.Schemas:
+    """
+    Get the schemas of the extension properties by name.
+
+    Returns:
+        The schemas defined in extension-schemas.json.
+
+    """
+    return _load(_SCHEMAS_FILE)
+
+
+@functools.lru_cache(maxsize=None)
+def common_schemas() -> types.Schemas:
+    """
+    Get the schemas referenced by the schemas of the extension properties.
+
+    Returns:
+        The schemas defined in common-schemas.json.
+
+    """
+    return _load(_COMMON_SCHEMAS_FILE)
+
+
+@functools.lru_cache(maxsize=None)
+def resolver() -> typing.Any:
+    """
+    Get the resolver for references to the common schemas.
+
+    Returns:
+        The jsonschema RefResolver for the common schemas.
+
+    """
+    # Importing jsonschema is slow, so it is only imported when validation is needed
+    import jsonschema  # pylint: disable=import-outside-toplevel
+
+    return jsonschema.RefResolver.from_schema(common_schemas())
+
+
+@functools.lru_cache(maxsize=None)
+def validator(name: str) -> typing.Any:
+    """
+    Get the validator for the schema of an extension property.
+
+    The validator is constructed once per extension property and checks values
+    against the schema without checking the schema itself on every call.
+
+    Args:
+        name: The name of the extension property.
+
+    Returns:
+        The jsonschema validator for the schema of the extension property.
+
+    """
+    import jsonschema  # pylint: disable=import-outside-toplevel
+
+    schema = extension_schemas().get(name)
+    validator_class = jsonschema.validators.validator_for(schema)
+    return validator_class(schema, resolver=resolver())
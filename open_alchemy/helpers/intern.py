@@ -0,0 +1,248 @@
+"""Immutable schemas and specifications and sharing identical schemas."""
+
+import sys
+import threading
+import typing
+import weakref
+
+
+def _immutable(self: typing.Any, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+    """Raise TypeError for any modification."""
+    raise TypeError(f"{type(self).__name__} cannot be modified.")
+
+
+class FrozenDict(dict):
+    """
+    Dictionary that cannot be modified.
+
+    It is a dict so that it can be used anywhere a schema is used, including
+    json.dumps and jsonschema.
+
+    """
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    def __reduce__(self) -> typing.Tuple[typing.Type, typing.Tuple[dict]]:
+        """Copy and pickle using the constructor since items cannot be set."""
+        return (type(self), (dict(self),))
+
+
+class FrozenList(list):
+    """List that cannot be modified."""
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __iadd__ = _immutable
+    __imul__ = _immutable
+    append = _immutable
+    clear = _immutable
+    extend = _immutable
+    insert = _immutable
+    pop = _immutable
+    remove = _immutable
+    reverse = _immutable
+    sort = _immutable
+
+    def __reduce__(self) -> typing.Tuple[typing.Type, typing.Tuple[list]]:
+        """Copy and pickle using the constructor since items cannot be appended."""
+        return (type(self), (list(self),))
+
+
+# The interned dictionaries and lists by a key made of their type and the keys of
+# their items. The key of a dictionary or list item is the id of the interned item,
+# which stays valid since the interned value keeps its items alive. Strings and None
+# are their own key and the key of any other item is its type and value, which
+# distinguishes values that are equal but have different types, such as 1, 1.0 and
+# True. The values are only held weakly so that they are removed once no schema
+# uses them.
+_INTERNED: "weakref.WeakValueDictionary[typing.Hashable, typing.Any]" = (
+    weakref.WeakValueDictionary()
+)
+_LOCK = threading.Lock()
+
+
+def _key(value: typing.Any) -> typing.Hashable:
+    """Calculate the key of an item of an interned dictionary or list."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return id(value)
+    if value is None or isinstance(value, str):
+        return value
+    return (type(value), value)
+
+
+def _intern(value: typing.Any) -> typing.Any:
+    """Intern a value."""
+    if isinstance(value, dict):
+        items = [
+            (sys.intern(key) if isinstance(key, str) else key, _intern(sub_value))
+            for key, sub_value in value.items()
+        ]
+        # The order of the keys is part of the key since the order of the properties
+        # is the order of the dictionary returned by to_dict
+        key: typing.Hashable = (
+            dict,
+            *(
+                part
+                for item_key, sub_value in items
+                for part in (item_key, _key(sub_value))
+            ),
+        )
+        interned = _INTERNED.get(key)
+        if interned is None:
+            interned = FrozenDict(items)
+            _INTERNED[key] = interned
+        return interned
+    if isinstance(value, list):
+        sub_values = [_intern(sub_value) for sub_value in value]
+        key = (list, *map(_key, sub_values))
+        interned = _INTERNED.get(key)
+        if interned is None:
+            interned = FrozenList(sub_values)
+            _INTERNED[key] = interned
+        return interned
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def intern(schema: typing.Dict[str, typing.Any]) -> FrozenDict:
+    """
+    Get an immutable schema that is shared with any structurally identical schema.
+
+    Any nested dictionary and list is also shared with any structurally identical
+    dictionary or list interned before and strings are interned using sys.intern.
+
+    Args:
+        schema: The schema to intern.
+
+    Returns:
+        The interned schema.
+
+    """
+    with _LOCK:
+        return _intern(schema)
+
+
+def clear() -> None:
+    """Forget all the interned values so that they are not shared with new schemas."""
+    with _LOCK:
+        _INTERNED.clear()
+
+
+def table_size(
+    *,
+    schemas: typing.Iterable[typing.Any],
+    seen: typing.Optional[typing.Set[int]] = None,
+) -> int:
+    """
+    Calculate the memory used by the entries of the table of interned values.
+
+    Only the entries of the values reachable from the schemas are counted, as if they
+    were in a table of their own, so that the result does not depend on which other
+    schemas are interned in the process. The interned values themselves are not
+    included.
+
+    Args:
+        schemas: The schemas whose entries are counted.
+        seen: The ids of the objects already counted, such as the strings of the
+            schemas, which are not counted again.
+
+    Returns:
+        The number of bytes used by the table and its keys.
+
+    """
+    if seen is None:
+        seen = set()
+    reachable: typing.Set[int] = set()
+    pending = list(schemas)
+    while pending:
+        value = pending.pop()
+        if id(value) in reachable:
+            continue
+        if isinstance(value, dict):
+            reachable.add(id(value))
+            pending.extend(value.values())
+        elif isinstance(value, list):
+            reachable.add(id(value))
+            pending.extend(value)
+
+    with _LOCK:
+        entries = {
+            key: reference
+            for key, reference in _INTERNED.data.items()
+            if id(reference()) in reachable
+        }
+    size = sys.getsizeof(_INTERNED) + sys.getsizeof(entries)
+    for key, reference in entries.items():
+        size += sys.getsizeof(reference) + _size_of_key(key, seen=seen)
+    return size
+
+
+def _size_of_key(key: typing.Any, *, seen: typing.Set[int]) -> int:
+    """Calculate the memory used by a key of the table of interned values."""
+    if id(key) in seen:
+        return 0
+    seen.add(id(key))
+    size = sys.getsizeof(key)
+    if isinstance(key, tuple):
+        size += sum(_size_of_key(part, seen=seen) for part in key)
+    return size
+
+
+def freeze(value: typing.Any) -> typing.Any:
+    """
+    Get an immutable copy of a schema or specification without sharing any values.
+
+    Any value that is already immutable is returned as is, so freezing a frozen
+    specification does not copy it.
+
+    Args:
+        value: The value to freeze.
+
+    Returns:
+        The frozen value.
+
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(sub_value)) for key, sub_value in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(sub_value) for sub_value in value)
+    return value
+
+
+def size_of(value: typing.Any, *, seen: typing.Optional[typing.Set[int]] = None) -> int:
+    """
+    Calculate the memory used by a schema in bytes.
+
+    Args:
+        value: The schema.
+        seen: The ids of the objects already counted, which are not counted again.
+            Passing the same set for the schemas of multiple models only counts the
+            values they share once.
+
+    Returns:
+        The number of bytes used by the schema and all its values.
+
+    """
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, sub_value in value.items():
+            size += size_of(key, seen=seen) + size_of(sub_value, seen=seen)
+    elif isinstance(value, list):
+        for sub_value in value:
+            size += size_of(sub_value, seen=seen)
+    return size
@@ -3,6 +3,7 @@
 import typing
 
 from open_alchemy import exceptions
+from open_alchemy import profiling
 from open_alchemy import types
 
 from .resolve_ref import get_ref
@@ -23,6 +24,7 @@ def type_(*, schema: types.Schema, schemas: types.Schemas) -> str:
         The type of the schema.
 
     """
+    profiling.count(profiling.PEEK)
     value = peek_key(schema=schema, schemas=schemas, key="type")
     if value is None:
         raise exceptions.TypeMissingError("Every property requires a type.")
@@ -47,6 +49,7 @@ def nullable(*, schema: types.Schema, schemas: types.Schemas) -> typing.Optional
         The nullable value.
 
     """
+    profiling.count(profiling.PEEK)
     value = peek_key(schema=schema, schemas=schemas, key="nullable")
     if value is None:
         return None
@@ -71,6 +74,7 @@ def format_(*, schema: types.Schema, schemas: types.Schemas) -> typing.Optional[
         The format value or None if it was not found.
 
     """
+    profiling.count(profiling.PEEK)
     value = peek_key(schema=schema, schemas=schemas, key="format")
     if value is None:
         return None
@@ -93,6 +97,7 @@ def max_length(*, schema: types.Schema, schemas: types.Schemas) -> typing.Option
         The maxLength value or None if it was not found.
 
     """
+    profiling.count(profiling.PEEK)
     value = peek_key(schema=schema, schemas=schemas, key="maxLength")
     if value is None:
         return None
@@ -103,6 +108,31 @@ def max_length(*, schema: types.Schema, schemas: types.Schemas) -> typing.Option
     return value
 
 
+def enum(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[typing.List[typing.Any]]:
+    """
+    Retrieve the enum property from a property schema.
+
+    Raises MalformedSchemaError if the enum value is not a non-empty list.
+
+    Args:
+        schema: The schema to get the enum from.
+        schemas: The schemas for $ref lookup.
+
+    Returns:
+        The enum value or None if it was not found.
+
+    """
+    profiling.count(profiling.PEEK)
+    value = peek_key(schema=schema, schemas=schemas, key="enum")
+    if value is None:
+        return None
+    if not isinstance(value, list) or not value:
+        raise exceptions.MalformedSchemaError("An enum value must be a non-empty list.")
+    return value
+
+
 def read_only(*, schema: types.Schema, schemas: types.Schemas) -> bool:
     """
     Determine whether schema is readOnly.
@@ -117,6 +147,7 @@ def read_only(*, schema: types.Schema, schemas: types.Schemas) -> bool:
         Whether the schema is readOnly.
 
     """
+    profiling.count(profiling.PEEK)
     value = peek_key(schema=schema, schemas=schemas, key="readOnly")
     if value is None:
         return False
@@ -141,6 +172,7 @@ def primary_key(*, schema: types.Schema, schemas: types.Schemas) -> bool:
         Whether the schema is for a primary key property.
 
     """
+    profiling.count(profiling.PEEK)
     value = peek_key(schema=schema, schemas=schemas, key="x-primary-key")
     if value is None:
         return False
@@ -151,6 +183,56 @@ def primary_key(*, schema: types.Schema, schemas: types.Schemas) -> bool:
     return value
 
 
+def items(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[types.Schema]:
+    """
+    Retrieve the items property from a property schema.
+
+    Raises MalformedSchemaError if the items value is not an object.
+
+    Args:
+        schema: The schema to get the items from.
+        schemas: The schemas for $ref lookup.
+
+    Returns:
+        The items value or None if it was not found.
+
+    """
+    profiling.count(profiling.PEEK)
+    value = peek_key(schema=schema, schemas=schemas, key="items")
+    if value is None:
+        return None
+    if not isinstance(value, dict):
+        raise exceptions.MalformedSchemaError("An items value must be an object.")
+    return value
+
+
+def json(*, schema: types.Schema, schemas: types.Schemas) -> bool:
+    """
+    Determine whether the value of a property is stored in a JSON column.
+
+    Raises MalformedSchemaError if the x-json value is not a boolean.
+
+    Args:
+        schema: The schema to get x-json from.
+        schemas: The schemas for $ref lookup.
+
+    Returns:
+        Whether the value of the property is stored in a JSON column.
+
+    """
+    profiling.count(profiling.PEEK)
+    value = peek_key(schema=schema, schemas=schemas, key="x-json")
+    if value is None:
+        return False
+    if not isinstance(value, bool):
+        raise exceptions.MalformedSchemaError(
+            "The x-json property must be of type boolean."
+        )
+    return value
+
+
 def peek_key(*, schema: types.Schema, schemas: types.Schemas, key: str) -> typing.Any:
     """Recursive type lookup."""
     # Base case, look for type key
@@ -1,5 +1,6 @@
 """Resolve $ref and merge allOf."""
 
+from open_alchemy import profiling
 from open_alchemy import types
 
 from .merge_all_of import merge_all_of
@@ -18,5 +19,6 @@ def prepare_schema(*, schema: types.Schema, schemas: types.Schemas) -> types.Sch
         The prepared schema.
 
     """
+    profiling.count(profiling.PREPARE_SCHEMA)
     _, schema = resolve_ref(name="", schema=schema, schemas=schemas)
     return merge_all_of(schema=schema, schemas=schemas)
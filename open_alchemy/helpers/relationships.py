@@ -0,0 +1,66 @@
+"""Construct relationships that can be copied to the models of other bases."""
+
+import typing
+import weakref
+
+from sqlalchemy import orm
+
+from open_alchemy import exceptions
+
+Arguments = typing.Tuple[typing.Tuple[typing.Any, ...], typing.Dict[str, typing.Any]]
+
+# The arguments every relationship constructed by construct was constructed with
+_ARGUMENTS: "weakref.WeakKeyDictionary[typing.Any, Arguments]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _copy_backref(kwargs: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    """Copy the keyword arguments of a back reference, which configuring modifies."""
+    backref = kwargs.get("backref")
+    if not isinstance(backref, tuple):
+        return kwargs
+    backref_name, backref_kwargs = backref
+    return {**kwargs, "backref": orm.backref(backref_name, **backref_kwargs)}
+
+
+def construct(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+    """
+    Construct a relationship and record the arguments it was constructed with.
+
+    Args:
+        args: The positional arguments for sqlalchemy.orm.relationship.
+        kwargs: The keyword arguments for sqlalchemy.orm.relationship.
+
+    Returns:
+        The relationship.
+
+    """
+    relationship = orm.relationship(*args, **kwargs)
+    _ARGUMENTS[relationship] = (args, _copy_backref(kwargs))
+    return relationship
+
+
+def copy(relationship: typing.Any) -> typing.Any:
+    """
+    Construct a relationship with the arguments of another relationship.
+
+    Raise FeatureNotImplementedError if the relationship was not constructed using
+    construct.
+
+    Args:
+        relationship: The relationship to copy.
+
+    Returns:
+        The new relationship.
+
+    """
+    arguments = _ARGUMENTS.get(relationship)
+    if arguments is None:
+        raise exceptions.FeatureNotImplementedError(
+            "Only relationships constructed using "
+            "open_alchemy.helpers.relationships.construct can be shared between "
+            "bases."
+        )
+    args, kwargs = arguments
+    return construct(*args, **_copy_backref(kwargs))
@@ -1,12 +1,21 @@
 """Used to resolve schema references."""
 
+import os
 import re
+import threading
 import typing
 
 from open_alchemy import exceptions
 from open_alchemy import types
 
-_REF_PATTER = re.compile(r"^#\/components\/schemas\/(\w+)$")
+_REF_PATTER = re.compile(r"^(.*)#\/components\/schemas\/(\w+)$")
+
+# The documents of remote references by their absolute filename and the schemas
+# retrieved from them by their absolute filename and name, so that every file is only
+# loaded once per process
+_DOCUMENTS: typing.Dict[str, types.Schema] = {}
+_REMOTE_SCHEMAS: typing.Dict[typing.Tuple[str, str], "NameSchema"] = {}
+_LOCK = threading.Lock()
 
 
 NameSchema = typing.Tuple[str, types.Schema]
@@ -46,7 +55,14 @@ def get_ref(*, ref: str, schemas: types.Schemas) -> NameSchema:
     """
     Get the schema referenced by ref.
 
-    Raises SchemaNotFound is a $ref resolution fails.
+    References to other files, such as common.yaml#/components/schemas/Address, are
+    resolved relative to the current working directory. The file is loaded the first
+    time it is referenced. Any $ref in the returned schema is changed so that it
+    resolves in the context of the file.
+
+    Raises SchemaNotFound is a $ref resolution fails. Raises MalformedSchemaError if
+    the reference is to a model in another file and the schema with the name of the
+    model does not reference that model.
 
     Args:
         ref: The reference to the schema.
@@ -60,13 +76,181 @@ def get_ref(*, ref: str, schemas: types.Schemas) -> NameSchema:
     match = _REF_PATTER.match(ref)
     if not match:
         raise exceptions.SchemaNotFoundError(
-            f"{ref} format incorrect, expected #/components/schemas/<SchemaName>"
+            f"{ref} format incorrect, expected "
+            "[<filename>]#/components/schemas/<SchemaName>"
+        )
+    if match.group(1):
+        name_schema = _get_remote_ref(
+            ref=ref, filename=match.group(1), name=match.group(2)
         )
+        ref_name, ref_schema = name_schema
+        if isinstance(ref_schema, dict) and ref_schema.get("x-tablename") is not None:
+            _check_remote_model(ref=ref, name=ref_name, schemas=schemas)
+        return name_schema
 
     # Retrieving new schema
-    ref_name = match.group(1)
+    ref_name = match.group(2)
     ref_schema = schemas.get(ref_name)
     if ref_schema is None:
         raise exceptions.SchemaNotFoundError(f"{ref_name} was not found in schemas.")
 
     return ref_name, ref_schema
+
+
+def absolute_ref(*, ref: str, filename: str) -> str:
+    """
+    Convert a reference in a file so that it resolves independently of the file.
+
+    Args:
+        ref: The reference.
+        filename: The name of the file that contains the reference.
+
+    Returns:
+        The reference with the absolute filename of the referenced file.
+
+    """
+    ref_filename, separator, pointer = ref.partition("#")
+    if "://" in ref_filename:
+        return ref
+    if not ref_filename:
+        ref_filename = filename
+    else:
+        ref_filename = os.path.join(os.path.dirname(filename), ref_filename)
+    return f"{os.path.abspath(ref_filename)}{separator}{pointer}"
+
+
+def absolute_refs(*, value: typing.Any, filename: str) -> typing.Any:
+    """
+    Copy a value with every $ref converted using absolute_ref.
+
+    Args:
+        value: The value to copy.
+        filename: The name of the file that contains the value.
+
+    Returns:
+        The copy of the value.
+
+    """
+    if isinstance(value, list):
+        return [absolute_refs(value=item, filename=filename) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {
+        key: (
+            absolute_ref(ref=sub_value, filename=filename)
+            if key == "$ref" and isinstance(sub_value, str)
+            else absolute_refs(value=sub_value, filename=filename)
+        )
+        for key, sub_value in value.items()
+    }
+
+
+def _remote_key(
+    *, schema: typing.Any, schemas: types.Schemas, seen: typing.Set[str]
+) -> typing.Optional[typing.Tuple[str, str]]:
+    """
+    Find the schema in another file that a schema of the specification references.
+
+    The schema is followed through $ref and the first allOf sub schema, which is
+    where the schemas of models are kept when foreign keys are added to them.
+
+    Returns:
+        The absolute filename and name of the schema in the other file or None if the
+        schema is defined in the specification.
+
+    """
+    while isinstance(schema, dict):
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            match = _REF_PATTER.match(ref)
+            if match is None:
+                return None
+            if match.group(1):
+                return os.path.abspath(match.group(1)), match.group(2)
+            if match.group(2) in seen:
+                return None
+            seen.add(match.group(2))
+            schema = schemas.get(match.group(2))
+            continue
+        all_of = schema.get("allOf")
+        if not isinstance(all_of, list) or not all_of:
+            return None
+        schema = all_of[0]
+    return None
+
+
+def _check_remote_model(*, ref: str, name: str, schemas: types.Schemas) -> None:
+    """Check that the schema with the name of a model in another file references it."""
+    # Models are constructed under the name of their schema
+    if name not in schemas:
+        raise exceptions.MalformedSchemaError(
+            f"The model {name} of {ref} is not in the schemas of the specification. "
+            f"Add a schema named {name} that references it."
+        )
+    filename, _, _ = ref.partition("#")
+    key = _remote_key(schema=schemas[name], schemas=schemas, seen={name})
+    if key != (os.path.abspath(filename), name):
+        raise exceptions.MalformedSchemaError(
+            f"The model {name} of {ref} conflicts with the schema {name} of the "
+            "specification, which does not reference it."
+        )
+
+
+def _load_document(filename: str) -> types.Schema:
+    """Load a document based on the extension of its filename."""
+    # The loader depends on the helpers
+    from open_alchemy import loader  # pylint: disable=import-outside-toplevel
+
+    return loader.load(filename)
+
+
+def _get_remote_ref(*, ref: str, filename: str, name: str) -> NameSchema:
+    """Get the schema referenced by a reference to another file."""
+    filename = os.path.abspath(filename)
+    key = (filename, name)
+    name_schema = _REMOTE_SCHEMAS.get(key)
+    if name_schema is not None:
+        return name_schema
+
+    with _LOCK:
+        name_schema = _REMOTE_SCHEMAS.get(key)
+        if name_schema is not None:
+            return name_schema
+
+        document = _DOCUMENTS.get(filename)
+        if document is None:
+            try:
+                document = _load_document(filename)
+            except OSError as exc:
+                raise exceptions.SchemaNotFoundError(
+                    f"The file of {ref} could not be loaded: {exc}"
+                )
+            _DOCUMENTS[filename] = document
+        schema = document.get("components", {}).get("schemas", {}).get(name)
+        if schema is None:
+            raise exceptions.SchemaNotFoundError(
+                f"{name} was not found in the schemas of {filename}."
+            )
+
+        name_schema = (name, absolute_refs(value=schema, filename=filename))
+        _REMOTE_SCHEMAS[key] = name_schema
+    return name_schema
+
+
+def filenames() -> typing.List[str]:
+    """
+    Get the absolute filenames of the files loaded for remote references.
+
+    Returns:
+        The filenames in the order the files were loaded.
+
+    """
+    with _LOCK:
+        return list(_DOCUMENTS)
+
+
+def clear_cache() -> None:
+    """Forget the files loaded for remote references so that they are loaded again."""
+    with _LOCK:
+        _DOCUMENTS.clear()
+        _REMOTE_SCHEMAS.clear()
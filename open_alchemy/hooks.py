@@ -0,0 +1,132 @@
+"""Registry of hooks called during model construction."""
+
+import contextlib
+import threading
+import typing
+
+# Called with name, schema and schemas before the schema of a model is prepared
+BEFORE_PREPARE_SCHEMA = "before_prepare_schema"
+# Called with name and schema after the schema of a model is prepared
+AFTER_PREPARE_SCHEMA = "after_prepare_schema"
+# Called with name, logical_name, class_vars and spec after the columns and
+# relationships for a property of a model are created
+AFTER_COLUMN = "after_column"
+# Called with name and model after the class of a model is created
+AFTER_MODEL = "after_model"
+# Called with name and table after an association table is registered
+AFTER_ASSOCIATION = "after_association"
+EVENTS = (
+    BEFORE_PREPARE_SCHEMA,
+    AFTER_PREPARE_SCHEMA,
+    AFTER_COLUMN,
+    AFTER_MODEL,
+    AFTER_ASSOCIATION,
+)
+
+Hook = typing.Callable[..., None]
+
+# The hooks by event. The hooks of an event are replaced rather than modified so
+# that they can be read without a lock and checking for hooks is a single lookup.
+REGISTRY: typing.Dict[str, typing.Tuple[Hook, ...]] = {event: () for event in EVENTS}
+_LOCK = threading.Lock()
+# The events whose hooks are suppressed in the current thread
+_SUPPRESSED = threading.local()
+
+
+def _check_event(event: str) -> None:
+    """Raise ValueError if the event does not exist."""
+    if event not in REGISTRY:
+        raise ValueError(f"{event} is not a known event. Events are {EVENTS}.")
+
+
+def register(*, event: str, hook: Hook) -> None:
+    """
+    Register a hook for an event.
+
+    Raise ValueError if the event does not exist.
+
+    Args:
+        event: The event, one of EVENTS.
+        hook: The hook which is called with the keyword arguments of the event.
+
+    """
+    _check_event(event)
+    with _LOCK:
+        REGISTRY[event] = (*REGISTRY[event], hook)
+
+
+def unregister(*, event: str, hook: Hook) -> None:
+    """
+    Remove a hook for an event.
+
+    Raise ValueError if the hook is not registered for the event.
+
+    Args:
+        event: The event the hook was registered for.
+        hook: The hook to remove.
+
+    """
+    _check_event(event)
+    with _LOCK:
+        hooks = list(REGISTRY[event])
+        hooks.remove(hook)
+        REGISTRY[event] = tuple(hooks)
+
+
+@contextlib.contextmanager
+def registered(*, event: str, hook: Hook) -> typing.Iterator[None]:
+    """
+    Register a hook for an event while the context is active.
+
+    Args:
+        event: The event, one of EVENTS.
+        hook: The hook which is called with the keyword arguments of the event.
+
+    """
+    register(event=event, hook=hook)
+    try:
+        yield
+    finally:
+        unregister(event=event, hook=hook)
+
+
+@contextlib.contextmanager
+def suppressed(*events: str) -> typing.Iterator[None]:
+    """
+    Suppress the hooks of events in the current thread while the context is active.
+
+    Used for passes that do not construct models that are visible to the user, such as
+    validation, so that the hooks are only called for the models that are constructed.
+
+    Raise ValueError if an event does not exist.
+
+    Args:
+        events: The events to suppress. All events are suppressed if none are given.
+
+    """
+    for event in events:
+        _check_event(event)
+    previous: typing.FrozenSet[str] = getattr(_SUPPRESSED, "events", frozenset())
+    _SUPPRESSED.events = previous | frozenset(events or EVENTS)
+    try:
+        yield
+    finally:
+        _SUPPRESSED.events = previous
+
+
+def call(event: str, **kwargs: typing.Any) -> None:
+    """
+    Call the hooks of an event in the order they were registered.
+
+    Callers check REGISTRY[event] first so that no call is made when no hook is
+    registered. No hook is called if the event is suppressed in the current thread.
+
+    Args:
+        event: The event.
+        kwargs: The arguments for the hooks.
+
+    """
+    if event in getattr(_SUPPRESSED, "events", ()):
+        return
+    for hook in REGISTRY[event]:
+        hook(**kwargs)
@@ -0,0 +1,408 @@
+"""Load OpenAPI specifications from files."""
+
+import hashlib
+import json
+import typing
+
+from open_alchemy import exceptions
+from open_alchemy import types
+
+from . import helpers
+from .helpers.resolve_ref import absolute_ref
+
+
+def _get_yaml() -> typing.Any:
+    """Import pyyaml."""
+    try:
+        import yaml  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        raise ImportError(
+            "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
+        )
+    return yaml
+
+
+def load_errors() -> typing.Tuple[typing.Type[Exception], ...]:
+    """
+    Get the exceptions raised when a specification file cannot be loaded.
+
+    The errors of pyyaml are only included if it has been installed.
+
+    Returns:
+        The exceptions for missing files, missing packages and syntax errors.
+
+    """
+    # JSON decode errors are ValueErrors
+    errors: typing.Tuple[typing.Type[Exception], ...] = (
+        OSError,
+        ImportError,
+        ValueError,
+    )
+    try:
+        yaml = _get_yaml()
+    except ImportError:
+        return errors
+    return (*errors, yaml.YAMLError)
+
+
+def yaml_loader() -> typing.Type:
+    """
+    Get the fastest safe YAML loader that is available.
+
+    Raise ImportError if pyyaml has not been installed.
+
+    Returns:
+        The libyaml based CSafeLoader if pyyaml was built with libyaml and the pure
+        Python SafeLoader otherwise.
+
+    """
+    yaml = _get_yaml()
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _find_value_node(
+    *, loader: typing.Any, node: typing.Any, key: str
+) -> typing.Optional[typing.Any]:
+    """Find the node of the value for a key of a YAML mapping node."""
+    yaml = _get_yaml()
+    if not isinstance(node, yaml.MappingNode):
+        return None
+    # Resolving any merge keys
+    loader.flatten_mapping(node)
+    for key_node, value_node in node.value:
+        if isinstance(key_node, yaml.ScalarNode) and key_node.value == key:
+            return value_node
+    return None
+
+
+def _absolute_remote_refs(value: typing.Any, spec_filename: str) -> typing.Any:
+    """
+    Make any reference to another file independent of the file that contains it.
+
+    The references are changed in place and the files they reference are not loaded.
+
+    Returns:
+        The value.
+
+    """
+    if isinstance(value, list):
+        for item in value:
+            _absolute_remote_refs(item, spec_filename)
+    elif isinstance(value, dict):
+        ref = value.get("$ref")
+        if isinstance(ref, str) and not ref.startswith("#"):
+            value["$ref"] = absolute_ref(ref=ref, filename=spec_filename)
+        for sub_value in value.values():
+            _absolute_remote_refs(sub_value, spec_filename)
+    return value
+
+
+def load_yaml(spec_filename: str, *, schemas_only: bool = False) -> types.Schema:
+    """
+    Load an OpenAPI specification from a YAML file.
+
+    Any $ref to another file is changed to use the absolute filename of that file,
+    which is only loaded once the reference is resolved.
+
+    Raise ImportError if pyyaml has not been installed.
+
+    Args:
+        spec_filename: The filename of the specification.
+        schemas_only: Whether to only load components.schemas of the specification.
+            The whole file is still parsed, but everything else, such as the paths,
+            is not converted to Python objects.
+
+    Returns:
+        The specification.
+
+    """
+    yaml = _get_yaml()
+    loader_class = yaml_loader()
+
+    with open(spec_filename) as spec_file:
+        if not schemas_only:
+            return _absolute_remote_refs(
+                yaml.load(spec_file, Loader=loader_class), spec_filename
+            )
+
+        loader = loader_class(spec_file)
+        try:
+            node = loader.get_single_node()
+            components_node = _find_value_node(
+                loader=loader, node=node, key="components"
+            )
+            if components_node is None:
+                return {}
+            schemas_node = _find_value_node(
+                loader=loader, node=components_node, key="schemas"
+            )
+            if schemas_node is None:
+                return {"components": {}}
+            schemas = loader.construct_document(schemas_node)
+            return {
+                "components": {"schemas": _absolute_remote_refs(schemas, spec_filename)}
+            }
+        finally:
+            loader.dispose()
+
+
+def load_json(spec_filename: str, *, schemas_only: bool = False) -> types.Schema:
+    """
+    Load an OpenAPI specification from a JSON file.
+
+    Uses orjson if it has been installed and the json module otherwise. Any $ref to
+    another file is changed to use the absolute filename of that file, which is only
+    loaded once the reference is resolved.
+
+    Args:
+        spec_filename: The filename of the specification.
+        schemas_only: Whether to only keep components.schemas of the specification.
+
+    Returns:
+        The specification.
+
+    """
+    with open(spec_filename, "rb") as spec_file:
+        content = spec_file.read()
+
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        spec = orjson.loads(content)  # pylint: disable=no-member
+    except ImportError:
+        spec = json.loads(content)
+    _absolute_remote_refs(spec, spec_filename)
+
+    if not schemas_only:
+        return spec
+    if "components" not in spec:
+        return {}
+    components = spec["components"]
+    if not isinstance(components, dict) or "schemas" not in components:
+        return {"components": {}}
+    return {"components": {"schemas": components["schemas"]}}
+
+
+def load(spec_filename: str, *, schemas_only: bool = False) -> types.Schema:
+    """
+    Load an OpenAPI specification based on the extension of its filename.
+
+    Files ending in .json are loaded using load_json and all other files using
+    load_yaml.
+
+    Args:
+        spec_filename: The filename of the specification.
+        schemas_only: Whether to only load components.schemas of the specification.
+
+    Returns:
+        The specification.
+
+    """
+    if spec_filename.endswith(".json"):
+        return load_json(spec_filename, schemas_only=schemas_only)
+    return load_yaml(spec_filename, schemas_only=schemas_only)
+
+
+def _collect_refs(value: typing.Any, refs: typing.List[str]) -> None:
+    """Collect the values of every $ref in a value."""
+    if isinstance(value, list):
+        for item in value:
+            _collect_refs(item, refs)
+        return
+    if not isinstance(value, dict):
+        return
+    ref = value.get("$ref")
+    if isinstance(ref, str):
+        refs.append(ref)
+    for sub_value in value.values():
+        _collect_refs(sub_value, refs)
+
+
+def _references(*, schema: types.Schema, schemas: types.Schemas) -> typing.List[str]:
+    """
+    Calculate the schemas a schema references.
+
+    Schemas in other files are identified by the reference to them, which is absolute
+    for the specifications loaded from files.
+
+    """
+    refs: typing.List[str] = []
+    _collect_refs(schema, refs)
+    names = []
+    for ref in refs:
+        if not ref.startswith("#"):
+            names.append(ref)
+            continue
+        try:
+            name, _ = helpers.get_ref(ref=ref, schemas=schemas)
+        except exceptions.SchemaNotFoundError:
+            # The $ref is still part of the content of the schema
+            continue
+        names.append(name)
+    return names
+
+
+def _content(schema: typing.Any) -> str:
+    """Calculate the hash of the content of a schema."""
+    return _digest(json.dumps(schema, separators=(",", ":"), default=str))
+
+
+def _strongly_connected(
+    graph: typing.Dict[str, typing.List[str]]
+) -> typing.List[typing.List[str]]:
+    """
+    Calculate the strongly connected components of a graph.
+
+    Uses an iterative version of the algorithm of Tarjan so that long $ref chains do
+    not exceed the recursion limit.
+
+    Returns:
+        The components, where every component only references components before it.
+
+    """
+    index: typing.Dict[str, int] = {}
+    low: typing.Dict[str, int] = {}
+    stack: typing.List[str] = []
+    on_stack: typing.Set[str] = set()
+    components: typing.List[typing.List[str]] = []
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph[root]))]
+        while work:
+            node, successors = work[-1]
+            successor = next(successors, None)
+            if successor is not None:
+                if successor not in index:
+                    index[successor] = low[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(graph[successor])))
+                elif successor in on_stack:
+                    low[node] = min(low[node], index[successor])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(sorted(component))
+    return components
+
+
+def _digest(*values: str) -> str:
+    """Calculate the hash of values."""
+    sha = hashlib.sha256()
+    for value in values:
+        sha.update(value.encode())
+        sha.update(b"\0")
+    return sha.hexdigest()
+
+
+def fingerprints(spec: types.Schema) -> typing.Dict[str, str]:
+    """
+    Calculate a fingerprint for every schema of a specification.
+
+    The fingerprint of a schema is a hash of the schema and of every schema it
+    transitively references through $ref, including through allOf and the properties
+    of the schema and schemas in other files, which are loaded to calculate the
+    fingerprints. The fingerprint changes if any of those schemas change, including
+    the order of their keys, and is the same across processes.
+
+    Args:
+        spec: The specification.
+
+    Returns:
+        The fingerprint of every schema in components.schemas by name.
+
+    """
+    schemas: types.Schemas = spec.get("components", {}).get("schemas", {})
+    contents = {name: _content(schema) for name, schema in schemas.items()}
+    graph = {
+        name: _references(schema=schema, schemas=schemas)
+        for name, schema in schemas.items()
+    }
+
+    # The schemas in other files are part of the graph under their reference
+    pending = [ref for refs in graph.values() for ref in refs if ref not in graph]
+    while pending:
+        ref = pending.pop()
+        if ref in graph:
+            continue
+        try:
+            _, ref_schema = helpers.get_ref(ref=ref, schemas=schemas)
+        except exceptions.BaseError:
+            # The $ref is still part of the content of the schema
+            contents[ref] = _content(None)
+            graph[ref] = []
+            continue
+        contents[ref] = _content(ref_schema)
+        graph[ref] = _references(schema=ref_schema, schemas=schemas)
+        pending.extend(graph[ref])
+
+    # The schemas of a component reference each other, so they depend on the same
+    # schemas
+    result: typing.Dict[str, str] = {}
+    component_digests: typing.Dict[str, str] = {}
+    for component in _strongly_connected(graph):
+        members = set(component)
+        referenced = sorted(
+            {
+                component_digests[ref_name]
+                for name in component
+                for ref_name in graph[name]
+                if ref_name not in members
+            }
+        )
+        component_digest = _digest(
+            *(f"{name}={contents[name]}" for name in component), *referenced
+        )
+        for name in component:
+            component_digests[name] = component_digest
+            if name in schemas:
+                result[name] = _digest(contents[name], component_digest)
+    return result
+
+
+class Changes(typing.NamedTuple):
+    """The names of the schemas that differ between two versions of a specification."""
+
+    added: typing.Set[str]
+    removed: typing.Set[str]
+    changed: typing.Set[str]
+
+
+def changes(
+    *, previous: typing.Dict[str, str], current: typing.Dict[str, str]
+) -> Changes:
+    """
+    Compare the fingerprints of two versions of a specification.
+
+    Args:
+        previous: The fingerprints of the previous version.
+        current: The fingerprints of the current version.
+
+    Returns:
+        The names of the schemas that were added, removed or whose fingerprint changed.
+
+    """
+    return Changes(
+        added=current.keys() - previous.keys(),
+        removed=previous.keys() - current.keys(),
+        changed={
+            name
+            for name in current.keys() & previous.keys()
+            if current[name] != previous[name]
+        },
+    )
@@ -1,15 +1,32 @@
 """Generate model from OpenAPI schema."""
 
+import dataclasses
 import itertools
 import typing
 
 from . import column_factory
 from . import exceptions
+from . import facades
 from . import helpers
+from . import hooks
 from . import table_args
 from . import types
 from . import utility_base
 
+ClassVars = typing.List[typing.Tuple[str, typing.Any]]
+
+
+@dataclasses.dataclass
+class ModelArtifacts:
+    """Information required to construct a model."""
+
+    tablename: str
+    # The schema recorded on the model for from_dict and to_dict
+    schema: types.Schema
+    # The columns and relationships of the model
+    class_vars: ClassVars
+    table_args: types.TableArgsArtifacts
+
 
 def model_factory(
     *, name: str, base: typing.Type, schemas: types.Schemas
@@ -25,6 +42,22 @@ def model_factory(
     Returns:
         The model as a class.
 
+    """
+    artifacts = gather_artifacts(name=name, schemas=schemas)
+    return construct_model(name=name, base=base, artifacts=artifacts)
+
+
+def gather_artifacts(*, name: str, schemas: types.Schemas) -> ModelArtifacts:
+    """
+    Check the schema of a model and gather the artifacts required to construct it.
+
+    Args:
+        name: The name of the schema.
+        schemas: The OpenAPI schemas.
+
+    Returns:
+        The artifacts of the model.
+
     """
     # Input validation
     # Checking that name is in schemas
@@ -32,21 +65,16 @@ def model_factory(
         raise exceptions.SchemaNotFoundError(f"{name} not found in schemas")
     schema: types.Schema = schemas.get(name, {})
     # De-referencing schema
-    schema = helpers.prepare_schema(schema=schema, schemas=schemas)
-    # Checking for tablename key
-    if "x-tablename" not in schema:
-        raise exceptions.MalformedSchemaError(
-            f'"x-tablename" is a required schema property for {name}.'
-        )
-    # Checking for object type
-    if schema.get("type") != "object":
-        raise exceptions.FeatureNotImplementedError(
-            f"{schema.get('type')} is not supported in {name}."
-        )
-    if not schema.get("properties"):
-        raise exceptions.MalformedSchemaError(
-            f"At least 1 property is required for {name}."
+    if hooks.REGISTRY[hooks.BEFORE_PREPARE_SCHEMA]:
+        hooks.call(
+            hooks.BEFORE_PREPARE_SCHEMA, name=name, schema=schema, schemas=schemas
         )
+    schema = helpers.prepare_schema(schema=schema, schemas=schemas)
+    if hooks.REGISTRY[hooks.AFTER_PREPARE_SCHEMA]:
+        hooks.call(hooks.AFTER_PREPARE_SCHEMA, name=name, schema=schema)
+    tablename = check_tablename(name=name, schema=schema)
+    check_type(name=name, schema=schema)
+    check_properties(name=name, schema=schema)
 
     # Calculating the class variables for the model
     model_class_vars = []
@@ -58,28 +86,140 @@ def model_factory(
     if required_exists:
         model_schema["required"] = required_array
     for prop_name, prop_spec in schema.get("properties", []).items():
-        prop_class_vars, prop_final_spec = column_factory.column_factory(
-            spec=prop_spec,
+        prop_class_vars, prop_final_spec, dict_ignore = gather_property_artifacts(
+            name=name,
+            prop_name=prop_name,
+            prop_spec=prop_spec,
             schemas=schemas,
-            logical_name=prop_name,
             required=prop_name in required_set if required_exists else None,
-            model_schema=schema,
+            schema=schema,
         )
         model_class_vars.append(prop_class_vars)
-        dict_ignore = helpers.get_ext_prop(
-            source=prop_final_spec, name="x-dict-ignore", default=False, pop=True
-        )
         if not dict_ignore:
             model_schema["properties"][prop_name] = prop_final_spec
 
-    # Assembling model
-    return type(
+    return ModelArtifacts(
+        tablename=tablename,
+        # Sharing any part of the schema that is identical to that of another model
+        schema=helpers.intern.intern(model_schema),
+        class_vars=list(itertools.chain.from_iterable(model_class_vars)),
+        table_args=table_args.gather_artifacts(schema=schema),
+    )
+
+
+def check_tablename(*, name: str, schema: types.Schema) -> str:
+    """
+    Check that the prepared schema of a model has a tablename.
+
+    Args:
+        name: The name of the schema.
+        schema: The prepared schema of the model.
+
+    Returns:
+        The tablename.
+
+    """
+    tablename = helpers.get_ext_prop(source=schema, name="x-tablename")
+    if tablename is None:
+        raise exceptions.MalformedSchemaError(
+            f'"x-tablename" is a required schema property for {name}.'
+        )
+    return tablename
+
+
+def check_type(*, name: str, schema: types.Schema) -> None:
+    """Check that the prepared schema of a model is an object."""
+    if schema.get("type") != "object":
+        raise exceptions.FeatureNotImplementedError(
+            f"{schema.get('type')} is not supported in {name}."
+        )
+
+
+def check_properties(*, name: str, schema: types.Schema) -> None:
+    """Check that the prepared schema of a model has properties."""
+    if not schema.get("properties"):
+        raise exceptions.MalformedSchemaError(
+            f"At least 1 property is required for {name}."
+        )
+
+
+def gather_property_artifacts(
+    *,
+    name: str,
+    prop_name: str,
+    prop_spec: types.Schema,
+    schemas: types.Schemas,
+    required: typing.Optional[bool],
+    schema: types.Schema,
+) -> typing.Tuple[ClassVars, types.Schema, bool]:
+    """
+    Check a property of a model and gather its columns and relationships.
+
+    Args:
+        name: The name of the schema of the model.
+        prop_name: The name of the property.
+        prop_spec: The schema of the property.
+        schemas: The OpenAPI schemas.
+        required: Whether the property is required.
+        schema: The prepared schema of the model.
+
+    Returns:
+        The class variables for the property, the schema to record for it and whether
+        it is ignored by from_dict and to_dict.
+
+    """
+    prop_class_vars, prop_final_spec = column_factory.column_factory(
+        spec=prop_spec,
+        schemas=schemas,
+        logical_name=prop_name,
+        required=required,
+        model_schema=schema,
+    )
+    if hooks.REGISTRY[hooks.AFTER_COLUMN]:
+        hooks.call(
+            hooks.AFTER_COLUMN,
+            name=name,
+            logical_name=prop_name,
+            class_vars=prop_class_vars,
+            spec=prop_final_spec,
+        )
+    dict_ignore = helpers.get_ext_prop(
+        source=prop_final_spec, name="x-dict-ignore", default=False, pop=True
+    )
+    return prop_class_vars, prop_final_spec, bool(dict_ignore)
+
+
+def construct_model(
+    *, name: str, base: typing.Type, artifacts: ModelArtifacts
+) -> typing.Type:
+    """
+    Construct the model from its artifacts.
+
+    The columns and relationships of the artifacts are attached to the model and
+    cannot be used for any other model.
+
+    Args:
+        name: The name of the model.
+        base: The SQLAlchemy declarative base.
+        artifacts: The artifacts of the model.
+
+    Returns:
+        The model as a class.
+
+    """
+    model = type(
         name,
         (base, utility_base.UtilityBase),
         {
-            "__tablename__": helpers.get_ext_prop(source=schema, name="x-tablename"),
-            "_schema": model_schema,
-            **dict(itertools.chain.from_iterable(model_class_vars)),
-            "__table_args__": table_args.construct(schema=schema),
+            "__tablename__": artifacts.tablename,
+            "_schema": artifacts.schema,
+            "_models": facades.models.get_models(),
+            **dict(artifacts.class_vars),
+            "__table_args__": table_args.construct_artifacts(
+                artifacts=artifacts.table_args
+            ),
         },
     )
+    if hooks.REGISTRY[hooks.AFTER_MODEL]:
+        hooks.call(hooks.AFTER_MODEL, name=name, model=model)
+    return model
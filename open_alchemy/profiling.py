@@ -0,0 +1,209 @@
+"""Opt-in instrumentation of model construction."""
+
+import collections
+import contextlib
+import dataclasses
+import threading
+import time
+import typing
+
+# The calls that are counted
+PREPARE_SCHEMA = "prepare_schema"
+PEEK = "peek"
+GET_EXT_PROP = "get_ext_prop"
+COUNTED_CALLS = (PREPARE_SCHEMA, PEEK, GET_EXT_PROP)
+
+# The profile and model record bound to the current thread
+_ACTIVE = threading.local()
+
+
+@dataclasses.dataclass(frozen=True)
+class ForeignKeyFixUp:
+    """A foreign key a model required on another model for a relationship."""
+
+    # The name of the model the foreign key was added to
+    model: str
+    # The logical name of the foreign key column
+    column: str
+    # Whether the foreign key was added to an already constructed model rather than
+    # to its schema
+    constructed: bool
+
+
+@dataclasses.dataclass
+class ModelRecord:
+    """The measurements for constructing a model."""
+
+    name: str
+    seconds: float = 0.0
+    calls: typing.Counter[str] = dataclasses.field(default_factory=collections.Counter)
+    foreign_keys: typing.List[ForeignKeyFixUp] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class Profile:
+    """The measurements for all the models constructed while profiling."""
+
+    models: typing.List[ModelRecord] = dataclasses.field(default_factory=list)
+    # Calls made outside of the construction of a model, such as by define_all
+    other_calls: typing.Counter[str] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+    seconds: float = 0.0
+
+    def as_dict(self) -> typing.Dict[str, typing.Any]:
+        """
+        Convert the profile to a dictionary that can be serialized to JSON.
+
+        Returns:
+            The profile as a dictionary.
+
+        """
+        return {
+            "seconds": self.seconds,
+            "models": [
+                {
+                    "name": record.name,
+                    "seconds": record.seconds,
+                    "calls": {call: record.calls[call] for call in COUNTED_CALLS},
+                    "foreign_keys": [
+                        dataclasses.asdict(fix_up) for fix_up in record.foreign_keys
+                    ],
+                }
+                for record in self.models
+            ],
+            "other_calls": {call: self.other_calls[call] for call in COUNTED_CALLS},
+        }
+
+    def table(self) -> str:
+        """
+        Render the models as a table ordered by the time taken to construct them.
+
+        Returns:
+            The table.
+
+        """
+        headers = ("model", "seconds", *COUNTED_CALLS, "foreign keys")
+        rows = [
+            (
+                record.name,
+                f"{record.seconds:.6f}",
+                *(str(record.calls[call]) for call in COUNTED_CALLS),
+                str(len(record.foreign_keys)),
+            )
+            for record in sorted(
+                self.models, key=lambda record: record.seconds, reverse=True
+            )
+        ]
+        rows.append(
+            (
+                "total",
+                f"{self.seconds:.6f}",
+                *(
+                    str(
+                        sum(record.calls[call] for record in self.models)
+                        + self.other_calls[call]
+                    )
+                    for call in COUNTED_CALLS
+                ),
+                str(sum(len(record.foreign_keys) for record in self.models)),
+            )
+        )
+        widths = [
+            max(len(row[column]) for row in [headers, *rows])
+            for column in range(len(headers))
+        ]
+
+        def _format(row: typing.Sequence[str]) -> str:
+            """Align the first column to the left and the others to the right."""
+            return "  ".join(
+                value.ljust(width) if column == 0 else value.rjust(width)
+                for column, (value, width) in enumerate(zip(row, widths))
+            ).rstrip()
+
+        separator = "  ".join("-" * width for width in widths)
+        return "\n".join(
+            [_format(headers), separator]
+            + [_format(row) for row in rows[:-1]]
+            + [separator, _format(rows[-1])]
+        )
+
+
+@contextlib.contextmanager
+def profile() -> typing.Iterator[Profile]:
+    """
+    Profile the construction of models in the current thread.
+
+    Yields:
+        The profile that is filled in while the context is active.
+
+    """
+    previous = getattr(_ACTIVE, "profile", None)
+    active_profile = Profile()
+    _ACTIVE.profile = active_profile
+    start = time.perf_counter()
+    try:
+        yield active_profile
+    finally:
+        active_profile.seconds = time.perf_counter() - start
+        _ACTIVE.profile = previous
+
+
+@contextlib.contextmanager
+def record_model(*, name: str) -> typing.Iterator[None]:
+    """
+    Record the construction of a model if profiling is active.
+
+    Args:
+        name: The name of the model.
+
+    """
+    active_profile: typing.Optional[Profile] = getattr(_ACTIVE, "profile", None)
+    if active_profile is None:
+        yield
+        return
+
+    previous = getattr(_ACTIVE, "record", None)
+    record = ModelRecord(name=name)
+    _ACTIVE.record = record
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record.seconds = time.perf_counter() - start
+        _ACTIVE.record = previous
+        active_profile.models.append(record)
+
+
+def count(name: str) -> None:
+    """
+    Count a call if profiling is active.
+
+    Args:
+        name: The name of the call.
+
+    """
+    record: typing.Optional[ModelRecord] = getattr(_ACTIVE, "record", None)
+    if record is not None:
+        record.calls[name] += 1
+        return
+    active_profile: typing.Optional[Profile] = getattr(_ACTIVE, "profile", None)
+    if active_profile is not None:
+        active_profile.other_calls[name] += 1
+
+
+def record_foreign_key(*, model: str, column: str, constructed: bool) -> None:
+    """
+    Record a foreign key added for a relationship if profiling is active.
+
+    Args:
+        model: The name of the model the foreign key was added to.
+        column: The logical name of the foreign key column.
+        constructed: Whether the model had already been constructed.
+
+    """
+    record: typing.Optional[ModelRecord] = getattr(_ACTIVE, "record", None)
+    if record is not None:
+        record.foreign_keys.append(
+            ForeignKeyFixUp(model=model, column=column, constructed=constructed)
+        )
@@ -0,0 +1,217 @@
+"""Share the artifacts of models between model factories with different bases."""
+
+import dataclasses
+import threading
+import types as py_types
+import typing
+
+import sqlalchemy
+from sqlalchemy import orm
+
+from . import exceptions
+from . import facades
+from . import helpers
+from . import hooks
+from . import model_factory as _model_factory
+from . import types
+
+
+@dataclasses.dataclass
+class _Artifacts:
+    """The artifacts of a model that do not depend on the declarative base."""
+
+    # The schema of the model the artifacts were gathered from
+    source: types.Schema
+    model: _model_factory.ModelArtifacts
+    # The association tables required by the model by name
+    associations: typing.List[typing.Tuple[str, sqlalchemy.Table]]
+    # The names of the models that require a foreign key for the model
+    foreign_keys: typing.List[str]
+
+
+class SharedArtifacts:
+    """
+    Artifacts of models shared between model factories with different bases.
+
+    The artifacts of a model are gathered once, which includes preparing the schemas,
+    checking the extension properties and calculating the columns, relationships,
+    table args and any association tables. Model factories that share the artifacts
+    only construct the classes of the models and register the tables with the metadata
+    of their base.
+
+    The artifacts can only be shared between model factories for the same
+    specification.
+
+    """
+
+    def __init__(self) -> None:
+        """Construct."""
+        # The schemas of the specification and the copy the artifacts are gathered
+        # from
+        self._source: typing.Optional[types.Schemas] = None
+        self._schemas: typing.Optional[types.Schemas] = None
+        self._artifacts: typing.Dict[str, _Artifacts] = {}
+        self._lock = threading.RLock()
+
+    def get(self, *, name: str, schemas: types.Schemas) -> _Artifacts:
+        """
+        Get the artifacts of a model, gathering them if required.
+
+        Raise MalformedSpecificationError if the artifacts were gathered for different
+        schemas.
+
+        Args:
+            name: The name of the model.
+            schemas: The OpenAPI schemas.
+
+        Returns:
+            The artifacts of the model.
+
+        """
+        with self._lock:
+            if self._schemas is None:
+                self._source = schemas
+                # Foreign keys required by the models replace the schemas they are
+                # added to in a copy of the schemas so that the specification is not
+                # modified
+                self._schemas = dict(schemas)
+            elif self._source is not schemas:
+                raise exceptions.MalformedSpecificationError(
+                    "Shared artifacts can only be used with a single specification."
+                )
+            schemas = self._schemas
+
+            artifacts = self._artifacts.get(name)
+            # The schema of a model is replaced when another model adds a foreign key
+            if artifacts is None or artifacts.source is not schemas.get(name):
+                artifacts = _gather_artifacts(name=name, schemas=schemas)
+                self._artifacts[name] = artifacts
+            return artifacts
+
+
+def _gather_artifacts(*, name: str, schemas: types.Schemas) -> _Artifacts:
+    """
+    Gather the artifacts of a model independently of any base.
+
+    The artifacts are gathered against a namespace without any models so that any
+    foreign key required on another model is added to the schemas and any association
+    table is recorded instead of being registered on the metadata of a base.
+
+    Args:
+        name: The name of the model.
+        schemas: The OpenAPI schemas.
+
+    Returns:
+        The artifacts of the model.
+
+    """
+    previous_schemas = dict(schemas)
+    namespace = py_types.SimpleNamespace(
+        Base=py_types.SimpleNamespace(metadata=sqlalchemy.MetaData())
+    )
+    # The association tables are registered for each base, which is when their hooks
+    # are called
+    with facades.models.bind(models=namespace), hooks.suppressed(
+        hooks.AFTER_ASSOCIATION
+    ):
+        model_artifacts = _model_factory.gather_artifacts(name=name, schemas=schemas)
+
+    associations = [
+        (association_name, table)
+        for association_name, table in vars(namespace).items()
+        if isinstance(table, sqlalchemy.Table)
+    ]
+    foreign_keys = [
+        ref_name
+        for ref_name, ref_schema in schemas.items()
+        if ref_name != name and previous_schemas.get(ref_name) is not ref_schema
+    ]
+    return _Artifacts(
+        source=schemas[name],
+        model=model_artifacts,
+        associations=associations,
+        foreign_keys=foreign_keys,
+    )
+
+
+def _copy_column(column: sqlalchemy.Column) -> sqlalchemy.Column:
+    """Copy a column that is not attached to a table."""
+    # Column.copy is deprecated in favour of Column._copy from SQLAlchemy 1.4
+    copy = getattr(column, "_copy", None)
+    if copy is None:  # pragma: no cover
+        copy = column.copy
+    return copy()
+
+
+def _copy_table(
+    table: sqlalchemy.Table, *, metadata: sqlalchemy.MetaData
+) -> sqlalchemy.Table:
+    """Copy a table to other metadata."""
+    # Table.tometadata is deprecated in favour of Table.to_metadata from SQLAlchemy 1.4
+    to_metadata = getattr(table, "to_metadata", None)
+    if to_metadata is None:  # pragma: no cover
+        to_metadata = table.tometadata
+    return to_metadata(metadata)
+
+
+def _copy_class_var(value: typing.Any) -> typing.Any:
+    """Copy a column or relationship so that it can be attached to another model."""
+    if isinstance(value, sqlalchemy.Column):
+        return _copy_column(value)
+    if isinstance(value, orm.RelationshipProperty):
+        return helpers.relationships.copy(value)
+    return value
+
+
+def model_factory(
+    *,
+    name: str,
+    base: typing.Type,
+    schemas: types.Schemas,
+    shared_artifacts: SharedArtifacts,
+) -> typing.Type:
+    """
+    Construct a model using the shared artifacts.
+
+    Args:
+        name: The name of the schema.
+        base: The SQLAlchemy declarative base.
+        schemas: The OpenAPI schemas.
+        shared_artifacts: The artifacts shared between bases.
+
+    Returns:
+        The model as a class.
+
+    """
+    artifacts = shared_artifacts.get(name=name, schemas=schemas)
+    model = _model_factory.construct_model(
+        name=name,
+        base=base,
+        artifacts=dataclasses.replace(
+            artifacts.model,
+            class_vars=[
+                (var_name, _copy_class_var(value))
+                for var_name, value in artifacts.model.class_vars
+            ],
+        ),
+    )
+
+    # Registering association tables with the metadata of the base
+    for association_name, table in artifacts.associations:
+        facades.models.set_association(
+            table=_copy_table(table, metadata=base.metadata), name=association_name
+        )
+
+    # Adding foreign keys to models that were constructed before the model
+    for ref_name in artifacts.foreign_keys:
+        ref_model: typing.Optional[typing.Type] = facades.models.get_model(
+            name=ref_name
+        )
+        if ref_model is None:
+            continue
+        ref_artifacts = shared_artifacts.get(name=ref_name, schemas=schemas)
+        for var_name, value in ref_artifacts.model.class_vars:
+            if not hasattr(ref_model, var_name):
+                setattr(ref_model, var_name, _copy_class_var(value))
+
+    return model
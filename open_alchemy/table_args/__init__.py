@@ -14,30 +14,65 @@ TableArg = typing.Union[sa_schema.UniqueConstraint, sa_schema.Index]
 TableArgs = typing.Tuple[TableArg, ...]
 
 
-def construct(*, schema: types.Schema) -> TableArgs:
+def gather_artifacts(*, schema: types.Schema) -> types.TableArgsArtifacts:
     """
-    Construct any table args from the object schema.
+    Gather the artifacts required to construct the table args from the object schema.
 
-    Look for x-composite-unique and x-composite-index keys in the schema and construct
-    any unique constraints and indexes based on their value.
+    Look for x-composite-unique and x-composite-index keys in the schema and convert
+    their value to a list of unique constraints and indexes, respectively.
 
     Args:
         schema: The schema for the object.
 
     Returns:
-        A tuple with any unique constraints and indexes.
+        The unique constraints and indexes to construct.
 
     """
-    # Keep track of any table arguments
-    table_args: typing.List[typing.Iterable[TableArg]] = []
+    artifacts = types.TableArgsArtifacts()
 
     # Handle x-composite-unique
     unique_spec = helpers.get_ext_prop(source=schema, name="x-composite-unique")
     if unique_spec is not None:
-        table_args.append(factory.unique_factory(spec=unique_spec))
+        artifacts.uniques = factory.map_unique(spec=unique_spec)
     # Handle x-composite-index
     index_spec = helpers.get_ext_prop(source=schema, name="x-composite-index")
     if index_spec is not None:
-        table_args.append(factory.index_factory(spec=index_spec))
+        artifacts.indexes = factory.map_index(spec=index_spec)
+
+    return artifacts
+
+
+def construct_artifacts(*, artifacts: types.TableArgsArtifacts) -> TableArgs:
+    """
+    Construct the table args from their artifacts.
+
+    Args:
+        artifacts: The unique constraints and indexes to construct.
+
+    Returns:
+        A tuple with any unique constraints and indexes.
+
+    """
+    return tuple(
+        itertools.chain(
+            map(factory.construct_unique, artifacts.uniques),
+            map(factory.construct_index, artifacts.indexes),
+        )
+    )
 
-    return tuple(itertools.chain.from_iterable(table_args))
+
+def construct(*, schema: types.Schema) -> TableArgs:
+    """
+    Construct any table args from the object schema.
+
+    Look for x-composite-unique and x-composite-index keys in the schema and construct
+    any unique constraints and indexes based on their value.
+
+    Args:
+        schema: The schema for the object.
+
+    Returns:
+        A tuple with any unique constraints and indexes.
+
+    """
+    return construct_artifacts(artifacts=gather_artifacts(schema=schema))
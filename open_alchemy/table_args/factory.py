@@ -1,24 +1,73 @@
 """Create table args such as Uniques and Index."""
 
 import functools
-import json
-import os
 import typing
 
-import jsonschema
 from sqlalchemy import schema
 
 from open_alchemy import exceptions
 from open_alchemy import types
+from open_alchemy.helpers.get_ext_prop import schemas as ext_prop_schemas
+
+
+def _is_string(value: typing.Any) -> bool:
+    """Check whether a value is a JSON string."""
+    return isinstance(value, str)
+
+
+def _is_boolean(value: typing.Any) -> bool:
+    """Check whether a value is a JSON boolean."""
+    return isinstance(value, bool)
+
+
+def _is_array(value: typing.Any, *, check: typing.Callable[[typing.Any], bool]) -> bool:
+    """Check whether a value is a non-empty JSON array whose items pass a check."""
+    return isinstance(value, list) and bool(value) and all(map(check, value))
 
-_DIRECTORY = os.path.dirname(__file__)
-_PATHS = ("..", "helpers", "get_ext_prop")
-_COMMON_SCHEMAS_FILE = os.path.join(_DIRECTORY, *_PATHS, "common-schemas.json")
-with open(_COMMON_SCHEMAS_FILE) as in_file:
-    _COMMON_SCHEMAS = json.load(in_file)
-_resolver = jsonschema.RefResolver.from_schema(  # pylint: disable=invalid-name
-    _COMMON_SCHEMAS
-)
+
+def _is_optional(
+    value: typing.Dict[str, typing.Any],
+    key: str,
+    *,
+    check: typing.Callable[[typing.Any], bool],
+) -> bool:
+    """Check whether a JSON object does not have a key or its value passes a check."""
+    return key not in value or check(value[key])
+
+
+_is_column_list = functools.partial(_is_array, check=_is_string)
+
+
+def _is_unique(value: typing.Any) -> bool:
+    """Check whether a value matches the Unique schema."""
+    return (
+        isinstance(value, dict)
+        and "columns" in value
+        and _is_column_list(value["columns"])
+        and _is_optional(value, "name", check=_is_string)
+    )
+
+
+def _is_index(value: typing.Any) -> bool:
+    """Check whether a value matches the Index schema."""
+    return (
+        isinstance(value, dict)
+        and "expressions" in value
+        and _is_column_list(value["expressions"])
+        and _is_optional(value, "name", check=_is_string)
+        and _is_optional(value, "unique", check=_is_boolean)
+    )
+
+
+# The checks for the schemas defined in common-schemas.json
+_SCHEMA_CHECKS: typing.Dict[str, typing.Callable[[typing.Any], bool]] = {
+    "ColumnList": _is_column_list,
+    "ColumnListList": functools.partial(_is_array, check=_is_column_list),
+    "Unique": _is_unique,
+    "UniqueList": functools.partial(_is_array, check=_is_unique),
+    "Index": _is_index,
+    "IndexList": functools.partial(_is_array, check=_is_index),
+}
 
 
 def _spec_to_schema_name(
@@ -28,7 +77,8 @@ def _spec_to_schema_name(
     Convert a specification to the name of the matched schema.
 
     Use the schema names defined in common-schemas.json to find the first matching
-    schema.
+    schema. The shape of the specification is checked directly rather than validating
+    it against each schema in turn.
 
     Args:
         spec: The specification to convert.
@@ -39,16 +89,11 @@ def _spec_to_schema_name(
 
     """
     if schema_names is None:
-        schema_names = _COMMON_SCHEMAS.keys()
+        schema_names = list(_SCHEMA_CHECKS.keys())
 
     for name in schema_names:
-        try:
-            jsonschema.validate(
-                instance=spec, schema=_COMMON_SCHEMAS[name], resolver=_resolver
-            )
+        if _SCHEMA_CHECKS[name](spec):
             return name
-        except jsonschema.ValidationError:
-            continue
     raise exceptions.SchemaNotFoundError("Specification did not match any schemas.")
 
 
@@ -65,22 +110,13 @@ _ix_handle_column_list = functools.partial(  # pylint: disable=invalid-name
     _handle_column_list, property_name="expressions"
 )
 
-# Schema names for unique constraints and index
-_SCHEMAS_FILE = os.path.join(_DIRECTORY, *_PATHS, "extension-schemas.json")
-with open(_SCHEMAS_FILE) as in_file:
-    _SCHEMAS = json.load(in_file)
-_UNIQUE_SCHEMA_NAMES: typing.List[str] = list(
-    map(
-        lambda schema: schema["$ref"].split("/")[-1],
-        _SCHEMAS["x-composite-unique"]["oneOf"],
-    )
-)
-_INDEX_SCHEMA_NAMES: typing.List[str] = list(
-    map(
-        lambda schema: schema["$ref"].split("/")[-1],
-        _SCHEMAS["x-composite-index"]["oneOf"],
-    )
-)
+
+@functools.lru_cache(maxsize=None)
+def _schema_names(ext_prop: str) -> typing.List[str]:
+    """Get the names of the schemas an extension property can match in order."""
+    ext_prop_schema = ext_prop_schemas.extension_schemas()[ext_prop]
+    return [ref["$ref"].split("/")[-1] for ref in ext_prop_schema["oneOf"]]
+
 
 # Unique and index name to conversion function
 _UNIQUE_MAPPING: typing.Dict[str, typing.Callable[..., types.UniqueList]] = {
@@ -97,7 +133,7 @@ _INDEX_MAPPING: typing.Dict[str, typing.Callable[..., types.IndexList]] = {
 }
 
 
-def _map_unique(*, spec: types.AnyUnique) -> types.UniqueList:
+def map_unique(*, spec: types.AnyUnique) -> types.UniqueList:
     """
     Convert any unique constraint to UniqueList.
 
@@ -108,11 +144,13 @@ def _map_unique(*, spec: types.AnyUnique) -> types.UniqueList:
         The UniqueList.
 
     """
-    name = _spec_to_schema_name(spec=spec, schema_names=_UNIQUE_SCHEMA_NAMES)
+    name = _spec_to_schema_name(
+        spec=spec, schema_names=_schema_names("x-composite-unique")
+    )
     return _UNIQUE_MAPPING[name](spec)
 
 
-def _map_index(*, spec: types.AnyIndex) -> types.IndexList:
+def map_index(*, spec: types.AnyIndex) -> types.IndexList:
     """
     Convert any composite index to IndexList.
 
@@ -123,11 +161,13 @@ def _map_index(*, spec: types.AnyIndex) -> types.IndexList:
         The IndexList.
 
     """
-    name = _spec_to_schema_name(spec=spec, schema_names=_INDEX_SCHEMA_NAMES)
+    name = _spec_to_schema_name(
+        spec=spec, schema_names=_schema_names("x-composite-index")
+    )
     return _INDEX_MAPPING[name](spec)
 
 
-def _construct_unique(spec: types.Unique) -> schema.UniqueConstraint:
+def construct_unique(spec: types.Unique) -> schema.UniqueConstraint:
     """
     Construct unique constraints.
 
@@ -141,7 +181,7 @@ def _construct_unique(spec: types.Unique) -> schema.UniqueConstraint:
     return schema.UniqueConstraint(*spec["columns"], name=spec.get("name"))
 
 
-def _construct_index(spec: types.Index) -> schema.Index:
+def construct_index(spec: types.Index) -> schema.Index:
     """
     Construct composite index.
 
@@ -170,8 +210,8 @@ def unique_factory(
         The unique constraints.
 
     """
-    mapped_spec = _map_unique(spec=spec)
-    return map(_construct_unique, mapped_spec)
+    mapped_spec = map_unique(spec=spec)
+    return map(construct_unique, mapped_spec)
 
 
 def index_factory(*, spec: types.AnyUnique) -> typing.Iterator[schema.Index]:
@@ -185,5 +225,5 @@ def index_factory(*, spec: types.AnyUnique) -> typing.Iterator[schema.Index]:
         The composite indexes.
 
     """
-    mapped_spec = _map_index(spec=spec)
-    return map(_construct_index, mapped_spec)
+    mapped_spec = map_index(spec=spec)
+    return map(construct_index, mapped_spec)
@@ -1,6 +1,7 @@
 """Types shared across modules."""
 
 import dataclasses
+import reprlib
 import typing
 
 try:
@@ -16,6 +17,8 @@ except ImportError:  # pragma: no cover
 Schema = typing.Dict[str, typing.Any]
 Schemas = typing.Dict[str, Schema]
 AllOfSpec = typing.List[Schema]
+# Glob patterns of schema names
+Patterns = typing.Sequence[str]
 
 
 class ModelFactory(Protocol):
@@ -26,6 +29,27 @@ class ModelFactory(Protocol):
         ...
 
 
+class DictionaryError(typing.NamedTuple):
+    """A way in which a dictionary passed to from_dict does not satisfy the schema."""
+
+    # The keys and indexes from the dictionary to the value
+    path: typing.Tuple[typing.Union[str, int], ...]
+    # The keyword of the schema that the value does not satisfy
+    keyword: str
+    # The value of the keyword in the schema
+    expected: typing.Any
+    # The value that does not satisfy the keyword
+    value: typing.Any
+
+    def __str__(self) -> str:
+        """Render the error, abbreviating large values."""
+        path = "/".join(map(str, self.path)) or "the dictionary"
+        return (
+            f"{path} does not satisfy {self.keyword} "
+            f"{reprlib.repr(self.expected)}, the value is {reprlib.repr(self.value)}"
+        )
+
+
 # Unique consraint types
 ColumnList = typing.List[str]
 ColumnListList = typing.List[ColumnList]
@@ -38,9 +62,26 @@ IndexList = typing.List[Index]
 AnyIndex = typing.Union[ColumnList, ColumnListList, Index, IndexList]
 
 
+@dataclasses.dataclass
+class TableArgsArtifacts:
+    """Information required to construct the table args of a model."""
+
+    uniques: UniqueList = dataclasses.field(default_factory=list)
+    indexes: IndexList = dataclasses.field(default_factory=list)
+
+
 _ColumnSchemaBase = TypedDict(  # pylint: disable=invalid-name
     "_ColumnSchemaBase",
-    {"x-dict-ignore": bool, "format": str, "maxLength": int, "nullable": bool},
+    {
+        "x-dict-ignore": bool,
+        "x-json": bool,
+        "x-enum-code": bool,
+        "enum": typing.List[str],
+        "format": str,
+        "items": typing.Dict[str, typing.Any],
+        "maxLength": int,
+        "nullable": bool,
+    },
     total=False,
 )
 
@@ -60,6 +101,7 @@ class ColumnArtifacts:
     format: typing.Optional[str] = None
     max_length: typing.Optional[int] = None
     nullable: bool = True
+    enum: typing.Optional[typing.List[str]] = None
 
     # Extension properties
     primary_key: typing.Optional[bool] = None
@@ -67,3 +109,11 @@ class ColumnArtifacts:
     index: typing.Optional[bool] = None
     unique: typing.Optional[bool] = None
     foreign_key: typing.Optional[str] = None
+    json: typing.Optional[bool] = None
+    enum_code: typing.Optional[bool] = None
+
+    # The name of the type of enum columns
+    enum_name: typing.Optional[str] = None
+
+    # The artifacts of the items of arrays of primitive types
+    items: typing.Optional["ColumnArtifacts"] = None
@@ -2,11 +2,12 @@
 
 import datetime
 import functools
+import itertools
 import json
 import typing
+import uuid
 
-import jsonschema
-
+from . import batch
 from . import exceptions
 from . import facades
 from . import helpers
@@ -22,8 +23,18 @@ class UtilityBase:
     # Record of the schema used to construct the model. Myst be an object type. For all
     # columns any $ref must be resolved an allOf must be merged for all. Objects must
     # be recorded as a free-form object and have a x-de-$ref extension property with
-    # the de-referenced name of the schema.
+    # the de-referenced name of the schema. The schemas of constructed models cannot be
+    # modified since any part of them may be shared with other models.
     _schema: types.Schema
+    # The namespace the model was registered on and from which any referenced models
+    # are retrieved. None means open_alchemy.models.
+    _models: typing.Any = None
+    # Static method that returns whether a dictionary is a valid instance of the
+    # schema. None means that jsonschema is used to validate the dictionary.
+    _validate: typing.Optional[typing.Callable[[typing.Any], bool]] = None
+    # Whether from_dict reports all the ways in which a dictionary does not satisfy
+    # the schema instead of only the first.
+    _collect_all_errors: bool = False
 
     def __init__(self, **kwargs: typing.Any) -> None:
         """Construct."""
@@ -69,9 +80,9 @@ class UtilityBase:
             )
         return properties
 
-    @staticmethod
+    @classmethod
     def _get_model(
-        *, spec: types.Schema, name: str, schema: types.Schema
+        cls, *, spec: types.Schema, name: str, schema: types.Schema
     ) -> typing.Type[TUtilityBase]:
         """Get the model based on the schema."""
         ref_model_name = helpers.get_ext_prop(source=spec, name="x-de-$ref")
@@ -84,10 +95,11 @@ class UtilityBase:
                 f"The model schema is {json.dumps(schema)}."
             )
         # Try to get model
-        ref_model: TOptUtilityBase = facades.models.get_model(name=ref_model_name)
+        with facades.models.bind(models=cls._models):
+            ref_model: TOptUtilityBase = facades.models.get_model(name=ref_model_name)
         if ref_model is None:
             raise exceptions.SchemaNotFoundError(
-                f"The {ref_model_name} model was not found on open_alchemy.models."
+                f"The {ref_model_name} model was not found on the models."
             )
         return ref_model
 
@@ -98,13 +110,99 @@ class UtilityBase:
         """Construct model from dictionary."""
         return model.from_dict(**kwargs)
 
+    @classmethod
+    def _schema_errors(
+        cls, instance: typing.Any, *, schema: types.Schema
+    ) -> typing.List[types.DictionaryError]:
+        """Calculate the ways in which an instance does not satisfy the schema."""
+        # The compiled validator makes the same decisions as jsonschema and is only
+        # used to skip jsonschema for valid instances
+        if cls._validate is not None and cls._validate(  # pylint: disable=not-callable
+            instance
+        ):
+            return []
+
+        # Importing jsonschema is slow, so it is only imported when it is needed
+        import jsonschema  # pylint: disable=import-outside-toplevel
+
+        validator = jsonschema.validators.validator_for(schema)(schema)
+        errors = validator.iter_errors(instance)
+        if not cls._collect_all_errors:
+            errors = itertools.islice(errors, 1)
+        return [
+            types.DictionaryError(
+                path=tuple(error.absolute_path),
+                keyword=error.validator,
+                expected=error.validator_value,
+                value=error.instance,
+            )
+            for error in errors
+        ]
+
+    @classmethod
+    def _dict_errors(
+        cls, kwargs: typing.Dict[str, typing.Any], *, schema: types.Schema
+    ) -> typing.List[types.DictionaryError]:
+        """
+        Calculate the ways in which a dictionary does not satisfy the model schema.
+
+        Only the first error is calculated unless _collect_all_errors is set.
+
+        Raise MalformedSchemaError if the schema does not have any properties.
+
+        Args:
+            kwargs: The dictionary passed to from_dict.
+            schema: The model schema.
+
+        Returns:
+            The errors.
+
+        """
+        errors = cls._schema_errors(kwargs, schema=schema)
+        if errors and not cls._collect_all_errors:
+            return errors
+
+        properties = cls._get_properties()
+        for name, value in kwargs.items():
+            spec = properties.get(name)
+            if spec is None:
+                errors.append(
+                    types.DictionaryError(
+                        path=(name,),
+                        keyword="additionalProperties",
+                        expected=False,
+                        value=value,
+                    )
+                )
+            elif spec.get("readOnly") is True:
+                errors.append(
+                    types.DictionaryError(
+                        path=(name,), keyword="readOnly", expected=True, value=value
+                    )
+                )
+            if errors and not cls._collect_all_errors:
+                break
+        return errors
+
+    @staticmethod
+    def _nested_error(
+        exc: exceptions.MalformedModelDictionaryError, *path: typing.Union[str, int]
+    ) -> exceptions.MalformedModelDictionaryError:
+        """Prefix the paths of the errors raised for a nested dictionary."""
+        return exceptions.MalformedModelDictionaryError(
+            *exc.args,
+            errors=[error._replace(path=(*path, *error.path)) for error in exc.errors],
+        )
+
     @classmethod
     def from_dict(cls: typing.Type[TUtilityBase], **kwargs: typing.Any) -> TUtilityBase:
         """
         Construct model instance from a dictionary.
 
         Raise MalformedModelDictionaryError when the dictionary does not satisfy the
-        model schema.
+        model schema. The errors of the exception describe the first way in which the
+        dictionary does not satisfy the schema, or all of them if _collect_all_errors
+        is set on the model.
 
         Args:
             kwargs: The values to construct the class with.
@@ -115,39 +213,16 @@ class UtilityBase:
         """
         # Check dictionary
         schema = cls._get_schema()
-        try:
-            jsonschema.validate(instance=kwargs, schema=schema)
-        except jsonschema.ValidationError:
-            raise exceptions.MalformedModelDictionaryError(
-                "The dictionary passed to from_dict is not a valid instance of the "
-                "model schema. "
-                f"The expected schema is {json.dumps(schema)}. "
-                f"The given value is {json.dumps(kwargs)}."
-            )
+        errors = cls._dict_errors(kwargs, schema=schema)
+        if errors:
+            raise exceptions.MalformedModelDictionaryError(errors=errors)
 
         # Assemble dictionary for construction
         properties = cls._get_properties()
         model_dict: typing.Dict[str, typing.Any] = {}
         for name, value in kwargs.items():
             # Get the specification and type of the property
-            spec = properties.get(name)
-            if spec is None:
-                raise exceptions.MalformedModelDictionaryError(
-                    "A parameter was passed in that is not a property in the model "
-                    "schema. "
-                    f"The parameter is {name}. "
-                    f"The model schema is {json.dumps(schema)}."
-                )
-
-            # Check readOnly
-            read_only = spec.get("readOnly")
-            if read_only is True:
-                raise exceptions.MalformedModelDictionaryError(
-                    "A parameter was passed in that is marked as readOnly in the "
-                    "schema. "
-                    f"The parameter is {name}. "
-                    f"The model schema is {json.dumps(schema)}."
-                )
+            spec = properties[name]
 
             # Check type
             type_ = spec.get("type")
@@ -157,11 +232,19 @@ class UtilityBase:
                     f"The schema for the {name} property does not have a type."
                 )
 
+            # Handle values stored in a JSON column
+            if spec.get("x-json"):
+                model_dict[name] = value
+                continue
+
             # Handle object
             ref_model: typing.Type[TUtilityBase]
             if type_ == "object":
                 ref_model = cls._get_model(spec=spec, name=name, schema=schema)
-                ref_model_instance = cls._from_dict(value, model=ref_model)
+                try:
+                    ref_model_instance = cls._from_dict(value, model=ref_model)
+                except exceptions.MalformedModelDictionaryError as exc:
+                    raise cls._nested_error(exc, name) from exc
                 model_dict[name] = ref_model_instance
                 continue
 
@@ -175,16 +258,42 @@ class UtilityBase:
                         f"The property is {name}. "
                         f"The model schema is {json.dumps(schema)}."
                     )
+                # Arrays of primitive types are stored in a column
+                if item_spec.get("type") != "object":
+                    model_dict[name] = value
+                    continue
                 ref_model = cls._get_model(spec=item_spec, name=name, schema=schema)
-                model_from_dict = functools.partial(cls._from_dict, model=ref_model)
-                ref_model_instances = map(model_from_dict, value)
-                model_dict[name] = list(ref_model_instances)
+                ref_model_instances = []
+                for index, item in enumerate(value):
+                    try:
+                        ref_model_instances.append(
+                            cls._from_dict(item, model=ref_model)
+                        )
+                    except exceptions.MalformedModelDictionaryError as exc:
+                        raise cls._nested_error(exc, name, index) from exc
+                model_dict[name] = ref_model_instances
                 continue
 
             # Handle other types
             if format_ == "date-time":
                 model_dict[name] = datetime.datetime.fromisoformat(value)
                 continue
+            if format_ == "uuid":
+                # jsonschema does not check the uuid format
+                try:
+                    model_dict[name] = uuid.UUID(value)
+                except ValueError as exc:
+                    raise exceptions.MalformedModelDictionaryError(
+                        errors=[
+                            types.DictionaryError(
+                                path=(name,),
+                                keyword="format",
+                                expected=format_,
+                                value=value,
+                            )
+                        ]
+                    ) from exc
+                continue
             model_dict[name] = value
 
         return cls(**model_dict)
@@ -271,6 +380,10 @@ class UtilityBase:
                 f"a type. The {schema_descriptor} schema is {json.dumps(spec)}."
             )
 
+        # Handle values stored in a JSON column
+        if spec.get("x-json"):
+            return value
+
         # Handle array
         if type_ == "array":
             if array_context:
@@ -306,6 +419,8 @@ class UtilityBase:
         # Handle other types
         if format_ == "date-time":
             return value.isoformat()
+        if format_ == "uuid":
+            return str(value)
         return value
 
     def to_dict(self) -> typing.Dict[str, typing.Any]:
@@ -330,3 +445,102 @@ class UtilityBase:
             )
 
         return return_dict
+
+    async def to_dict_async(
+        self, *, session: typing.Any
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Convert model instance to dictionary using an asynchronous session.
+
+        The relationships that to_dict returns are loaded in batches first, see
+        to_dicts_async.
+
+        Args:
+            session: The AsyncSession of the instance.
+
+        Returns:
+            The dictionary representation of the model.
+
+        """
+        (return_dict,) = await self.to_dicts_async([self], session=session)
+        return return_dict
+
+    @staticmethod
+    async def to_dicts_async(
+        instances: typing.Sequence["UtilityBase"],
+        *,
+        session: typing.Any,
+        batch_size: int = batch.BATCH_SIZE,
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Convert model instances to dictionaries using an asynchronous session.
+
+        Relationships cannot be loaded implicitly when they are accessed with an
+        asynchronous session. The relationships that to_dict returns that are not
+        loaded yet are loaded first, with one query per relationship and batch of
+        instances, after which the instances are converted.
+
+        Args:
+            instances: The instances to convert.
+            session: The AsyncSession of the instances.
+            batch_size: The maximum number of instances loaded by a query.
+
+        Returns:
+            The dictionary representations of the instances.
+
+        """
+        return await session.run_sync(batch.to_dicts, instances, batch_size=batch_size)
+
+    @classmethod
+    async def bulk_insert_async(
+        cls: typing.Type[TUtilityBase],
+        dicts: typing.Sequence[typing.Dict[str, typing.Any]],
+        *,
+        session: typing.Any,
+    ) -> typing.List[TUtilityBase]:
+        """
+        Construct instances from dictionaries and insert them using an async session.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the
+        model schema.
+
+        Args:
+            dicts: The dictionaries to construct the instances with using from_dict.
+            session: The AsyncSession to insert the instances with.
+
+        Returns:
+            The inserted instances.
+
+        """
+        instances = [cls.from_dict(**model_dict) for model_dict in dicts]
+        session.add_all(instances)
+        await session.flush()
+        return instances
+
+    @classmethod
+    async def bulk_upsert_async(
+        cls: typing.Type[TUtilityBase],
+        dicts: typing.Sequence[typing.Dict[str, typing.Any]],
+        *,
+        session: typing.Any,
+        batch_size: int = batch.BATCH_SIZE,
+    ) -> typing.List[TUtilityBase]:
+        """
+        Insert or update instances constructed from dictionaries using an async session.
+
+        Whether the row of an instance exists is checked with one query per batch of
+        primary keys. The dictionaries must have distinct primary keys.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the
+        model schema.
+
+        Args:
+            dicts: The dictionaries to construct the instances with using from_dict.
+            session: The AsyncSession to insert or update the instances with.
+            batch_size: The maximum number of rows loaded by a query.
+
+        Returns:
+            The instances in the session in the order of the dictionaries.
+
+        """
+        return await session.run_sync(batch.upsert, cls, dicts, batch_size=batch_size)
@@ -0,0 +1,461 @@
+"""Validate the models of a specification without constructing them."""
+
+import concurrent.futures
+import dataclasses
+import functools
+import os
+import types as py_types
+import typing
+
+import sqlalchemy
+
+from . import exceptions
+from . import facades
+from . import helpers
+from . import hooks
+from . import model_factory
+from . import table_args
+from . import types
+from .helpers.define_all import is_model
+
+
+@dataclasses.dataclass(frozen=True)
+class SchemaError:
+    """An error found in the schema of a model."""
+
+    # The name of the schema of the model
+    name: str
+    # The name of the exception that was raised for the schema
+    error: str
+    message: str
+    # The JSON pointer to the part of the specification with the error
+    pointer: typing.Optional[str] = None
+
+    def __str__(self) -> str:
+        """Render the error as a single line."""
+        location = self.name if self.pointer is None else self.pointer
+        return f"{location}: {self.error}: {self.message}"
+
+
+@dataclasses.dataclass
+class ValidationReport:
+    """The errors found in all the schemas of a specification."""
+
+    errors: typing.List[SchemaError] = dataclasses.field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """Whether no errors were found."""
+        return not self.errors
+
+    def __str__(self) -> str:
+        """Render the report with one error per line."""
+        if self.valid:
+            return "No errors found."
+        return "\n".join(
+            [f"{len(self.errors)} error(s) found:"]
+            + [str(error) for error in self.errors]
+        )
+
+
+def check_schema(*, name: str, schemas: types.Schemas) -> typing.Optional[SchemaError]:
+    """
+    Run the checks done when constructing a model without constructing it.
+
+    The schemas are not modified, nothing is set on open_alchemy.models and no hooks
+    are called.
+
+    Args:
+        name: The name of the schema of the model.
+        schemas: All the schemas.
+
+    Returns:
+        The error found in the schema or None if the schema is valid.
+
+    """
+    # Foreign keys required by the model replace the schemas they are added to
+    schemas = dict(schemas)
+    namespace = py_types.SimpleNamespace(
+        Base=py_types.SimpleNamespace(metadata=sqlalchemy.MetaData())
+    )
+    try:
+        with facades.models.bind(models=namespace), hooks.suppressed():
+            model_factory.gather_artifacts(name=name, schemas=schemas)
+    except exceptions.BaseError as exc:
+        return SchemaError(name=name, error=type(exc).__name__, message=str(exc))
+    return None
+
+
+def _pointer(*tokens: str) -> str:
+    """Construct a JSON pointer from its reference tokens."""
+    return "".join(
+        "/" + token.replace("~", "~0").replace("/", "~1") for token in tokens
+    )
+
+
+def _property_tokens(
+    *, tokens: typing.List[str], schema: types.Schema, schemas: types.Schemas, prop: str
+) -> typing.Optional[typing.List[str]]:
+    """
+    Find where a property of a schema is defined.
+
+    Later allOf sub schemas take precedence when they are merged, so they are searched
+    first. Only references within the specification are followed.
+
+    Returns:
+        The reference tokens of the property or None if it was not found.
+
+    """
+    if prop in schema.get("properties", {}):
+        return tokens + ["properties", prop]
+    ref = schema.get("$ref")
+    if isinstance(ref, str) and ref.startswith("#"):
+        try:
+            ref_name, ref_schema = helpers.get_ref(ref=ref, schemas=schemas)
+        except exceptions.SchemaNotFoundError:
+            return None
+        return _property_tokens(
+            tokens=["components", "schemas", ref_name],
+            schema=ref_schema,
+            schemas=schemas,
+            prop=prop,
+        )
+    all_of = schema.get("allOf", [])
+    for index in reversed(range(len(all_of))):
+        prop_tokens = _property_tokens(
+            tokens=tokens + ["allOf", str(index)],
+            schema=all_of[index],
+            schemas=schemas,
+            prop=prop,
+        )
+        if prop_tokens is not None:
+            return prop_tokens
+    return None
+
+
+def lint_schema(*, name: str, schemas: types.Schemas) -> typing.List[SchemaError]:
+    """
+    Run all the checks done when constructing a model without constructing it.
+
+    Unlike check_schema, every property is checked even if the checks of the model or
+    of another property fail, so all the errors of the model are found. The schemas
+    are not modified, nothing is set on open_alchemy.models and no hooks are called.
+
+    Args:
+        name: The name of the schema of the model.
+        schemas: All the schemas.
+
+    Returns:
+        The errors found in the schema with the JSON pointer to each of them.
+
+    """
+    # Foreign keys required by the model replace the schemas they are added to
+    schemas = dict(schemas)
+    namespace = py_types.SimpleNamespace(
+        Base=py_types.SimpleNamespace(metadata=sqlalchemy.MetaData())
+    )
+    model_tokens = ["components", "schemas", name]
+    errors: typing.List[SchemaError] = []
+
+    def record(exc: exceptions.BaseError, *tokens: str) -> None:
+        """Record an error at the location of the tokens."""
+        errors.append(
+            SchemaError(
+                name=name,
+                error=type(exc).__name__,
+                message=str(exc),
+                pointer=_pointer(*tokens),
+            )
+        )
+
+    with facades.models.bind(models=namespace), hooks.suppressed():
+        try:
+            schema = helpers.prepare_schema(schema=schemas[name], schemas=schemas)
+        except exceptions.BaseError as exc:
+            record(exc, *model_tokens)
+            return errors
+
+        for check in (
+            model_factory.check_tablename,
+            model_factory.check_type,
+            model_factory.check_properties,
+        ):
+            try:
+                check(name=name, schema=schema)
+            except exceptions.BaseError as exc:
+                record(exc, *model_tokens)
+
+        required_exists = "required" in schema
+        required_set = set(schema.get("required", []))
+        properties = schema.get("properties", {})
+        if not isinstance(properties, dict):
+            record(
+                exceptions.MalformedSchemaError(
+                    f"The properties of {name} must be a dictionary."
+                ),
+                *model_tokens,
+                "properties",
+            )
+            properties = {}
+        for prop_name, prop_spec in properties.items():
+            if not isinstance(prop_spec, dict):
+                prop_tokens = _property_tokens(
+                    tokens=model_tokens,
+                    schema=schemas[name],
+                    schemas=schemas,
+                    prop=prop_name,
+                )
+                record(
+                    exceptions.MalformedSchemaError(
+                        f"The schema of the {prop_name} property must be a "
+                        "dictionary."
+                    ),
+                    *(prop_tokens or model_tokens + ["properties", prop_name]),
+                )
+                continue
+            try:
+                model_factory.gather_property_artifacts(
+                    name=name,
+                    prop_name=prop_name,
+                    prop_spec=prop_spec,
+                    schemas=schemas,
+                    required=prop_name in required_set if required_exists else None,
+                    schema=schema,
+                )
+            except exceptions.BaseError as exc:
+                prop_tokens = _property_tokens(
+                    tokens=model_tokens,
+                    schema=schemas[name],
+                    schemas=schemas,
+                    prop=prop_name,
+                )
+                record(exc, *(prop_tokens or model_tokens + ["properties", prop_name]))
+
+        try:
+            table_args.gather_artifacts(schema=schema)
+        except exceptions.BaseError as exc:
+            record(exc, *model_tokens)
+
+    return errors
+
+
+def _lint_refs(
+    *, tokens: typing.List[str], value: typing.Any, schemas: types.Schemas
+) -> typing.Iterator[SchemaError]:
+    """Find every $ref in a value that cannot be resolved."""
+    if isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _lint_refs(
+                tokens=tokens + [str(index)], value=item, schemas=schemas
+            )
+        return
+    if not isinstance(value, dict):
+        return
+    ref = value.get("$ref")
+    if isinstance(ref, str):
+        try:
+            helpers.get_ref(ref=ref, schemas=schemas)
+        except exceptions.SchemaNotFoundError as exc:
+            yield SchemaError(
+                name=tokens[2],
+                error=type(exc).__name__,
+                message=str(exc),
+                pointer=_pointer(*tokens, "$ref"),
+            )
+    for key, sub_value in value.items():
+        yield from _lint_refs(tokens=tokens + [key], value=sub_value, schemas=schemas)
+
+
+TResult = typing.TypeVar("TResult")
+
+# The schemas checked by a worker process
+_WORKER_SCHEMAS: types.Schemas = {}
+
+
+def _init_worker(schemas: types.Schemas) -> None:
+    """Record the schemas once per worker process."""
+    global _WORKER_SCHEMAS  # pylint: disable=global-statement
+    _WORKER_SCHEMAS = schemas
+
+
+def _worker(check: typing.Callable[..., TResult], name: str) -> TResult:
+    """Check a schema against the schemas of the worker process."""
+    return check(name=name, schemas=_WORKER_SCHEMAS)
+
+
+def _map(
+    *,
+    check: typing.Callable[..., TResult],
+    names: typing.List[str],
+    schemas: types.Schemas,
+    max_workers: typing.Optional[int],
+) -> typing.List[TResult]:
+    """
+    Check every schema by name across a pool of processes.
+
+    Args:
+        check: Called with the name and the schemas.
+        names: The names of the schemas to check.
+        schemas: All the schemas.
+        max_workers: The number of processes to use. Defaults to the number of CPUs.
+            1 checks the schemas in the current process.
+
+    Returns:
+        The results in the order of the names.
+
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(names))
+
+    if max_workers <= 1:
+        return [check(name=name, schemas=schemas) for name in names]
+
+    # Sending the schemas once per process instead of once per model
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(schemas,)
+    ) as executor:
+        chunksize = max(1, len(names) // (max_workers * 4))
+        return list(
+            executor.map(functools.partial(_worker, check), names, chunksize=chunksize)
+        )
+
+
+def validate_spec(
+    *, spec: types.Schema, max_workers: typing.Optional[int] = None
+) -> ValidationReport:
+    """
+    Check the schemas of all the models of a specification.
+
+    Every schema with x-tablename in components.schemas is checked independently,
+    which includes any schema it references, so the errors of all the models are
+    reported at once. The schemas are spread across a pool of processes.
+
+    Raise MalformedSpecificationError if the specification has no schemas.
+
+    Args:
+        spec: The OpenAPI specification in the form of a dictionary.
+        max_workers: The number of processes to use. Defaults to the number of CPUs.
+            1 checks the schemas in the current process.
+
+    Returns:
+        The errors found in the schemas of the models in the order of the schemas.
+
+    """
+    if "components" not in spec:
+        raise exceptions.MalformedSpecificationError(
+            '"components" is a required key in the specification.'
+        )
+    components = spec.get("components", {})
+    if "schemas" not in components:
+        raise exceptions.MalformedSpecificationError(
+            '"schemas" is a required key in the components of the specification.'
+        )
+    schemas = components.get("schemas", {})
+
+    names = [
+        name
+        for name, schema in schemas.items()
+        if is_model(schema=schema, schemas=schemas)
+    ]
+    results = _map(
+        check=check_schema, names=names, schemas=schemas, max_workers=max_workers
+    )
+    return ValidationReport(errors=[error for error in results if error is not None])
+
+
+def lint_spec(
+    *, spec: types.Schema, max_workers: typing.Optional[int] = None
+) -> ValidationReport:
+    """
+    Find all the errors in the schemas of a specification.
+
+    Every schema of a model is checked using lint_schema and every $ref of the other
+    schemas is checked to resolve, so all the errors are reported at once together
+    with the JSON pointer to each of them. No models are constructed. The schemas of
+    the models are spread across a pool of processes.
+
+    Args:
+        spec: The OpenAPI specification in the form of a dictionary.
+        max_workers: The number of processes to use. Defaults to the number of CPUs.
+            1 checks the schemas in the current process.
+
+    Returns:
+        The errors found in the schemas in the order of the schemas.
+
+    """
+    components = spec.get("components")
+    if not isinstance(components, dict) or "schemas" not in components:
+        tokens = ["components"] if components is None else ["components", "schemas"]
+        exc = exceptions.MalformedSpecificationError(
+            f'"{tokens[-1]}" is a required key in the specification.'
+        )
+        return ValidationReport(
+            errors=[
+                SchemaError(
+                    name="",
+                    error=type(exc).__name__,
+                    message=str(exc),
+                    pointer=_pointer(*tokens),
+                )
+            ]
+        )
+    schemas = components["schemas"]
+    if not isinstance(schemas, dict):
+        exc = exceptions.MalformedSpecificationError(
+            'The "schemas" of the components must be a dictionary.'
+        )
+        return ValidationReport(
+            errors=[
+                SchemaError(
+                    name="",
+                    error=type(exc).__name__,
+                    message=str(exc),
+                    pointer=_pointer("components", "schemas"),
+                )
+            ]
+        )
+
+    errors: typing.Dict[str, typing.List[SchemaError]] = {}
+    models = []
+    for name, schema in schemas.items():
+        if not isinstance(schema, dict):
+            exc = exceptions.MalformedSchemaError(
+                f"The schema of {name} must be a dictionary."
+            )
+            errors[name] = [
+                SchemaError(
+                    name=name,
+                    error=type(exc).__name__,
+                    message=str(exc),
+                    pointer=_pointer("components", "schemas", name),
+                )
+            ]
+            continue
+        try:
+            if is_model(schema=schema, schemas=schemas):
+                models.append(name)
+                continue
+        except exceptions.BaseError:
+            # The reference that cannot be resolved is reported below
+            pass
+        errors[name] = list(
+            _lint_refs(
+                tokens=["components", "schemas", name], value=schema, schemas=schemas
+            )
+        )
+    errors.update(
+        zip(
+            models,
+            _map(
+                check=lint_schema,
+                names=models,
+                schemas=schemas,
+                max_workers=max_workers,
+            ),
+        )
+    )
+
+    return ValidationReport(
+        errors=[error for name in schemas for error in errors.get(name, [])]
+    )
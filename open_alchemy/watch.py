@@ -0,0 +1,549 @@
+"""Rebuild the models when the specification file changes during development."""
+
+import contextlib
+import os
+import threading
+import types as py_types
+import typing
+import warnings
+import weakref
+
+import sqlalchemy
+from sqlalchemy.ext import declarative
+from sqlalchemy.orm import instrumentation
+
+try:
+    from sqlalchemy.orm import clsregistry
+except ImportError:  # pragma: no cover
+    # The registry of the classes moved to sqlalchemy.orm in SQLAlchemy 1.4
+    from sqlalchemy.ext.declarative import clsregistry  # type: ignore
+
+import open_alchemy
+from open_alchemy import loader
+from open_alchemy import types
+
+from . import helpers
+from .helpers.define_all import check_patterns as _check_patterns
+from .helpers.define_all import select as _select
+from .helpers.resolve_ref import clear_cache as _clear_ref_cache
+from .helpers.resolve_ref import filenames as _ref_filenames
+
+Load = typing.Callable[[str], types.Schema]
+Groups = typing.Dict[str, typing.FrozenSet[str]]
+Stat = typing.Optional[typing.Tuple[int, int]]
+
+
+def _read_stat(filename: str) -> Stat:
+    """Read the modification time and size of a file, None if it does not exist."""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _Build(typing.NamedTuple):
+    """The models constructed together by a model factory."""
+
+    namespace: typing.Any
+    model_factory: types.ModelFactory
+
+
+def _class_registry(base: typing.Type) -> typing.MutableMapping[str, typing.Any]:
+    """Get the classes of a declarative base by name."""
+    # The classes moved to the registry of the base in SQLAlchemy 1.4
+    registry = getattr(base, "registry", None)
+    if registry is None:  # pragma: no cover
+        return base._decl_class_registry  # pylint: disable=protected-access
+    return registry._class_registry  # pylint: disable=protected-access
+
+
+def _classes(base: typing.Type) -> typing.List[typing.Type]:
+    """Get the classes of a declarative base."""
+    classes: typing.List[typing.Type] = []
+    for name, value in list(_class_registry(base).items()):
+        if name == "_sa_module_registry":
+            continue
+        if isinstance(value, type):
+            classes.append(value)
+        else:
+            # Multiple classes with the same name
+            classes.extend(cls for cls in value if cls is not None)
+    return classes
+
+
+def _add_class(*, base: typing.Type, model: typing.Type) -> None:
+    """Add a class to the classes of a declarative base by name."""
+    if getattr(base, "registry", None) is None:  # pragma: no cover
+        clsregistry.add_class(model.__name__, model)  # type: ignore
+    else:
+        clsregistry.add_class(model.__name__, model, _class_registry(base))
+
+
+def _remove_class(*, base: typing.Type, model: typing.Type) -> None:
+    """
+    Remove a class from the classes of a declarative base by name.
+
+    The class is also removed from the classes by module so that a class with the same
+    name and module can be added without a warning.
+
+    """
+    registry = _class_registry(base)
+    name = model.__name__
+    reference = weakref.ref(model)
+    # pylint: disable=protected-access
+    existing = registry.get(name)
+    if existing is model:
+        del registry[name]
+    elif existing is not None and reference in existing.contents:
+        existing._remove_item(reference)
+        if not existing.contents:
+            del registry[name]
+
+    root_module = registry.get("_sa_module_registry")
+    if root_module is None:
+        return
+    tokens = model.__module__.split(".")
+    while tokens:
+        module = root_module
+        for token in tokens:
+            module = module.get_module(token)
+        tokens.pop(0)
+        marker = module.contents.get(name)
+        if marker is not None and reference in marker.contents:
+            marker._remove_item(reference)
+
+
+def _dispose(*, base: typing.Type, model: typing.Type) -> None:
+    """Dispose the mapper of a model that is no longer used."""
+    mapper = sqlalchemy.inspect(model, raiseerr=False)
+    if mapper is None:
+        return
+    # Mapper.dispose was replaced by disposing the whole registry in SQLAlchemy 1.4
+    dispose = getattr(mapper, "dispose", None)
+    if dispose is None:
+        # pylint: disable=protected-access
+        mapper._set_dispose_flags()
+        base.registry._managers.pop(mapper.class_manager, None)
+        instrumentation.unregister_class(model)
+    else:  # pragma: no cover
+        dispose()
+
+
+def _groups(*, schemas: types.Schemas) -> Groups:
+    """
+    Calculate the groups of models that have to be constructed together.
+
+    Models are in the same group if one of them depends on the other, directly or
+    through other models in either direction, since relationships add foreign keys
+    and back references to the referenced models.
+
+    Args:
+        schemas: All the schemas.
+
+    Returns:
+        The group of every model by name.
+
+    """
+    names = _select(schemas=schemas)
+    adjacent: typing.Dict[str, typing.Set[str]] = {name: set() for name in names}
+    for name in names:
+        for dependency in helpers.dependencies.dependencies(name=name, schemas=schemas):
+            adjacent[name].add(dependency)
+            adjacent.setdefault(dependency, set()).add(name)
+
+    groups: Groups = {}
+    for name in names:
+        if name in groups:
+            continue
+        members: typing.Set[str] = set()
+        pending = [name]
+        while pending:
+            member = pending.pop()
+            if member in members:
+                continue
+            members.add(member)
+            pending.extend(adjacent[member] - members)
+        group = frozenset(members)
+        for member in group:
+            groups[member] = group
+    return groups
+
+
+class Watcher:
+    """
+    Construct the models of a specification file and rebuild them when it changes.
+
+    Every rebuild only constructs the models whose fingerprint changed together with
+    the models in their groups. The previous models of the groups and their tables are
+    removed from the declarative base and its metadata before the models are
+    constructed again on the same base, so the base always has all the current models
+    and tables. The rebuilt models replace the previous ones on the namespace at once,
+    models removed from the specification are removed from it and all other models
+    are kept.
+
+    The watcher is also the model factory for the specification.
+
+    Attrs:
+        base: The declarative base of the models.
+        error: The exception raised by the most recent rebuild in the background,
+            if it failed.
+
+    """
+
+    def __init__(
+        self,
+        spec_filename: str,
+        *,
+        load: Load,
+        base: typing.Optional[typing.Type] = None,
+        define_all: bool = True,
+        include: typing.Optional[types.Patterns] = None,
+        exclude: typing.Optional[types.Patterns] = None,
+        namespace: typing.Any = None,
+        interval: float = 1.0,
+        compile_validators: bool = False,
+        collect_all_errors: bool = False,
+    ) -> None:
+        """
+        Construct the models of the specification file.
+
+        Args:
+            spec_filename: The filename of the specification.
+            load: Loads the specification from the file.
+            base: The declarative base for the models. Defaults to a new declarative
+                base.
+            define_all: Whether to define all the models during initialization and
+                when rebuilding.
+            include: Glob patterns of the names of the schemas to define.
+            exclude: Glob patterns of the names of the schemas not to define.
+            namespace: The object on which the Base and models are set. Defaults to
+                open_alchemy.models.
+            interval: The number of seconds between checks for changes.
+            compile_validators: Whether to compile the schemas of the models into
+                Python functions that from_dict uses instead of jsonschema.
+            collect_all_errors: Whether from_dict reports all the ways in which a
+                dictionary does not satisfy the schema of a model.
+
+        """
+        _check_patterns(define_all=define_all, include=include, exclude=exclude)
+        self._spec_filename = spec_filename
+        self._load = load
+        self._define_all = define_all
+        self._include = include
+        self._exclude = exclude
+        self._namespace = open_alchemy.models if namespace is None else namespace
+        self.base = declarative.declarative_base() if base is None else base
+        setattr(self._namespace, "Base", self.base)
+        self._interval = interval
+        self._compile_validators = compile_validators
+        self._collect_all_errors = collect_all_errors
+
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+        self.error: typing.Optional[Exception] = None
+
+        # The models that are currently constructed, by name, and the name of the
+        # model whose construction set each attribute on the namespace
+        self._builds: typing.Dict[str, _Build] = {}
+        self._owners: typing.Dict[str, str] = {}
+
+        # The files that are checked for changes, which are the specification file
+        # and the files loaded for the references to other files
+        self._stats: typing.Dict[str, Stat] = {spec_filename: _read_stat(spec_filename)}
+        self._schemas: types.Schemas = {}
+        self._groups: Groups = {}
+        self._fingerprints: typing.Dict[str, str] = {}
+        self._rebuild(spec=self._load(spec_filename))
+        self._add_referenced_files()
+
+    def __call__(self, *, name: str) -> typing.Type:
+        """Return a model, constructing it with the models of its group if needed."""
+        with self._lock:
+            if name in self._owners:
+                return getattr(self._namespace, name)
+
+            # Models of a group are constructed by the same model factory
+            owners = dict(self._owners)
+            builds = dict(self._builds)
+            build = builds.get(name)
+            if build is None:
+                build = self._new_build(schemas=self._schemas)
+                for member in self._groups.get(name, frozenset((name,))):
+                    builds[member] = build
+            with self._replacing(values=[], keep=vars(build.namespace).values()):
+                attributes = self._construct(
+                    build=build, names=[name], owners=owners, builds=builds
+                )
+            self._swap(attributes=attributes, removed=set())
+            self._owners = owners
+            self._builds = builds
+            return getattr(self._namespace, name)
+
+    def _add_referenced_files(self) -> None:
+        """Check the files loaded for the references to other files for changes."""
+        for filename in _ref_filenames():
+            if filename not in self._stats:
+                self._stats[filename] = _read_stat(filename)
+
+    def _new_build(self, *, schemas: types.Schemas) -> _Build:
+        """Create a model factory for the schemas on the declarative base."""
+        namespace = py_types.SimpleNamespace()
+        model_factory = open_alchemy.init_model_factory(
+            base=self.base,
+            spec={"components": {"schemas": schemas}},
+            namespace=namespace,
+            compile_validators=self._compile_validators,
+            collect_all_errors=self._collect_all_errors,
+        )
+        return _Build(namespace=namespace, model_factory=model_factory)
+
+    def _detach(self, *, values: typing.Iterable[typing.Any]) -> None:
+        """Remove models and tables from the declarative base and its metadata."""
+        metadata = self.base.metadata
+        for value in values:
+            if isinstance(value, sqlalchemy.Table):
+                metadata.remove(value)
+                continue
+            _remove_class(base=self.base, model=value)
+            table = getattr(value, "__table__", None)
+            if table is not None:
+                metadata.remove(table)
+
+    def _attach(self, *, values: typing.Iterable[typing.Any]) -> None:
+        """Add models and tables back to the declarative base and its metadata."""
+        metadata = self.base.metadata
+        for value in values:
+            if isinstance(value, sqlalchemy.Table):
+                table = value
+            else:
+                _add_class(base=self.base, model=value)
+                table = value.__table__
+            # pylint: disable=protected-access
+            metadata._add_table(table.name, table.schema, table)
+
+    @contextlib.contextmanager
+    def _replacing(
+        self,
+        *,
+        values: typing.Sequence[typing.Any],
+        keep: typing.Iterable[typing.Any] = (),
+    ) -> typing.Iterator[None]:
+        """
+        Detach models and tables while the models replacing them are constructed.
+
+        If the construction raises, the models and tables added to the declarative base
+        are detached again and the previous models and tables are attached again.
+        Otherwise the mappers of the previous models are disposed.
+
+        Args:
+            values: The models and tables that are replaced.
+            keep: The models and tables that are kept if the construction raises,
+                such as the models that were constructed successfully by a model
+                factory that is still used.
+
+        """
+        self._detach(values=values)
+        tables = {id(table) for table in self.base.metadata.tables.values()}
+        classes = {id(model) for model in _classes(self.base)}
+        try:
+            yield
+        except Exception:
+            kept = {id(value) for value in keep}
+            added_classes = [
+                model
+                for model in _classes(self.base)
+                if id(model) not in classes and id(model) not in kept
+            ]
+            self._detach(
+                values=[
+                    table
+                    for table in self.base.metadata.tables.values()
+                    if id(table) not in tables and id(table) not in kept
+                ]
+            )
+            self._detach(values=added_classes)
+            for model in added_classes:
+                _dispose(base=self.base, model=model)
+            self._attach(values=values)
+            raise
+        for value in values:
+            if not isinstance(value, sqlalchemy.Table):
+                _dispose(base=self.base, model=value)
+
+    @staticmethod
+    def _construct(
+        *,
+        build: _Build,
+        names: typing.Iterable[str],
+        owners: typing.Dict[str, str],
+        builds: typing.Dict[str, _Build],
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Construct models with a build and record the attributes they set.
+
+        Args:
+            build: Used to construct the models.
+            names: The names of the models to construct.
+            owners: The name of the model whose construction set each attribute.
+            builds: The build of every model by name.
+
+        Returns:
+            The attributes set on the namespace of the build.
+
+        """
+        for name in names:
+            before = set(vars(build.namespace))
+            build.model_factory(name=name)
+            for attribute in vars(build.namespace).keys() - before:
+                owners[attribute] = name
+            builds[name] = build
+        return {
+            attribute: getattr(build.namespace, attribute)
+            for attribute, owner in owners.items()
+            if builds.get(owner) is build
+        }
+
+    def _swap(
+        self, *, attributes: typing.Dict[str, typing.Any], removed: typing.Set[str]
+    ) -> None:
+        """Replace attributes on the namespace in one step and delete others."""
+        namespace_vars = vars(self._namespace)
+        namespace_vars.update(attributes)
+        for attribute in removed - attributes.keys():
+            namespace_vars.pop(attribute, None)
+
+    def _affected(self, *, names: typing.Set[str], groups: Groups) -> typing.Set[str]:
+        """Add the models in the previous and in the new groups of the names."""
+        affected: typing.Set[str] = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name in affected:
+                continue
+            affected.add(name)
+            pending.extend(self._groups.get(name, ()))
+            pending.extend(groups.get(name, ()))
+        return affected
+
+    def _rebuild(self, *, spec: types.Schema) -> loader.Changes:
+        """Rebuild the models affected by the changes to the specification."""
+        schemas: types.Schemas = spec.get("components", {}).get("schemas", {})
+        fingerprints = loader.fingerprints(spec)
+        changes = loader.changes(previous=self._fingerprints, current=fingerprints)
+        groups = _groups(schemas=schemas)
+
+        with self._lock:
+            affected = self._affected(
+                names=(changes.added | changes.removed | changes.changed)
+                & (self._groups.keys() | groups.keys()),
+                groups=groups,
+            )
+            if not affected:
+                self._fingerprints = fingerprints
+                return changes
+
+            # Models that were constructed on request are constructed again
+            names = {name for name in affected if name in self._owners}
+            if self._define_all:
+                names.update(
+                    _select(
+                        schemas=schemas, include=self._include, exclude=self._exclude
+                    )
+                )
+            names &= affected & groups.keys()
+
+            # The new state is only kept if all the models could be constructed, the
+            # previous models of the affected groups are attached to the base again
+            # otherwise
+            owners = {
+                attribute: owner
+                for attribute, owner in self._owners.items()
+                if owner not in affected
+            }
+            builds = {
+                name: build
+                for name, build in self._builds.items()
+                if name not in affected
+            }
+            build = self._new_build(schemas=schemas)
+            for name in affected & groups.keys():
+                builds[name] = build
+            with self._replacing(
+                values=[
+                    getattr(self._namespace, attribute)
+                    for attribute, owner in self._owners.items()
+                    if owner in affected
+                ]
+            ):
+                attributes = self._construct(
+                    build=build,
+                    names=[name for name in schemas if name in names],
+                    owners=owners,
+                    builds=builds,
+                )
+
+            self._swap(
+                attributes=attributes, removed=self._owners.keys() - owners.keys()
+            )
+            self._schemas = schemas
+            self._groups = groups
+            self._fingerprints = fingerprints
+            self._owners = owners
+            self._builds = builds
+        return changes
+
+    def check(self) -> typing.Optional[loader.Changes]:
+        """
+        Rebuild the affected models if the specification file or a file it references
+        changed.
+
+        Raise any exception raised while loading the specification or constructing
+        the models. The previous models are kept in that case.
+
+        Returns:
+            The changes to the schemas, or None if none of the files changed since the
+            last check.
+
+        """
+        stats = {filename: _read_stat(filename) for filename in self._stats}
+        if stats == self._stats:
+            return None
+        # The files are only loaded again once they change again after an error
+        self._stats = stats
+        _clear_ref_cache()
+        try:
+            return self._rebuild(spec=self._load(self._spec_filename))
+        finally:
+            # The specification may reference files that were not referenced before
+            self._add_referenced_files()
+
+    def _run(self) -> None:
+        """Check for changes until the watcher is stopped."""
+        while not self._stop.wait(self._interval):
+            try:
+                self.check()
+            except Exception as exc:  # pylint: disable=broad-except
+                self.error = exc
+                warnings.warn(f"Reloading {self._spec_filename} failed: {exc!r}")
+            else:
+                self.error = None
+
+    def start(self) -> None:
+        """Check for changes in a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="open_alchemy.watch", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop checking for changes in the background."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
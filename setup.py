@@ -29,6 +29,7 @@ setuptools.setup(
     python_requires=">=3.6",
     install_requires=["SQLAlchemy>=1.0", "typing-extensions>=3.5", "jsonschema>=3"],
     include_package_data=True,
+    entry_points={"console_scripts": ["openalchemy=open_alchemy.cli:main"]},
     extras_require={
         "dev": [
             "tox",
@@ -54,6 +55,7 @@ setuptools.setup(
             "pytest-randomly",
             "pytest-bandit",
             "PyYAML",
+            "aiosqlite",
             "connexion[swagger-ui]",
         ],
         ":python_version<'3.7'": ["dataclasses>=0.7"],
@@ -0,0 +1,176 @@
+"""Tests for the specification generator."""
+
+import copy
+import json
+import os
+
+import pytest
+import sqlalchemy
+from sqlalchemy import orm
+
+from benchmarks import generator
+from benchmarks import suite
+from open_alchemy import validation
+
+EXTENSION_SCHEMAS = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "open_alchemy",
+    "helpers",
+    "get_ext_prop",
+    "extension-schemas.json",
+)
+
+
+def _keys(value):
+    """Yield all the keys of nested dictionaries and lists."""
+    if isinstance(value, dict):
+        for key, sub_value in value.items():
+            yield key
+            yield from _keys(sub_value)
+    if isinstance(value, list):
+        for sub_value in value:
+            yield from _keys(sub_value)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"models": -1}, {"models": 1, "properties": 1, "composite_indexes": 1}],
+    ids=["negative", "composite index single property"],
+)
+@pytest.mark.benchmark
+def test_config_invalid(kwargs):
+    """
+    GIVEN configuration that cannot be generated
+    WHEN Config is constructed
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        generator.Config(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        generator.Config(models=3),
+        generator.Config(models=3, all_of_depth=3),
+        generator.Config(models=3, ref_chain=3),
+        generator.Config(models=4, one_to_many=2, backrefs=True),
+        generator.Config(models=4, many_to_many=2, backrefs=True),
+        generator.Config(models=3, composite_indexes=2),
+        generator.Config(
+            models=4,
+            all_of_depth=2,
+            ref_chain=2,
+            one_to_many=2,
+            many_to_many=2,
+            backrefs=True,
+            composite_indexes=2,
+            paths=True,
+        ),
+    ],
+    ids=[
+        "simple",
+        "allOf",
+        "$ref chain",
+        "one to many",
+        "many to many",
+        "composite index",
+        "all",
+    ],
+)
+@pytest.mark.benchmark
+def test_generate(config):
+    """
+    GIVEN configuration
+    WHEN the specification is generated
+    THEN the specification is valid and all the models and tables can be created.
+    """
+    spec = generator.generate(config)
+
+    assert validation.validate_spec(spec=spec, max_workers=1).valid
+    namespace = suite.define_all(copy.deepcopy(spec))
+    orm.configure_mappers()
+    engine = sqlalchemy.create_engine("sqlite://")
+    namespace.Base.metadata.create_all(engine)
+    assert len(suite.get_models(namespace)) == config.models
+
+
+@pytest.mark.benchmark
+def test_generate_shape():
+    """
+    GIVEN configuration with relationships and composite indexes
+    WHEN the specification is generated and the models are defined
+    THEN the models have the configured relationships, association tables and
+        indexes.
+    """
+    config = generator.Config(
+        models=3,
+        properties=3,
+        one_to_many=1,
+        many_to_many=2,
+        backrefs=True,
+        composite_indexes=2,
+    )
+    spec = generator.generate(config)
+
+    namespace = suite.define_all(copy.deepcopy(spec))
+    orm.configure_mappers()
+    tables = namespace.Base.metadata.tables
+    assert set(tables) == {
+        "model_0",
+        "model_1",
+        "model_2",
+        "model_0_model_1",
+        "model_0_model_2",
+        "model_1_model_2",
+    }
+    assert "model_0_id" in tables["model_1"].columns
+    assert {index.name for index in tables["model_0"].indexes} == {
+        "ix_model_0_0",
+        "ix_model_0_1",
+    }
+    assert hasattr(namespace.Model1, "one_to_many_backref_0")
+    assert hasattr(namespace.Model2, "many_to_many_backref_1")
+
+
+@pytest.mark.benchmark
+def test_generate_extension_properties():
+    """
+    GIVEN configuration using every feature
+    WHEN the specification is generated
+    THEN every extension property used is a known extension property.
+    """
+    config = generator.Config(
+        models=3,
+        all_of_depth=1,
+        ref_chain=1,
+        one_to_many=1,
+        many_to_many=1,
+        backrefs=True,
+        composite_indexes=1,
+    )
+    with open(EXTENSION_SCHEMAS) as in_file:
+        known = set(json.load(in_file))
+
+    spec = generator.generate(config)
+
+    used = {key for key in _keys(spec) if key.startswith("x-")}
+    assert used
+    assert used <= known
+
+
+@pytest.mark.benchmark
+def test_main(tmp_path):
+    """
+    GIVEN output file ending with .json
+    WHEN main is called
+    THEN the generated specification is written as JSON.
+    """
+    output = tmp_path / "spec.json"
+
+    generator.main(["--models", "2", "--one-to-many", "1", "--output", str(output)])
+
+    spec = json.loads(output.read_text())
+    assert set(spec["components"]["schemas"]) == {"Model0", "Model1"}
@@ -0,0 +1,27 @@
+"""Smoke tests for the schema memory benchmark."""
+
+import dataclasses
+
+import pytest
+
+from benchmarks import generator
+from benchmarks import schema_memory
+from benchmarks import suite
+
+
+@pytest.mark.benchmark
+def test_measure():
+    """
+    GIVEN models of a generated specification
+    WHEN measure is called with the models
+    THEN the shared size includes the table of interned values and is smaller than
+        the unshared size.
+    """
+    spec = generator.generate(dataclasses.replace(suite.GENERATED, models=20))
+    models = suite.get_models(suite.define_all(spec))
+
+    sizes = schema_memory.measure(models=models)
+
+    assert set(sizes["per_model"]) == {model.__name__ for model in models}
+    assert 0 < sizes["intern_table_bytes"] < sizes["shared_bytes"]
+    assert sizes["shared_bytes"] < sizes["unshared_bytes"]
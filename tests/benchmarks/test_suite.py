@@ -0,0 +1,66 @@
+"""Smoke tests for the benchmark suite."""
+
+import json
+
+import pytest
+
+from benchmarks import compare
+from benchmarks import suite
+
+
+@pytest.mark.benchmark
+def test_run():
+    """
+    GIVEN small synthetic specification and the example specifications
+    WHEN the benchmarks are run
+    THEN a result is returned for every benchmark that can be serialized to JSON.
+    """
+    report = suite.run(sizes=[2], repeat=1)
+
+    json.dumps(report)
+    synthetic = {
+        result["benchmark"]
+        for result in report["results"]
+        if result["spec"] == "synthetic"
+    }
+    assert synthetic == {
+        "init_yaml",
+        "define_all",
+        "from_dict",
+        "from_dict_relationships",
+        "to_dict",
+        "to_dict_relationships",
+        "sqlite_round_trip",
+    }
+    assert {
+        result["benchmark"]
+        for result in report["results"]
+        if result["spec"] == "generated"
+    } == {"define_all"}
+    examples = {
+        result["spec"]
+        for result in report["results"]
+        if result["spec"] not in ("synthetic", "generated")
+    }
+    assert "simple-example-spec.yml" in examples
+    assert all(result["seconds"] >= 0 for result in report["results"])
+
+
+@pytest.mark.parametrize(
+    "seconds, expected_regression", [(1.0, False), (1.5, True)], ids=["same", "slower"]
+)
+@pytest.mark.benchmark
+def test_compare(seconds, expected_regression):
+    """
+    GIVEN baseline and results
+    WHEN compare is called
+    THEN a regression is reported if the result is slower than the threshold.
+    """
+    key = ("define_all", "synthetic", 10)
+
+    lines, regression = compare.compare(
+        baseline={key: 1.0}, results={key: seconds}, threshold=1.2
+    )
+
+    assert regression == expected_regression
+    assert len(lines) == 2
@@ -0,0 +1,20 @@
+"""Smoke tests for the uuid storage benchmark."""
+
+import pytest
+
+from benchmarks import uuid_storage
+
+
+@pytest.mark.benchmark
+def test_measure():
+    """
+    GIVEN specifications with string and uuid keys
+    WHEN measure is called with the specifications
+    THEN the tables and indexes with uuid keys use less storage.
+    """
+    string = uuid_storage.measure(spec=uuid_storage.SPECS["string"], rows=100)
+    uuid = uuid_storage.measure(spec=uuid_storage.SPECS["uuid"], rows=100)
+
+    assert uuid["table_bytes"] < string["table_bytes"]
+    assert uuid["index_bytes"] < string["index_bytes"]
+    assert uuid["total_bytes"] < string["total_bytes"]
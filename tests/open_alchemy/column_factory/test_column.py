@@ -2,13 +2,20 @@
 # pylint: disable=protected-access
 
 import copy
+import uuid
 
 import pytest
 import sqlalchemy
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
 
 from open_alchemy import exceptions
 from open_alchemy import types
 from open_alchemy.column_factory import column
+from open_alchemy.column_factory import enum_code_type
+from open_alchemy.column_factory import uuid_type
+
+UUID = uuid.UUID("12345678-1234-5678-1234-567812345678")
 
 
 @pytest.mark.parametrize(
@@ -80,6 +87,20 @@ def test_calculate_nullable(required, nullable, expected_result):
             {"type": "type 1", "x-dict-ignore": "True"},
             exceptions.MalformedExtensionPropertyError,
         ),
+        (
+            {"type": "type 1", "x-json": "True"},
+            exceptions.MalformedExtensionPropertyError,
+        ),
+        ({"type": "string", "enum": "value 1"}, exceptions.MalformedSchemaError),
+        (
+            {"type": "string", "enum": ["value 1"], "x-enum-code": "True"},
+            exceptions.MalformedExtensionPropertyError,
+        ),
+        ({"type": "string", "x-enum-code": True}, exceptions.MalformedSchemaError),
+        (
+            {"type": "integer", "enum": [1], "x-enum-code": True},
+            exceptions.MalformedSchemaError,
+        ),
     ],
     ids=[
         "type missing",
@@ -93,6 +114,11 @@ def test_calculate_nullable(required, nullable, expected_result):
         "unique not boolean",
         "foreign key not string",
         "x-dict-ignore not boolean",
+        "x-json not boolean",
+        "enum not list",
+        "x-enum-code not boolean",
+        "x-enum-code without enum",
+        "x-enum-code not string",
     ],
 )
 @pytest.mark.column
@@ -114,6 +140,9 @@ def test_check_schema_invalid(schema, expected_exception):
         {"type": "type 1", "maxLength": 1},
         {"type": "type 1", "nullable": True},
         {"type": "type 1", "x-dict-ignore": True},
+        {"type": "type 1", "x-json": True},
+        {"type": "string", "enum": ["value 1"]},
+        {"type": "string", "enum": ["value 1"], "x-enum-code": True},
     ],
     ids=[
         "type only",
@@ -121,6 +150,9 @@ def test_check_schema_invalid(schema, expected_exception):
         "type with maxLength",
         "type with nullable",
         "type with x-dict-ignore",
+        "type with x-json",
+        "type with enum",
+        "type with x-enum-code",
     ],
 )
 @pytest.mark.column
@@ -185,6 +217,18 @@ def test_check_schema_schema_other():
             {"type": "type 1", "x-foreign-key": "table.column"},
             types.ColumnArtifacts("type 1", foreign_key="table.column"),
         ),
+        (
+            {"type": "type 1", "x-json": True},
+            types.ColumnArtifacts("type 1", json=True),
+        ),
+        (
+            {"type": "string", "enum": ["value 1"]},
+            types.ColumnArtifacts("string", enum=["value 1"]),
+        ),
+        (
+            {"type": "string", "enum": ["value 1"], "x-enum-code": True},
+            types.ColumnArtifacts("string", enum=["value 1"], enum_code=True),
+        ),
     ],
     ids=[
         "type only",
@@ -196,6 +240,9 @@ def test_check_schema_schema_other():
         "type with index",
         "type with unique",
         "type with foreign key",
+        "type with x-json",
+        "type with enum",
+        "type with x-enum-code",
     ],
 )
 @pytest.mark.column
@@ -550,6 +597,137 @@ def test_handle_string_max_length():
     assert string.length == length
 
 
+@pytest.mark.column
+def test_handle_string_uuid():
+    """
+    GIVEN artifacts with the uuid format
+    WHEN _handle_string is called with the artifacts
+    THEN a type is returned which is 16 bytes of binary on SQLite and UUID on
+        PostgreSQL.
+    """
+    artifacts = types.ColumnArtifacts("string", format="uuid")
+
+    returned_type = column._handle_string(artifacts=artifacts)
+
+    sqlite_type = returned_type.load_dialect_impl(sqlite.dialect())
+    assert isinstance(sqlite_type, sqlalchemy.BINARY)
+    assert sqlite_type.length == 16
+    assert isinstance(
+        returned_type.load_dialect_impl(postgresql.dialect()), postgresql.UUID
+    )
+
+
+@pytest.mark.parametrize(
+    "artifacts_kwargs, expected_exception",
+    [
+        ({"enum": [1]}, exceptions.MalformedSchemaError),
+        (
+            {"enum": ["value 1"], "format": "date-time"},
+            exceptions.FeatureNotImplementedError,
+        ),
+    ],
+    ids=["value not string", "format"],
+)
+@pytest.mark.column
+def test_handle_string_enum_invalid(artifacts_kwargs, expected_exception):
+    """
+    GIVEN artifacts with an enum that is not supported
+    WHEN _handle_string is called with the artifacts
+    THEN the expected exception is raised.
+    """
+    artifacts = types.ColumnArtifacts("string", **artifacts_kwargs)
+
+    with pytest.raises(expected_exception):
+        column._handle_string(artifacts=artifacts)
+
+
+@pytest.mark.column
+def test_handle_string_enum():
+    """
+    GIVEN artifacts with an enum and the name of the enum
+    WHEN _handle_string is called with the artifacts
+    THEN an Enum with the values and name is returned which is a native enum on
+        PostgreSQL.
+    """
+    artifacts = types.ColumnArtifacts(
+        "string", enum=["value 1", "value 2"], enum_name="table_status"
+    )
+
+    returned_type = column._handle_string(artifacts=artifacts)
+
+    assert isinstance(returned_type, sqlalchemy.Enum)
+    assert returned_type.enums == ["value 1", "value 2"]
+    assert returned_type.name == "table_status"
+    assert isinstance(
+        returned_type.dialect_impl(postgresql.dialect()), postgresql.ENUM
+    )
+
+
+@pytest.mark.column
+def test_handle_string_enum_code():
+    """
+    GIVEN artifacts with an enum and x-enum-code
+    WHEN _handle_string is called with the artifacts
+    THEN a type is returned that stores small integer codes of the values.
+    """
+    artifacts = types.ColumnArtifacts(
+        "string", enum=["value 1", "value 2"], enum_code=True
+    )
+
+    returned_type = column._handle_string(artifacts=artifacts)
+
+    assert isinstance(returned_type, enum_code_type.EnumCode)
+    assert isinstance(
+        returned_type.load_dialect_impl(sqlite.dialect()), sqlalchemy.SmallInteger
+    )
+    assert returned_type.process_bind_param("value 2", sqlite.dialect()) == 1
+    assert returned_type.process_result_value(1, sqlite.dialect()) == "value 2"
+    assert returned_type.process_bind_param(None, sqlite.dialect()) is None
+    assert returned_type.process_result_value(None, sqlite.dialect()) is None
+    with pytest.raises(ValueError):
+        returned_type.process_bind_param("value 3", sqlite.dialect())
+
+
+@pytest.mark.parametrize(
+    "dialect, value, expected_value",
+    [
+        (sqlite.dialect(), None, None),
+        (sqlite.dialect(), UUID, UUID.bytes),
+        (sqlite.dialect(), str(UUID), UUID.bytes),
+        (postgresql.dialect(), UUID, UUID),
+        (postgresql.dialect(), str(UUID), UUID),
+    ],
+    ids=["None", "sqlite uuid", "sqlite str", "postgresql uuid", "postgresql str"],
+)
+@pytest.mark.column
+def test_uuid_process_bind_param(dialect, value, expected_value):
+    """
+    GIVEN dialect and value
+    WHEN process_bind_param of the uuid type is called with the value and dialect
+    THEN the expected value is returned.
+    """
+    returned_value = uuid_type.UUID().process_bind_param(value, dialect)
+
+    assert returned_value == expected_value
+
+
+@pytest.mark.parametrize(
+    "value, expected_value",
+    [(None, None), (UUID.bytes, UUID), (memoryview(UUID.bytes), UUID), (UUID, UUID)],
+    ids=["None", "bytes", "memoryview", "uuid"],
+)
+@pytest.mark.column
+def test_uuid_process_result_value(value, expected_value):
+    """
+    GIVEN value returned by the database
+    WHEN process_result_value of the uuid type is called with the value
+    THEN the expected value is returned.
+    """
+    returned_value = uuid_type.UUID().process_result_value(value, sqlite.dialect())
+
+    assert returned_value == expected_value
+
+
 @pytest.mark.parametrize(
     "artifacts_kwargs",
     [{"format": "format 1"}, {"max_length": 1}, {"autoincrement": True}],
@@ -582,6 +760,156 @@ def test_handle_boolean():
     assert boolean == sqlalchemy.Boolean
 
 
+@pytest.mark.parametrize(
+    "artifacts_kwargs",
+    [{"format": "format 1"}, {"max_length": 1}, {"autoincrement": True}],
+    ids=["format", "max_length", "autoincrement"],
+)
+@pytest.mark.column
+def test_handle_json_invalid(artifacts_kwargs):
+    """
+    GIVEN artifacts with an artifact that is not supported
+    WHEN _handle_json is called with the artifacts
+    THEN MalformedSchemaError is raised.
+    """
+    artifacts = types.ColumnArtifacts("object", json=True, **artifacts_kwargs)
+
+    with pytest.raises(exceptions.MalformedSchemaError):
+        column._handle_json(artifacts=artifacts)
+
+
+@pytest.mark.parametrize("type_", ["object", "array"])
+@pytest.mark.column
+def test_determine_type_json(type_):
+    """
+    GIVEN artifacts with x-json
+    WHEN _determine_type is called with the artifacts
+    THEN JSON is returned which is JSONB on PostgreSQL.
+    """
+    artifacts = types.ColumnArtifacts(type_, json=True)
+
+    returned_type = column._determine_type(artifacts=artifacts)
+
+    assert isinstance(
+        returned_type.load_dialect_impl(sqlite.dialect()), sqlalchemy.JSON
+    )
+    assert isinstance(
+        returned_type.load_dialect_impl(postgresql.dialect()), postgresql.JSONB
+    )
+
+
+@pytest.mark.column
+def test_check_schema_array():
+    """
+    GIVEN schema for an array of a primitive type
+    WHEN check_schema is called with the schema
+    THEN the schema and artifacts include the items.
+    """
+    schema = {"type": "array", "items": {"type": "string", "maxLength": 2}}
+
+    returned_schema, artifacts = column.check_schema(schema=schema)
+
+    assert returned_schema == schema
+    assert artifacts == types.ColumnArtifacts(
+        "array", items=types.ColumnArtifacts("string", max_length=2)
+    )
+
+
+@pytest.mark.column
+def test_check_schema_array_items_missing():
+    """
+    GIVEN schema for an array without items
+    WHEN check_schema is called with the schema
+    THEN MalformedSchemaError is raised.
+    """
+    with pytest.raises(exceptions.MalformedSchemaError):
+        column.check_schema(schema={"type": "array"})
+
+
+@pytest.mark.parametrize(
+    "artifacts_kwargs, expected_exception",
+    [
+        ({"format": "format 1"}, exceptions.MalformedSchemaError),
+        ({"max_length": 1}, exceptions.MalformedSchemaError),
+        ({"autoincrement": True}, exceptions.MalformedSchemaError),
+        ({"items": None}, exceptions.MalformedSchemaError),
+        (
+            {"items": types.ColumnArtifacts("array")},
+            exceptions.FeatureNotImplementedError,
+        ),
+        (
+            {"items": types.ColumnArtifacts("object")},
+            exceptions.FeatureNotImplementedError,
+        ),
+        (
+            {"items": types.ColumnArtifacts("string", format="date-time")},
+            exceptions.FeatureNotImplementedError,
+        ),
+        (
+            {"items": types.ColumnArtifacts("string", format="uuid")},
+            exceptions.FeatureNotImplementedError,
+        ),
+        (
+            {"items": types.ColumnArtifacts("string", enum=["value 1"])},
+            exceptions.FeatureNotImplementedError,
+        ),
+    ],
+    ids=[
+        "format",
+        "max_length",
+        "autoincrement",
+        "items missing",
+        "array items",
+        "object items",
+        "date-time items",
+        "uuid items",
+        "enum items",
+    ],
+)
+@pytest.mark.column
+def test_handle_array_invalid(artifacts_kwargs, expected_exception):
+    """
+    GIVEN artifacts for an array that are not supported
+    WHEN _handle_array is called with the artifacts
+    THEN the expected exception is raised.
+    """
+    artifacts = types.ColumnArtifacts(
+        "array", **{"items": types.ColumnArtifacts("integer"), **artifacts_kwargs}
+    )
+
+    with pytest.raises(expected_exception):
+        column._handle_array(artifacts=artifacts)
+
+
+@pytest.mark.parametrize(
+    "items_artifacts, expected_items_type",
+    [
+        (types.ColumnArtifacts("integer"), sqlalchemy.Integer),
+        (types.ColumnArtifacts("number"), sqlalchemy.Float),
+        (types.ColumnArtifacts("string"), sqlalchemy.String),
+        (types.ColumnArtifacts("boolean"), sqlalchemy.Boolean),
+    ],
+    ids=["integer", "number", "string", "boolean"],
+)
+@pytest.mark.column
+def test_determine_type_array(items_artifacts, expected_items_type):
+    """
+    GIVEN artifacts for an array of a primitive type
+    WHEN _determine_type is called with the artifacts
+    THEN JSON is returned which is ARRAY of the items type on PostgreSQL.
+    """
+    artifacts = types.ColumnArtifacts("array", items=items_artifacts)
+
+    returned_type = column._determine_type(artifacts=artifacts)
+
+    assert isinstance(
+        returned_type.load_dialect_impl(sqlite.dialect()), sqlalchemy.JSON
+    )
+    postgresql_type = returned_type.load_dialect_impl(postgresql.dialect())
+    assert isinstance(postgresql_type, postgresql.ARRAY)
+    assert isinstance(postgresql_type.item_type, expected_items_type)
+
+
 @pytest.mark.column
 def test_integration():
     """
@@ -3,6 +3,7 @@
 
 import pytest
 import sqlalchemy
+from sqlalchemy.dialects import sqlite
 
 from open_alchemy import column_factory
 
@@ -26,6 +27,71 @@ def test_integration():
     assert spec == {"type": "boolean"}
 
 
+@pytest.mark.parametrize(
+    "spec, expected_spec",
+    [
+        (
+            {
+                "type": "object",
+                "properties": {"key": {"type": "string"}},
+                "x-json": True,
+            },
+            {"type": "object", "x-json": True},
+        ),
+        (
+            {"type": "array", "items": {"type": "string"}, "x-json": True},
+            {"type": "array", "x-json": True},
+        ),
+        (
+            {"type": "object", "nullable": False, "x-json": True},
+            {"type": "object", "nullable": False, "x-json": True},
+        ),
+    ],
+    ids=["object", "array", "nullable"],
+)
+@pytest.mark.column
+def test_integration_json(spec, expected_spec):
+    """
+    GIVEN object or array schema with x-json
+    WHEN column_factory is called with the schema
+    THEN a single SQLAlchemy JSON column is returned with the spec.
+    """
+    ([(logical_name, column)], returned_spec) = column_factory.column_factory(
+        spec=spec, schemas={}, logical_name="column_1", model_schema={}
+    )
+
+    assert logical_name == "column_1"
+    assert isinstance(column.type.load_dialect_impl(sqlite.dialect()), sqlalchemy.JSON)
+    assert returned_spec == expected_spec
+
+
+@pytest.mark.parametrize(
+    "spec, schemas",
+    [
+        ({"type": "array", "items": {"type": "string"}}, {}),
+        (
+            {"type": "array", "items": {"$ref": "#/components/schemas/Tag"}},
+            {"Tag": {"type": "string"}},
+        ),
+    ],
+    ids=["items", "items $ref"],
+)
+@pytest.mark.column
+def test_integration_array(spec, schemas):
+    """
+    GIVEN schema for an array of a primitive type
+    WHEN column_factory is called with the schema
+    THEN a single column is returned with the spec of the array.
+    """
+    ([(logical_name, column)], returned_spec) = column_factory.column_factory(
+        spec=spec, schemas=schemas, logical_name="column_1", model_schema={}
+    )
+
+    assert logical_name == "column_1"
+    assert isinstance(column.type.load_dialect_impl(sqlite.dialect()), sqlalchemy.JSON)
+    assert returned_spec == {"type": "array", "items": {"type": "string"}}
+
+
 @pytest.mark.column
 def test_integration_all_of():
     """
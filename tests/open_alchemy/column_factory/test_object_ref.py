@@ -136,6 +136,31 @@ def test_handle_object_reference_fk_return():
     assert return_value == {"type": "fkType", "x-foreign-key": "table 1.fk"}
 
 
+@pytest.mark.column
+def test_handle_object_reference_fk_format():
+    """
+    GIVEN object schema with x-tablename and id property with a type and format
+    WHEN handle_object_reference is called with the schema
+    THEN a schema with the type and format of the id property and x-foreign-key
+        property.
+    """
+    spec = {
+        "x-tablename": "table 1",
+        "properties": {"id": {"type": "string", "format": "uuid"}},
+    }
+    schemas = {}
+
+    return_value = object_ref.handle_object_reference(
+        spec=spec, schemas=schemas, fk_column="id"
+    )
+
+    assert return_value == {
+        "type": "string",
+        "format": "uuid",
+        "x-foreign-key": "table 1.id",
+    }
+
+
 @pytest.mark.parametrize(
     "spec, schemas, expected_spec",
     [
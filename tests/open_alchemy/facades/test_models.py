@@ -1,5 +1,6 @@
 """Tests for models facade."""
 
+from concurrent import futures
 from unittest import mock
 
 import pytest
@@ -76,3 +77,65 @@ def test_set_model(mocked_models):
     models.set_model(model=model, name=name)
 
     assert getattr(mocked_models, name) == model
+
+
+@pytest.mark.facade
+def test_get_models(mocked_models):
+    """
+    GIVEN mocked models
+    WHEN get_models is called
+    THEN the mocked models are returned.
+    """
+    assert models.get_models() == mocked_models
+
+
+@pytest.mark.facade
+def test_bind(_mocked_models):
+    """
+    GIVEN mocked models and a separate namespace
+    WHEN the facade is used while the namespace is bound
+    THEN the namespace is used instead of the mocked models until the binding ends.
+    """
+    namespace = mock.MagicMock()
+    model = mock.MagicMock()
+
+    with models.bind(models=namespace):
+        assert models.get_models() == namespace
+        assert models.get_base() == namespace.Base
+        models.set_model(name="Model", model=model)
+        assert models.get_model(name="Model") == model
+
+    assert models.get_models() != namespace
+    assert namespace.Model == model
+
+
+@pytest.mark.facade
+def test_bind_none(mocked_models):
+    """
+    GIVEN mocked models and a bound namespace
+    WHEN None is bound
+    THEN the bound namespace is still used.
+    """
+    namespace = mock.MagicMock()
+
+    with models.bind(models=namespace):
+        with models.bind(models=None):
+            assert models.get_models() == namespace
+        assert models.get_models() == namespace
+    assert models.get_models() == mocked_models
+
+
+@pytest.mark.facade
+def test_bind_thread(mocked_models):
+    """
+    GIVEN mocked models and a namespace bound in the current thread
+    WHEN get_models is called from another thread
+    THEN the mocked models are returned.
+    """
+    namespace = mock.MagicMock()
+
+    with models.bind(models=namespace):
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            returned_models = executor.submit(models.get_models).result()
+
+    assert returned_models == mocked_models
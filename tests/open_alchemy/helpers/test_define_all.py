@@ -5,6 +5,7 @@ from unittest import mock
 import pytest
 
 from open_alchemy import helpers
+from open_alchemy.helpers.define_all import check_patterns
 
 
 @pytest.mark.parametrize(
@@ -45,3 +46,153 @@ def test_call(schemas, expected_calls):
     assert model_factory.call_count == len(expected_calls)
     for name in expected_calls:
         model_factory.assert_any_call(name=name)
+
+
+_REF_SCHEMAS = {
+    "Parent": {
+        "x-tablename": "parent",
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "child": {"$ref": "#/components/schemas/Child"},
+        },
+    },
+    "Child": {
+        "x-tablename": "child",
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "toys": {"type": "array", "items": {"$ref": "#/components/schemas/Toy"}},
+        },
+    },
+    "Toy": {
+        "x-tablename": "toy",
+        "type": "object",
+        "properties": {"id": {"type": "integer"}},
+    },
+    "Other": {
+        "x-tablename": "other",
+        "type": "object",
+        "properties": {"id": {"type": "integer"}},
+    },
+    "NotModel": {"type": "object", "properties": {"id": {"type": "integer"}}},
+}
+
+
+@pytest.mark.parametrize(
+    "include, exclude, expected_calls",
+    [
+        (None, None, ["Parent", "Child", "Toy", "Other"]),
+        (["Other"], None, ["Other"]),
+        (["Toy"], None, ["Toy"]),
+        (["Child"], None, ["Child", "Toy"]),
+        (["Parent"], None, ["Parent", "Child", "Toy"]),
+        (["O*"], None, ["Other"]),
+        (["Other", "Toy"], None, ["Toy", "Other"]),
+        (["NotModel"], None, []),
+        (None, ["Other"], ["Parent", "Child", "Toy"]),
+        (None, ["Toy"], ["Parent", "Child", "Toy", "Other"]),
+        (None, ["P*", "C*"], ["Toy", "Other"]),
+        (["*"], ["Parent"], ["Child", "Toy", "Other"]),
+    ],
+    ids=[
+        "no patterns",
+        "include single no dependencies",
+        "include single leaf",
+        "include single one dependency",
+        "include single transitive dependencies",
+        "include glob",
+        "include multiple",
+        "include not model",
+        "exclude single",
+        "exclude required",
+        "exclude multiple",
+        "include and exclude",
+    ],
+)
+@pytest.mark.helper
+def test_call_patterns(include, exclude, expected_calls):
+    """
+    GIVEN mocked model factory, schemas with relationships, include and exclude
+        patterns
+    WHEN define_all is called with the model factory, schemas and patterns
+    THEN the mocked model factory is called with the selected models and their
+        dependencies in the order of the schemas.
+    """
+    model_factory = mock.MagicMock()
+
+    helpers.define_all(
+        model_factory=model_factory,
+        schemas=_REF_SCHEMAS,
+        include=include,
+        exclude=exclude,
+    )
+
+    assert model_factory.call_args_list == [
+        mock.call(name=name) for name in expected_calls
+    ]
+
+
+@pytest.mark.parametrize(
+    "define_all, include, exclude, expected_exception",
+    [
+        (True, "Other", None, TypeError),
+        (True, None, "Other", TypeError),
+        (False, ["Other"], None, ValueError),
+        (False, None, ["Other"], ValueError),
+    ],
+    ids=["include string", "exclude string", "include", "exclude"],
+)
+@pytest.mark.helper
+def test_check_patterns_invalid(define_all, include, exclude, expected_exception):
+    """
+    GIVEN define_all and include or exclude that are a string or passed without
+        define_all
+    WHEN check_patterns is called with them
+    THEN the expected exception is raised.
+    """
+    with pytest.raises(expected_exception):
+        check_patterns(define_all=define_all, include=include, exclude=exclude)
+
+
+@pytest.mark.helper
+def test_call_patterns_string():
+    """
+    GIVEN mocked model factory, schemas and include pattern that is a string
+    WHEN define_all is called with the model factory, schemas and pattern
+    THEN TypeError is raised and no model is defined.
+    """
+    model_factory = mock.MagicMock()
+
+    with pytest.raises(TypeError):
+        helpers.define_all(
+            model_factory=model_factory, schemas=_REF_SCHEMAS, include="Other"
+        )
+
+    model_factory.assert_not_called()
+
+
+@pytest.mark.helper
+def test_call_remote_ref(tmp_path):
+    """
+    GIVEN schemas that reference a model and a schema that is not a model in another
+        file and a schema that references a model in the same file
+    WHEN define_all is called with the schemas
+    THEN only the schema that references the model in the other file is defined.
+    """
+    remote = tmp_path / "remote.json"
+    remote.write_text(
+        '{"components": {"schemas": {"Table": {"x-tablename": "table"}, '
+        '"Column": {"type": "integer"}}}}'
+    )
+    schemas = {
+        "Table": {"$ref": f"{remote}#/components/schemas/Table"},
+        "Column": {"$ref": f"{remote}#/components/schemas/Column"},
+        "Alias": {"$ref": "#/components/schemas/Local"},
+        "Local": {"type": "object"},
+    }
+    model_factory = mock.MagicMock()
+
+    helpers.define_all(model_factory=model_factory, schemas=schemas)
+
+    assert model_factory.call_args_list == [mock.call(name="Table")]
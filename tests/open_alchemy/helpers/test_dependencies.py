@@ -0,0 +1,182 @@
+"""Tests for dependencies helper."""
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy import helpers
+
+
+@pytest.mark.parametrize(
+    "schemas, expected_dependencies",
+    [
+        (
+            {"Schema": {"properties": {"column": {"type": "integer"}}}},
+            set(),
+        ),
+        (
+            {
+                "Schema": {
+                    "properties": {"ref": {"$ref": "#/components/schemas/RefSchema"}}
+                },
+                "RefSchema": {"x-tablename": "ref_schema"},
+            },
+            {"RefSchema"},
+        ),
+        (
+            {
+                "Schema": {
+                    "properties": {
+                        "ref": {
+                            "allOf": [
+                                {"$ref": "#/components/schemas/RefSchema"},
+                                {"x-backref": "schema"},
+                            ]
+                        }
+                    }
+                },
+                "RefSchema": {"x-tablename": "ref_schema"},
+            },
+            {"RefSchema"},
+        ),
+        (
+            {
+                "Schema": {
+                    "properties": {
+                        "refs": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/RefSchema"},
+                        }
+                    }
+                },
+                "RefSchema": {"x-tablename": "ref_schema"},
+            },
+            {"RefSchema"},
+        ),
+        (
+            {
+                "Schema": {
+                    "properties": {"refs": {"$ref": "#/components/schemas/RefArray"}}
+                },
+                "RefArray": {
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/RefSchema"},
+                },
+                "RefSchema": {"x-tablename": "ref_schema"},
+            },
+            {"RefSchema"},
+        ),
+        (
+            {
+                "Schema": {
+                    "properties": {"column": {"$ref": "#/components/schemas/Column"}}
+                },
+                "Column": {"type": "integer"},
+            },
+            set(),
+        ),
+        (
+            {
+                "Schema": {
+                    "properties": {
+                        "ref": {
+                            "readOnly": True,
+                            "$ref": "#/components/schemas/RefSchema",
+                        }
+                    }
+                },
+                "RefSchema": {"x-tablename": "ref_schema"},
+            },
+            set(),
+        ),
+        (
+            {
+                "Schema": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Base"},
+                        {"properties": {"column": {"type": "integer"}}},
+                    ]
+                },
+                "Base": {
+                    "properties": {"ref": {"$ref": "#/components/schemas/RefSchema"}}
+                },
+                "RefSchema": {"x-tablename": "ref_schema"},
+            },
+            {"RefSchema"},
+        ),
+        (
+            {
+                "Schema": {
+                    "x-tablename": "schema",
+                    "properties": {"ref": {"$ref": "#/components/schemas/Schema"}},
+                }
+            },
+            set(),
+        ),
+    ],
+    ids=[
+        "no references",
+        "$ref",
+        "allOf $ref",
+        "array",
+        "$ref array",
+        "$ref column",
+        "readOnly",
+        "model allOf",
+        "self reference",
+    ],
+)
+@pytest.mark.helper
+def test_dependencies(schemas, expected_dependencies):
+    """
+    GIVEN schemas and the name of a schema
+    WHEN dependencies is called with the schemas and name
+    THEN the expected dependencies are returned.
+    """
+    returned_dependencies = helpers.dependencies.dependencies(
+        name="Schema", schemas=schemas
+    )
+
+    assert returned_dependencies == expected_dependencies
+
+
+@pytest.mark.helper
+def test_dependencies_ref_missing():
+    """
+    GIVEN schemas where a property references a schema that does not exist
+    WHEN dependencies is called with the schemas
+    THEN SchemaNotFoundError is raised.
+    """
+    schemas = {
+        "Schema": {"properties": {"ref": {"$ref": "#/components/schemas/RefSchema"}}}
+    }
+
+    with pytest.raises(exceptions.SchemaNotFoundError):
+        helpers.dependencies.dependencies(name="Schema", schemas=schemas)
+
+
+@pytest.mark.helper
+def test_closure():
+    """
+    GIVEN schemas with transitive and circular references
+    WHEN closure is called with the schemas and a name
+    THEN the name and all the transitively referenced models are returned.
+    """
+    schemas = {
+        "Schema1": {
+            "x-tablename": "schema_1",
+            "properties": {"ref": {"$ref": "#/components/schemas/Schema2"}},
+        },
+        "Schema2": {
+            "x-tablename": "schema_2",
+            "properties": {
+                "ref_1": {"$ref": "#/components/schemas/Schema1"},
+                "ref_3": {"$ref": "#/components/schemas/Schema3"},
+            },
+        },
+        "Schema3": {"x-tablename": "schema_3", "properties": {}},
+        "Schema4": {"x-tablename": "schema_4", "properties": {}},
+    }
+
+    returned_closure = helpers.dependencies.closure(names=["Schema1"], schemas=schemas)
+
+    assert returned_closure == {"Schema1", "Schema2", "Schema3"}
@@ -1,9 +1,13 @@
 """Tests for get_ext_prop."""
 
+import subprocess
+import sys
+
 import pytest
 
 from open_alchemy import exceptions
 from open_alchemy import helpers
+from open_alchemy.helpers.get_ext_prop import schemas as ext_prop_schemas
 
 
 @pytest.mark.helper
@@ -43,6 +47,8 @@ def test_miss_default():
         ("x-foreign-key", True),
         ("x-foreign-key", "no column"),
         ("x-foreign-key-column", True),
+        ("x-json", "True"),
+        ("x-enum-code", "True"),
         ("x-tablename", True),
         ("x-de-$ref", True),
         ("x-dict-ignore", "True"),
@@ -58,6 +64,8 @@ def test_miss_default():
         "x-foreign-key invalid type",
         "x-foreign-key invalid format",
         "x-foreign-key-column",
+        "x-json",
+        "x-enum-code",
         "x-tablename",
         "x-de-$ref",
         "x-dict-ignore",
@@ -88,6 +96,8 @@ def test_invalid(name, value):
         ("x-unique", True),
         ("x-foreign-key", "table 1.column 1"),
         ("x-foreign-key-column", "column 1"),
+        ("x-json", True),
+        ("x-enum-code", True),
         ("x-tablename", "table 1"),
         ("x-de-$ref", "Table1"),
         ("x-dict-ignore", True),
@@ -102,6 +112,8 @@ def test_invalid(name, value):
         "x-unique",
         "x-foreign-key",
         "x-foreign-key-column",
+        "x-json",
+        "x-enum-code",
         "x-tablename",
         "x-de-$ref",
         "x-dict-ignore",
@@ -266,3 +278,31 @@ def test_composite_index_valid(value):
     returned_value = helpers.get_ext_prop(source=source, name=name)
 
     assert returned_value == value
+
+
+@pytest.mark.helper
+def test_schemas_loaded_once():
+    """
+    GIVEN extension property
+    WHEN the validator for the extension property is requested multiple times
+    THEN the same validator is returned which uses the shared extension schemas.
+    """
+    first = ext_prop_schemas.validator("x-tablename")
+    second = ext_prop_schemas.validator("x-tablename")
+
+    assert first is second
+    assert first.schema is ext_prop_schemas.extension_schemas()["x-tablename"]
+
+
+@pytest.mark.helper
+def test_import_does_not_import_jsonschema():
+    """
+    GIVEN new interpreter
+    WHEN open_alchemy is imported
+    THEN jsonschema is not imported.
+    """
+    code = "import sys, open_alchemy; print('jsonschema' in sys.modules)"
+
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+
+    assert output.strip() == "False"
@@ -0,0 +1,220 @@
+"""Tests for intern helper."""
+
+import copy
+import gc
+import json
+import pickle
+import weakref
+
+import pytest
+
+from open_alchemy import helpers
+
+
+@pytest.mark.helper
+def test_intern_shared():
+    """
+    GIVEN two separate but identical schemas
+    WHEN intern is called with each
+    THEN the same schema is returned which is equal to the schemas.
+    """
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+
+    first = helpers.intern.intern(copy.deepcopy(schema))
+    second = helpers.intern.intern(copy.deepcopy(schema))
+
+    assert first is second
+    assert first == schema
+
+
+@pytest.mark.helper
+def test_intern_nested_shared():
+    """
+    GIVEN two different schemas with an identical property
+    WHEN intern is called with each
+    THEN the property schemas are the same object.
+    """
+    first = helpers.intern.intern({"properties": {"a": {"type": "string"}}})
+    second = helpers.intern.intern({"properties": {"b": {"type": "string"}}})
+
+    assert first is not second
+    assert first["properties"]["a"] is second["properties"]["b"]
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ({"default": 1}, {"default": True}),
+        ({"default": 1}, {"default": 1.0}),
+        ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+        ({"required": ["a", "b"]}, {"required": ["b", "a"]}),
+    ],
+    ids=["integer boolean", "integer float", "key order", "list order"],
+)
+@pytest.mark.helper
+def test_intern_not_shared(first, second):
+    """
+    GIVEN two schemas that are equal but have different types or order
+    WHEN intern is called with each
+    THEN different schemas are returned that preserve the types and order.
+    """
+    first_interned = helpers.intern.intern(first)
+    second_interned = helpers.intern.intern(second)
+
+    assert first_interned is not second_interned
+    assert json.dumps(first_interned) == json.dumps(first)
+    assert json.dumps(second_interned) == json.dumps(second)
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        lambda schema: schema.__setitem__("type", "string"),
+        lambda schema: schema.__delitem__("type"),
+        lambda schema: schema.update({"type": "string"}),
+        lambda schema: schema.pop("type"),
+        lambda schema: schema.setdefault("key", "value"),
+        lambda schema: schema["required"].append("b"),
+        lambda schema: schema["required"].__setitem__(0, "b"),
+    ],
+    ids=["set", "del", "update", "pop", "setdefault", "list append", "list set"],
+)
+@pytest.mark.helper
+def test_intern_immutable(modify):
+    """
+    GIVEN interned schema
+    WHEN the schema is modified
+    THEN TypeError is raised.
+    """
+    schema = helpers.intern.intern({"type": "object", "required": ["a"]})
+
+    with pytest.raises(TypeError):
+        modify(schema)
+
+
+@pytest.mark.parametrize(
+    "duplicate",
+    [copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+@pytest.mark.helper
+def test_intern_duplicate(duplicate):
+    """
+    GIVEN interned schema
+    WHEN the schema is duplicated
+    THEN an equal schema is returned.
+    """
+    schema = {"type": "object", "required": ["a"], "properties": {"a": {}}}
+    interned = helpers.intern.intern(schema)
+
+    returned = duplicate(interned)
+
+    assert returned == schema
+
+
+@pytest.mark.helper
+def test_size_of_seen():
+    """
+    GIVEN two schemas sharing a property schema
+    WHEN size_of is called for both with the same seen ids
+    THEN the shared property schema is only counted once.
+    """
+    first = helpers.intern.intern({"a": {"type": "string", "maxLength": 255}})
+    second = helpers.intern.intern({"b": {"type": "string", "maxLength": 255}})
+    unshared = helpers.intern.size_of(first) + helpers.intern.size_of(second)
+
+    seen = set()
+    shared = helpers.intern.size_of(first, seen=seen) + helpers.intern.size_of(
+        second, seen=seen
+    )
+
+    assert shared < unshared
+
+
+@pytest.mark.helper
+def test_intern_freed():
+    """
+    GIVEN schema that has been interned
+    WHEN the interned schema is no longer used
+    THEN it is collected and an identical schema can be interned again.
+    """
+    schema = {"x-test-freed": {"type": "string", "maxLength": 123}}
+    interned = helpers.intern.intern(copy.deepcopy(schema))
+    reference = weakref.ref(interned)
+
+    del interned
+    gc.collect()
+
+    assert reference() is None
+    assert helpers.intern.intern(copy.deepcopy(schema)) == schema
+
+
+@pytest.mark.helper
+def test_table_size_seen():
+    """
+    GIVEN schema that has been interned
+    WHEN table_size is called with the ids of the strings already counted
+    THEN the table is smaller than when the strings are counted.
+    """
+    interned = helpers.intern.intern({"x-test-seen": {"type": "string"}})
+    seen = set()
+    helpers.intern.size_of(interned, seen=seen)
+
+    assert (
+        0
+        < helpers.intern.table_size(schemas=[interned], seen=seen)
+        < helpers.intern.table_size(schemas=[interned])
+    )
+
+
+@pytest.mark.helper
+def test_table_size_other_schemas():
+    """
+    GIVEN interned schema
+    WHEN table_size is called with the schema before and after other schemas are
+        interned
+    THEN the size does not change.
+    """
+    interned = helpers.intern.intern({"x-test-other": {"type": "string"}})
+    size = helpers.intern.table_size(schemas=[interned])
+
+    others = [helpers.intern.intern({f"x-test-other-{idx}": {}}) for idx in range(50)]
+
+    assert helpers.intern.table_size(schemas=[interned]) == size
+    assert helpers.intern.table_size(schemas=[interned, *others]) > size
+
+
+@pytest.mark.helper
+def test_freeze():
+    """
+    GIVEN specification
+    WHEN freeze is called with the specification
+    THEN an equal specification is returned which cannot be modified and does not
+        share any values with other frozen specifications.
+    """
+    spec = {"components": {"schemas": {"Schema": {"required": ["id"]}}}}
+
+    frozen = helpers.intern.freeze(spec)
+
+    assert frozen == spec
+    assert frozen is not spec
+    with pytest.raises(TypeError):
+        frozen["components"]["schemas"]["Other"] = {}
+    with pytest.raises(TypeError):
+        frozen["components"]["schemas"]["Schema"]["required"].append("name")
+    other = helpers.intern.freeze(copy.deepcopy(spec))
+    assert other["components"] is not frozen["components"]
+
+
+@pytest.mark.helper
+def test_freeze_frozen():
+    """
+    GIVEN frozen specification
+    WHEN freeze is called with the specification
+    THEN the specification is returned.
+    """
+    frozen = helpers.intern.freeze({"components": {"schemas": {}}})
+
+    returned = helpers.intern.freeze(frozen)
+
+    assert returned is frozen
@@ -238,3 +238,119 @@ def test_peek_key(schema, schemas, expected_value):
     returned_type = helpers.peek.peek_key(schema=schema, schemas=schemas, key="key")
 
     assert returned_type == expected_value
+
+
+@pytest.mark.helper
+def test_json_wrong_type():
+    """
+    GIVEN schema with x-json that is not a boolean
+    WHEN json is called with the schema
+    THEN MalformedSchemaError is raised.
+    """
+    schema = {"x-json": "True"}
+
+    with pytest.raises(exceptions.MalformedSchemaError):
+        helpers.peek.json(schema=schema, schemas={})
+
+
+@pytest.mark.parametrize(
+    "schema, schemas, expected_json",
+    [
+        ({}, {}, False),
+        ({"x-json": False}, {}, False),
+        ({"x-json": True}, {}, True),
+        ({"$ref": "#/components/schemas/Ref"}, {"Ref": {"x-json": True}}, True),
+        ({"allOf": [{"type": "object"}, {"x-json": True}]}, {}, True),
+    ],
+    ids=["missing", "false", "true", "$ref", "allOf"],
+)
+@pytest.mark.helper
+def test_json(schema, schemas, expected_json):
+    """
+    GIVEN schema
+    WHEN json is called with the schema
+    THEN the expected value is returned.
+    """
+    returned_json = helpers.peek.json(schema=schema, schemas=schemas)
+
+    assert returned_json == expected_json
+
+
+@pytest.mark.helper
+def test_items_wrong_type():
+    """
+    GIVEN schema with items that is not an object
+    WHEN items is called with the schema
+    THEN MalformedSchemaError is raised.
+    """
+    schema = {"items": "string"}
+
+    with pytest.raises(exceptions.MalformedSchemaError):
+        helpers.peek.items(schema=schema, schemas={})
+
+
+@pytest.mark.parametrize(
+    "schema, schemas, expected_items",
+    [
+        ({}, {}, None),
+        ({"items": {"type": "string"}}, {}, {"type": "string"}),
+        (
+            {"$ref": "#/components/schemas/Ref"},
+            {"Ref": {"items": {"type": "string"}}},
+            {"type": "string"},
+        ),
+    ],
+    ids=["missing", "present", "$ref"],
+)
+@pytest.mark.helper
+def test_items(schema, schemas, expected_items):
+    """
+    GIVEN schema
+    WHEN items is called with the schema
+    THEN the expected items are returned.
+    """
+    returned_items = helpers.peek.items(schema=schema, schemas=schemas)
+
+    assert returned_items == expected_items
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [{"enum": "value 1"}, {"enum": []}],
+    ids=["not list", "empty"],
+)
+@pytest.mark.helper
+def test_enum_invalid(schema):
+    """
+    GIVEN schema with enum that is not a non-empty list
+    WHEN enum is called with the schema
+    THEN MalformedSchemaError is raised.
+    """
+    with pytest.raises(exceptions.MalformedSchemaError):
+        helpers.peek.enum(schema=schema, schemas={})
+
+
+@pytest.mark.parametrize(
+    "schema, schemas, expected_enum",
+    [
+        ({}, {}, None),
+        ({"enum": ["value 1"]}, {}, ["value 1"]),
+        (
+            {"$ref": "#/components/schemas/Ref"},
+            {"Ref": {"enum": ["value 1"]}},
+            ["value 1"],
+        ),
+        ({"allOf": [{"type": "string"}, {"enum": ["value 1"]}]}, {}, ["value 1"]),
+    ],
+    ids=["missing", "present", "$ref", "allOf"],
+)
+@pytest.mark.helper
+def test_enum(schema, schemas, expected_enum):
+    """
+    GIVEN schema
+    WHEN enum is called with the schema
+    THEN the expected value is returned.
+    """
+    returned_enum = helpers.peek.enum(schema=schema, schemas=schemas)
+
+    assert returned_enum == expected_enum
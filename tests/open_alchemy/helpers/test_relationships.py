@@ -0,0 +1,48 @@
+"""Tests for constructing relationships that can be copied."""
+
+import pytest
+from sqlalchemy import orm
+
+from open_alchemy import exceptions
+from open_alchemy import helpers
+
+
+@pytest.mark.helper
+def test_copy():
+    """
+    GIVEN relationship constructed with options that are not the default
+    WHEN copy is called with the relationship
+    THEN a different relationship with the same options and its own back reference
+        arguments is returned.
+    """
+    relationship = helpers.relationships.construct(
+        "Division",
+        backref=orm.backref("employees", uselist=False),
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Division.name",
+    )
+
+    copied = helpers.relationships.copy(relationship)
+
+    assert copied is not relationship
+    assert copied.argument == "Division"
+    assert copied.lazy == "selectin"
+    assert copied.cascade.delete_orphan
+    assert copied.passive_deletes is True
+    assert copied.order_by == "Division.name"
+    assert copied.backref == ("employees", {"uselist": False})
+    assert copied.backref[1] is not relationship.backref[1]
+    assert helpers.relationships.copy(copied).lazy == "selectin"
+
+
+@pytest.mark.helper
+def test_copy_not_constructed():
+    """
+    GIVEN relationship that was not constructed using construct
+    WHEN copy is called with the relationship
+    THEN FeatureNotImplementedError is raised.
+    """
+    with pytest.raises(exceptions.FeatureNotImplementedError):
+        helpers.relationships.copy(orm.relationship("Division"))
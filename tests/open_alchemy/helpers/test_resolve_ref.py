@@ -1,12 +1,18 @@
 """Tests for resolve_ref."""
 
 import copy
+import importlib
+import json
+from unittest import mock
 
 import pytest
 
 from open_alchemy import exceptions
 from open_alchemy import helpers
 
+# The module is shadowed by the function with the same name on helpers
+REF_MODULE = importlib.import_module("open_alchemy.helpers.resolve_ref")
+
 
 @pytest.mark.helper
 def test_resolve_ref_exists():
@@ -107,3 +113,173 @@ def test_resolve_ref_nested():
 
     assert return_name == ref_name
     assert return_schema == ref_schema
+
+
+@pytest.fixture
+def remote_files(tmp_path):
+    """Files referenced by remote references with an empty cache."""
+    common = {
+        "components": {
+            "schemas": {
+                "Address": {
+                    "type": "object",
+                    "properties": {
+                        "country": {"$ref": "#/components/schemas/Country"},
+                        "zip": {"$ref": "codes/zip.json#/components/schemas/Zip"},
+                    },
+                },
+                "Country": {"type": "string"},
+            }
+        }
+    }
+    (tmp_path / "common.yaml").write_text(json.dumps(common))
+    (tmp_path / "codes").mkdir()
+    zip_spec = {"components": {"schemas": {"Zip": {"type": "integer"}}}}
+    (tmp_path / "codes" / "zip.json").write_text(json.dumps(zip_spec))
+    (tmp_path / "unused.yaml").write_text("invalid: [")
+    REF_MODULE.clear_cache()
+    yield tmp_path
+    REF_MODULE.clear_cache()
+
+
+@pytest.mark.helper
+def test_get_ref_remote(remote_files):
+    """
+    GIVEN file with a schema with local and remote references
+    WHEN get_ref is called with a reference to the schema in the file
+    THEN the name and the schema with references relative to the file are returned
+        and the references resolve to the schemas in the files.
+    """
+    common = remote_files / "common.yaml"
+
+    name, schema = helpers.get_ref(
+        ref=f"{common}#/components/schemas/Address", schemas={}
+    )
+
+    assert name == "Address"
+    country_ref = schema["properties"]["country"]["$ref"]
+    zip_ref = schema["properties"]["zip"]["$ref"]
+    assert country_ref == f"{common}#/components/schemas/Country"
+    assert zip_ref == f"{remote_files / 'codes' / 'zip.json'}#/components/schemas/Zip"
+    assert helpers.get_ref(ref=country_ref, schemas={}) == (
+        "Country",
+        {"type": "string"},
+    )
+    assert helpers.get_ref(ref=zip_ref, schemas={}) == ("Zip", {"type": "integer"})
+
+
+@pytest.mark.helper
+def test_get_ref_remote_relative(remote_files, monkeypatch):
+    """
+    GIVEN file with a schema
+    WHEN get_ref is called with a reference relative to the current directory
+    THEN the schema is returned.
+    """
+    monkeypatch.chdir(remote_files)
+
+    name, schema = helpers.get_ref(
+        ref="common.yaml#/components/schemas/Country", schemas={}
+    )
+
+    assert (name, schema) == ("Country", {"type": "string"})
+
+
+@pytest.mark.helper
+def test_get_ref_remote_cached(remote_files):
+    """
+    GIVEN files with schemas
+    WHEN get_ref is called multiple times with references to schemas in one file
+    THEN the file is only loaded once, the same schema is returned and the other
+        files are not loaded.
+    """
+    common = remote_files / "common.yaml"
+    with mock.patch.object(
+        REF_MODULE, "_load_document", wraps=REF_MODULE._load_document
+    ) as mock_load_document:
+        first = helpers.get_ref(ref=f"{common}#/components/schemas/Address", schemas={})
+        second = helpers.get_ref(
+            ref=f"{common}#/components/schemas/Address", schemas={}
+        )
+        helpers.get_ref(ref=f"{common}#/components/schemas/Country", schemas={})
+
+    assert first is second
+    mock_load_document.assert_called_once_with(str(common))
+
+
+@pytest.mark.parametrize(
+    "ref",
+    [
+        "missing.yaml#/components/schemas/Address",
+        "common.yaml#/components/schemas/Missing",
+    ],
+    ids=["file missing", "schema missing"],
+)
+@pytest.mark.helper
+def test_get_ref_remote_not_found(remote_files, monkeypatch, ref):
+    """
+    GIVEN remote reference to a file or a schema that does not exist
+    WHEN get_ref is called with the reference
+    THEN SchemaNotFoundError is raised.
+    """
+    monkeypatch.chdir(remote_files)
+
+    with pytest.raises(exceptions.SchemaNotFoundError):
+        helpers.get_ref(ref=ref, schemas={})
+
+
+@pytest.mark.helper
+def test_get_ref_remote_model_not_in_schemas(remote_files):
+    """
+    GIVEN file with the schema of a model
+    WHEN get_ref is called with a reference to the model and schemas without the name
+        of the model
+    THEN MalformedSchemaError is raised.
+    """
+    models = remote_files / "models.json"
+    models.write_text(
+        json.dumps(
+            {"components": {"schemas": {"Office": {"x-tablename": "office"}}}}
+        )
+    )
+    ref = f"{models}#/components/schemas/Office"
+
+    with pytest.raises(exceptions.MalformedSchemaError):
+        helpers.get_ref(ref=ref, schemas={})
+    assert helpers.get_ref(ref=ref, schemas={"Office": {"$ref": ref}})[0] == "Office"
+
+
+@pytest.mark.parametrize(
+    "alias",
+    [
+        {"$ref": "{second}"},
+        {"allOf": [{"$ref": "#/components/schemas/Local"}, {"x-backref": "offices"}]},
+        {"x-tablename": "office"},
+    ],
+    ids=["other file", "local chain to other file", "local model"],
+)
+@pytest.mark.helper
+def test_get_ref_remote_model_conflict(remote_files, alias):
+    """
+    GIVEN two files with the schema of a model with the same name and a schema with
+        the name of the model that does not reference the model in the first file
+    WHEN get_ref is called with a reference to the model in the first file
+    THEN MalformedSchemaError is raised.
+    """
+    refs = []
+    for filename in ("first.json", "second.json"):
+        models = remote_files / filename
+        models.write_text(
+            json.dumps(
+                {"components": {"schemas": {"Office": {"x-tablename": filename}}}}
+            )
+        )
+        refs.append(f"{models}#/components/schemas/Office")
+    schemas = {
+        "Office": json.loads(json.dumps(alias).replace("{second}", refs[1])),
+        "Local": {"$ref": refs[1]},
+    }
+
+    with pytest.raises(exceptions.MalformedSchemaError):
+        helpers.get_ref(ref=refs[0], schemas=schemas)
+    if "$ref" in alias:
+        assert helpers.get_ref(ref=refs[1], schemas=schemas)[0] == "Office"
@@ -2,9 +2,11 @@
 
 import functools
 
+import jsonschema
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy.helpers.get_ext_prop import schemas as ext_prop_schemas
 from open_alchemy.table_args import factory
 
 
@@ -108,10 +110,10 @@ def test_spec_to_name_schemas(schema_names, spec, raises):
 def test_map_unique(spec, expected_spec):
     """
     GIVEN specification and expected specification
-    WHEN _map_unique is called with the specification
+    WHEN map_unique is called with the specification
     THEN the expected specification is returned which is a valid UniqueList.
     """
-    returned_spec = factory._map_unique(spec=spec)  # pylint: disable=protected-access
+    returned_spec = factory.map_unique(spec=spec)
 
     assert returned_spec == expected_spec
     assert (
@@ -146,10 +148,10 @@ def test_map_unique(spec, expected_spec):
 def test_map_index(spec, expected_spec):
     """
     GIVEN specification and expected specification
-    WHEN _map_index is called with the specification
+    WHEN map_index is called with the specification
     THEN the expected specification is returned which is a valid IndexList.
     """
-    returned_spec = factory._map_index(spec=spec)  # pylint: disable=protected-access
+    returned_spec = factory.map_index(spec=spec)
 
     assert returned_spec == expected_spec
     assert (
@@ -173,7 +175,7 @@ def test_map_index(spec, expected_spec):
 def test_construct_unique(spec, expected_name, expected_columns):
     """
     GIVEN spec, expected name and columns
-    WHEN _construct_unique is called
+    WHEN construct_unique is called
     THEN a unique constraint with the expected name and columns is returned.
     """
     assert (
@@ -181,7 +183,7 @@ def test_construct_unique(spec, expected_name, expected_columns):
         == "Unique"
     )
 
-    unique = factory._construct_unique(spec=spec)  # pylint: disable=protected-access
+    unique = factory.construct_unique(spec=spec)
 
     assert unique.name == expected_name
     assert (
@@ -208,7 +210,7 @@ def test_construct_unique(spec, expected_name, expected_columns):
 def test_construct_index(spec, expected_name, expected_expressions, expected_unique):
     """
     GIVEN spec, expected name, expressions and unique
-    WHEN _construct_index is called
+    WHEN construct_index is called
     THEN a index with the expected name, expressions and unique is returned.
     """
     assert (
@@ -216,7 +218,7 @@ def test_construct_index(spec, expected_name, expected_expressions, expected_uni
         == "Index"
     )
 
-    index = factory._construct_index(spec=spec)  # pylint: disable=protected-access
+    index = factory.construct_index(spec=spec)
 
     assert index.name == expected_name
     assert index.expressions == expected_expressions
@@ -251,3 +253,61 @@ def test_index_factory():
 
     assert index_1.expressions == ["column 1"]
     assert index_2.expressions == ["column 2"]
+
+
+_CHECK_SPECS = [
+    [],
+    ["column 1"],
+    ["column 1", 1],
+    [[]],
+    [["column 1"]],
+    [["column 1"], "column 2"],
+    {},
+    {"columns": []},
+    {"columns": ["column 1"]},
+    {"columns": ["column 1"], "name": "name 1"},
+    {"columns": ["column 1"], "name": 1},
+    {"columns": ["column 1"], "name": None},
+    {"columns": "column 1"},
+    [{"columns": ["column 1"]}],
+    [{"columns": ["column 1"]}, {"columns": []}],
+    {"expressions": ["column 1"]},
+    {"expressions": ["column 1"], "unique": True},
+    {"expressions": ["column 1"], "unique": 1},
+    {"expressions": ["column 1"], "name": "name 1", "unique": False},
+    {"expressions": ["column 1"], "columns": ["column 2"]},
+    [{"expressions": ["column 1"]}],
+    [{"expressions": ["column 1"]}, {"expressions": [1]}],
+    "column 1",
+    1,
+    True,
+    None,
+]
+
+
+@pytest.mark.parametrize("spec", _CHECK_SPECS)
+@pytest.mark.table_args
+def test_spec_to_schema_name_jsonschema(spec):
+    """
+    GIVEN spec
+    WHEN _spec_to_schema_name is called with the spec and each schema name
+    THEN the spec matches the same schemas as when it is validated using jsonschema.
+    """
+    for name, schema in ext_prop_schemas.common_schemas().items():
+        try:
+            jsonschema.validate(
+                instance=spec, schema=schema, resolver=ext_prop_schemas.resolver()
+            )
+            expected = True
+        except jsonschema.ValidationError:
+            expected = False
+
+        try:
+            factory._spec_to_schema_name(  # pylint: disable=protected-access
+                spec=spec, schema_names=[name]
+            )
+            returned = True
+        except exceptions.SchemaNotFoundError:
+            returned = False
+
+        assert returned == expected, name
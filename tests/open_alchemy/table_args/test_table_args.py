@@ -31,3 +31,38 @@ def test_construct(schema, expected_args):
     assert len(returned_args) == len(expected_args)
     for returned_arg, expected_arg in zip(returned_args, expected_args):
         assert isinstance(returned_arg, expected_arg)
+
+
+@pytest.mark.table_args
+def test_gather_artifacts():
+    """
+    GIVEN schema with x-composite-unique and x-composite-index
+    WHEN gather_artifacts is called with the schema
+    THEN the mapped unique constraints and indexes are returned.
+    """
+    schema = {"x-composite-unique": ["column 1"], "x-composite-index": ["column 2"]}
+
+    artifacts = table_args.gather_artifacts(schema=schema)
+
+    assert artifacts.uniques == [{"columns": ["column 1"]}]
+    assert artifacts.indexes == [{"expressions": ["column 2"]}]
+
+
+@pytest.mark.table_args
+def test_construct_artifacts():
+    """
+    GIVEN table args artifacts
+    WHEN construct_artifacts is called multiple times with the artifacts
+    THEN new unique constraints and indexes are constructed on every call.
+    """
+    artifacts = table_args.gather_artifacts(
+        schema={"x-composite-unique": ["column 1"], "x-composite-index": ["column 2"]}
+    )
+
+    first_unique, first_index = table_args.construct_artifacts(artifacts=artifacts)
+    second_unique, second_index = table_args.construct_artifacts(artifacts=artifacts)
+
+    assert isinstance(first_unique, sa_schema.UniqueConstraint)
+    assert isinstance(first_index, sa_schema.Index)
+    assert first_unique is not second_unique
+    assert first_index is not second_index
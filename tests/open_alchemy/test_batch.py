@@ -0,0 +1,109 @@
+"""Tests for loading relationships and upserting in batches."""
+# pylint: disable=no-member
+
+import types
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import batch
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+@pytest.fixture
+def namespace(engine):
+    """The models of SPEC with the tables created."""
+    namespace = types.SimpleNamespace()
+    base = declarative.declarative_base()
+    open_alchemy.init_model_factory(
+        base=base, spec=SPEC, define_all=True, namespace=namespace
+    )
+    base.metadata.create_all(engine)
+    return namespace
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 500])
+@pytest.mark.integration
+def test_to_dicts(engine, sessionmaker, namespace, batch_size):
+    """
+    GIVEN employees in divisions in the database
+    WHEN the employees are queried and to_dicts is called
+    THEN the dictionaries include the divisions, which are loaded with one query per
+        batch of employees.
+    """
+    session = sessionmaker()
+    session.add_all(
+        [
+            namespace.Employee(id=id_, division=namespace.Division(id=id_, name="d"))
+            for id_ in range(1, 4)
+        ]
+    )
+    session.commit()
+    session.close()
+    session = sessionmaker()
+    employees = session.query(namespace.Employee).order_by(namespace.Employee.id).all()
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    dicts = batch.to_dicts(session, employees, batch_size=batch_size)
+
+    assert dicts == [
+        {"id": id_, "division": {"id": id_, "name": "d"}} for id_ in range(1, 4)
+    ]
+    # Every batch queries the employees and then selects the divisions
+    assert len(statements) == 2 * -(-3 // batch_size)
+
+
+@pytest.mark.integration
+def test_upsert(sessionmaker, namespace):
+    """
+    GIVEN division in the database
+    WHEN upsert is called with dictionaries for the existing and a new division
+    THEN the existing division is updated and the new division is inserted.
+    """
+    session = sessionmaker()
+    session.add(namespace.Division(id=1, name="division 1"))
+    session.commit()
+
+    instances = batch.upsert(
+        session,
+        namespace.Division,
+        [{"id": 1, "name": "division 1 new"}, {"id": 2, "name": "division 2"}],
+    )
+    session.commit()
+
+    assert [instance.id for instance in instances] == [1, 2]
+    assert [
+        division.to_dict()
+        for division in session.query(namespace.Division).order_by(
+            namespace.Division.id
+        )
+    ] == [{"id": 1, "name": "division 1 new"}, {"id": 2, "name": "division 2"}]
@@ -0,0 +1,160 @@
+"""Tests for the command line interface."""
+
+import importlib
+import json
+import sys
+from unittest import mock
+
+import pytest
+
+from open_alchemy import cli
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            }
+        }
+    }
+}
+INVALID_SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            }
+        }
+    }
+}
+
+
+@pytest.mark.parametrize("extension", ["yaml", "json"])
+@pytest.mark.cli
+def test_lint_valid(tmp_path, capsys, extension):
+    """
+    GIVEN valid specification file
+    WHEN the lint command is run with the file
+    THEN 0 is returned and no errors are printed.
+    """
+    spec_file = tmp_path / f"spec.{extension}"
+    spec_file.write_text(json.dumps(SPEC))
+
+    returned_code = cli.main(["lint", str(spec_file), "--max-workers", "1"])
+
+    assert returned_code == 0
+    assert capsys.readouterr().out == "No errors found.\n"
+
+
+@pytest.mark.cli
+def test_lint_invalid(tmp_path, capsys):
+    """
+    GIVEN specification file with multiple errors
+    WHEN the lint command is run with the file
+    THEN 1 is returned and all the errors are printed.
+    """
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(json.dumps(INVALID_SPEC))
+
+    returned_code = cli.main(["lint", str(spec_file), "--max-workers", "1"])
+
+    assert returned_code == 1
+    assert capsys.readouterr().out.splitlines() == [
+        "2 error(s) found:",
+        "/components/schemas/Employee/properties/name: TypeMissingError: "
+        "Every property requires a type.",
+        "/components/schemas/Employee/properties/division: SchemaNotFoundError: "
+        "'Division was not found in schemas.'",
+    ]
+
+
+@pytest.mark.cli
+def test_lint_invalid_json(tmp_path, capsys):
+    """
+    GIVEN specification file with errors
+    WHEN the lint command is run with the file and the json format
+    THEN the errors are printed as JSON.
+    """
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(json.dumps(INVALID_SPEC))
+
+    returned_code = cli.main(
+        ["lint", str(spec_file), "--format", "json", "--max-workers", "1"]
+    )
+
+    assert returned_code == 1
+    errors = json.loads(capsys.readouterr().out)
+    assert errors[0] == {
+        "name": "Employee",
+        "error": "TypeMissingError",
+        "message": "Every property requires a type.",
+        "pointer": "/components/schemas/Employee/properties/name",
+    }
+    assert len(errors) == 2
+
+
+@pytest.mark.cli
+def test_lint_missing_file(tmp_path, capsys):
+    """
+    GIVEN filename of a file that does not exist
+    WHEN the lint command is run with the filename
+    THEN 2 is returned and the error is printed.
+    """
+    returned_code = cli.main(["lint", str(tmp_path / "missing.yaml")])
+
+    assert returned_code == 2
+    assert "could not be loaded" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "filename, contents",
+    [("spec.yaml", "components: [schemas"), ("spec.json", '{"components": ')],
+    ids=["yaml", "json"],
+)
+@pytest.mark.cli
+def test_lint_malformed_file(tmp_path, capsys, filename, contents):
+    """
+    GIVEN specification file with a syntax error
+    WHEN the lint command is run with the file
+    THEN 2 is returned and the error is printed.
+    """
+    spec_file = tmp_path / filename
+    spec_file.write_text(contents)
+
+    returned_code = cli.main(["lint", str(spec_file)])
+
+    assert returned_code == 2
+    assert "could not be loaded" in capsys.readouterr().err
+
+
+@pytest.mark.cli
+def test_lint_without_yaml(tmp_path, capsys):
+    """
+    GIVEN pyyaml is not installed and JSON and YAML specification files
+    WHEN the cli is imported and the lint command is run with each file
+    THEN the JSON file is linted and 2 is returned for the YAML file with the error.
+    """
+    json_file = tmp_path / "spec.json"
+    json_file.write_text(json.dumps(SPEC))
+    yaml_file = tmp_path / "spec.yaml"
+    yaml_file.write_text(json.dumps(SPEC))
+
+    with mock.patch.dict(sys.modules, {"yaml": None}):
+        importlib.reload(cli)
+        json_code = cli.main(["lint", str(json_file)])
+        yaml_code = cli.main(["lint", str(yaml_file)])
+
+    assert json_code == 0
+    assert yaml_code == 2
+    assert "pyyaml" in capsys.readouterr().err
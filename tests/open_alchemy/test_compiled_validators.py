@@ -0,0 +1,259 @@
+"""Tests for compiling the schemas of models into validation functions."""
+
+import gc
+import random
+import weakref
+
+import jsonschema
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import compiled_validators
+from open_alchemy import helpers
+
+SCHEMAS = [
+    {},
+    {"type": "integer"},
+    {"type": "number"},
+    {"type": "string", "maxLength": 3},
+    {"maxLength": 2},
+    {"type": "boolean"},
+    {"type": "string", "enum": ["a", "abc"]},
+    {"enum": ["", "a"]},
+    {"type": "object"},
+    {"type": "array", "items": {"type": "integer"}},
+    {"items": {"type": "string", "maxLength": 1}},
+    {"type": "string", "format": "date", "nullable": True},
+    {"type": "integer", "readOnly": True, "x-primary-key": True},
+    {"required": ["id"], "properties": {"id": {"type": "integer"}}},
+    {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "name": {"type": "string", "maxLength": 5},
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "division": {
+                "type": "object",
+                "x-de-$ref": "Division",
+                "properties": {"id": {"type": "integer"}},
+                "required": ["id"],
+            },
+            "any": {},
+        },
+        "required": ["id", "name"],
+    },
+]
+
+INSTANCES = [
+    None,
+    True,
+    False,
+    0,
+    1,
+    -3,
+    1.0,
+    1.5,
+    "",
+    "a",
+    "abc",
+    "abcdef",
+    [],
+    [1, 2],
+    [1.0, "a"],
+    ["a", "bc"],
+    {},
+    {"id": 1},
+    {"id": True},
+    {"id": 1.0, "name": "name"},
+    {"id": 1, "name": "too long"},
+    {"id": 1, "name": "n", "tags": ["a", 1]},
+    {"id": 1, "name": "n", "tags": ["a"], "division": {}},
+    {"id": 1, "name": "n", "division": {"id": 2}, "any": [None]},
+    {"id": 1, "name": None},
+]
+
+
+def _jsonschema_decision(schema, instance):
+    """Return whether jsonschema accepts the instance for the schema."""
+    try:
+        jsonschema.validate(instance=instance, schema=schema)
+    except jsonschema.ValidationError:
+        return False
+    return True
+
+
+@pytest.mark.compiled_validators
+@pytest.mark.parametrize("schema", SCHEMAS)
+def test_compile_validator_decisions(schema):
+    """
+    GIVEN schema
+    WHEN compile_validator is called with the schema and the validator is called with
+        instances
+    THEN the validator makes the same decisions as jsonschema.
+    """
+    validate = compiled_validators.compile_validator(schema)
+
+    assert validate is not None
+    for instance in INSTANCES:
+        assert validate(instance) == _jsonschema_decision(schema, instance), (
+            validate.source,
+            instance,
+        )
+
+
+def _random_schema(rng, depth):
+    """Generate a random schema using the compiled keywords."""
+    schema = {}
+    if rng.random() < 0.8:
+        schema["type"] = rng.choice(
+            ["integer", "number", "string", "boolean", "object", "array"]
+        )
+    if rng.random() < 0.3:
+        schema["maxLength"] = rng.randint(0, 3)
+    if rng.random() < 0.2:
+        schema["nullable"] = True
+    if rng.random() < 0.2:
+        schema["enum"] = rng.sample(["", "x", "xxx"], rng.randint(1, 3))
+    if depth > 0 and schema.get("type", "object") == "object" and rng.random() < 0.7:
+        keys = rng.sample(["a", "b", "c"], rng.randint(0, 3))
+        schema["properties"] = {key: _random_schema(rng, depth - 1) for key in keys}
+        schema["required"] = rng.sample(["a", "b", "c"], rng.randint(0, 2))
+    if depth > 0 and schema.get("type", "array") == "array" and rng.random() < 0.7:
+        schema["items"] = _random_schema(rng, depth - 1)
+    return schema
+
+
+def _random_instance(rng, depth):
+    """Generate a random instance."""
+    choice = rng.randint(0, 8 if depth > 0 else 6)
+    if choice == 0:
+        return None
+    if choice == 1:
+        return rng.choice([True, False])
+    if choice == 2:
+        return rng.randint(-2, 2)
+    if choice == 3:
+        return rng.choice([0.0, 1.0, 2.5])
+    if choice in (4, 5, 6):
+        return "x" * rng.randint(0, 4)
+    if choice == 7:
+        return [_random_instance(rng, depth - 1) for _ in range(rng.randint(0, 3))]
+    keys = rng.sample(["a", "b", "c"], rng.randint(0, 3))
+    return {key: _random_instance(rng, depth - 1) for key in keys}
+
+
+@pytest.mark.compiled_validators
+def test_compile_validator_random():
+    """
+    GIVEN random schemas and instances
+    WHEN compile_validator is called with the schemas and the validators are called
+        with the instances
+    THEN the validators make the same decisions as jsonschema.
+    """
+    rng = random.Random(0)
+    for _ in range(200):
+        schema = _random_schema(rng, 2)
+        validate = compiled_validators.compile_validator(schema)
+        assert validate is not None
+        for _ in range(20):
+            instance = _random_instance(rng, 2)
+            assert validate(instance) == _jsonschema_decision(schema, instance), (
+                validate.source,
+                instance,
+            )
+
+
+@pytest.mark.compiled_validators
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param({"type": "string", "pattern": "^a"}, id="unsupported keyword"),
+        pytest.param({"type": "integer", "minimum": 1}, id="unsupported number"),
+        pytest.param({"allOf": [{"type": "integer"}]}, id="allOf"),
+        pytest.param({"type": ["integer", "null"]}, id="type list"),
+        pytest.param({"maxLength": -1}, id="invalid maxLength"),
+        pytest.param({"required": ["a", "a"]}, id="duplicate required"),
+        pytest.param(
+            {"properties": {"a": {"enum": [1]}}}, id="unsupported nested keyword"
+        ),
+    ],
+)
+def test_compile_validator_unsupported(schema):
+    """
+    GIVEN schema that uses keywords that are not compiled
+    WHEN compile_validator is called with the schema
+    THEN None is returned.
+    """
+    assert compiled_validators.compile_validator(schema) is None
+
+
+@pytest.mark.compiled_validators
+def test_compile_validator_cache():
+    """
+    GIVEN interned schema
+    WHEN compile_validator is called twice with the schema
+    THEN the same validator is returned.
+    """
+    schema = helpers.intern.intern(
+        {"type": "object", "properties": {"id": {"type": "integer"}}}
+    )
+
+    assert compiled_validators.compile_validator(
+        schema
+    ) is compiled_validators.compile_validator(schema)
+
+
+@pytest.mark.compiled_validators
+def test_compile_validator_cache_freed():
+    """
+    GIVEN interned schema whose validator has been compiled
+    WHEN the schema is no longer used
+    THEN the schema is collected and its validator is removed from the cache.
+    """
+    schema = helpers.intern.intern(
+        {"type": "object", "properties": {"x-test-freed": {"type": "integer"}}}
+    )
+    compiled_validators.compile_validator(schema)
+    reference = weakref.ref(schema)
+    key = id(schema)
+
+    del schema
+    gc.collect()
+
+    assert reference() is None
+    assert key not in compiled_validators._CACHE  # pylint: disable=protected-access
+
+
+@pytest.mark.compiled_validators
+def test_from_dict_compiled():
+    """
+    GIVEN specification and init_model_factory with compile_validators
+    WHEN from_dict is called with valid and invalid dictionaries
+    THEN the model uses the compiled validator and only accepts the valid dictionary.
+    """
+    base = declarative.declarative_base()
+    spec = {
+        "components": {
+            "schemas": {
+                "Table": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string", "maxLength": 3},
+                    },
+                    "x-tablename": "table",
+                    "type": "object",
+                }
+            }
+        }
+    }
+    model_factory = open_alchemy.init_model_factory(
+        base=base, spec=spec, define_all=False, compile_validators=True
+    )
+    model = model_factory(name="Table")
+
+    assert model._validate is not None  # pylint: disable=protected-access
+    instance = model.from_dict(id=1, name="abc")
+    assert instance.name == "abc"
+    with pytest.raises(ValueError):
+        model.from_dict(id=1, name="abcd")
@@ -0,0 +1,294 @@
+"""Tests for hooks called during model construction."""
+
+import contextlib
+import types
+from unittest import mock
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import hooks
+from open_alchemy import shared_artifacts
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "projects": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Project"},
+                    },
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+            "Project": {
+                "allOf": [
+                    {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True}
+                        },
+                        "type": "object",
+                    },
+                    {"x-tablename": "project", "x-secondary": "employee_project"},
+                ],
+                # Only schemas with x-tablename at the top level are defined by
+                # define_all
+                "x-tablename": "project",
+            },
+        }
+    }
+}
+
+
+@pytest.mark.hooks
+def test_register_unknown_event():
+    """
+    GIVEN event that does not exist
+    WHEN register is called with the event
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        hooks.register(event="unknown", hook=mock.MagicMock())
+
+
+@pytest.mark.hooks
+def test_register_unregister():
+    """
+    GIVEN hooks
+    WHEN the hooks are registered and unregistered
+    THEN they are called in the order of registration only while registered.
+    """
+    calls = []
+    first = mock.MagicMock(side_effect=lambda **_: calls.append("first"))
+    second = mock.MagicMock(side_effect=lambda **_: calls.append("second"))
+
+    with hooks.registered(event=hooks.AFTER_MODEL, hook=first):
+        with hooks.registered(event=hooks.AFTER_MODEL, hook=second):
+            hooks.call(hooks.AFTER_MODEL, name="Model", model=None)
+        hooks.call(hooks.AFTER_MODEL, name="Model", model=None)
+    hooks.call(hooks.AFTER_MODEL, name="Model", model=None)
+
+    assert calls == ["first", "second", "first"]
+    first.assert_called_with(name="Model", model=None)
+    assert hooks.REGISTRY[hooks.AFTER_MODEL] == ()
+
+
+@pytest.mark.hooks
+def test_unregister_missing():
+    """
+    GIVEN hook that is not registered
+    WHEN unregister is called with the hook
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        hooks.unregister(event=hooks.AFTER_MODEL, hook=mock.MagicMock())
+
+
+@pytest.mark.hooks
+def test_suppressed():
+    """
+    GIVEN registered hooks
+    WHEN an event is suppressed and the hooks of the events are called
+    THEN only the hooks of the event that is not suppressed are called until the
+        context exits.
+    """
+    model_hook = mock.MagicMock()
+    association_hook = mock.MagicMock()
+
+    with hooks.registered(event=hooks.AFTER_MODEL, hook=model_hook):
+        with hooks.registered(event=hooks.AFTER_ASSOCIATION, hook=association_hook):
+            with hooks.suppressed(hooks.AFTER_ASSOCIATION):
+                hooks.call(hooks.AFTER_MODEL, name="Model", model=None)
+                hooks.call(hooks.AFTER_ASSOCIATION, name="table", table=None)
+            hooks.call(hooks.AFTER_ASSOCIATION, name="table", table=None)
+
+    model_hook.assert_called_once_with(name="Model", model=None)
+    association_hook.assert_called_once_with(name="table", table=None)
+
+
+@pytest.mark.hooks
+def test_suppressed_all():
+    """
+    GIVEN registered hook
+    WHEN all events are suppressed and the hook is called
+    THEN the hook is not called.
+    """
+    hook = mock.MagicMock()
+
+    with hooks.registered(event=hooks.AFTER_MODEL, hook=hook):
+        with hooks.suppressed():
+            hooks.call(hooks.AFTER_MODEL, name="Model", model=None)
+
+    hook.assert_not_called()
+
+
+@pytest.mark.hooks
+def test_suppressed_unknown_event():
+    """
+    GIVEN event that does not exist
+    WHEN it is suppressed
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        with hooks.suppressed("unknown"):
+            pass
+
+
+def _init():
+    """Define all the models of the specification in a separate namespace."""
+    namespace = types.SimpleNamespace()
+    open_alchemy.init_model_factory(
+        base=declarative.declarative_base(),
+        spec={"components": {"schemas": dict(SPEC["components"]["schemas"])}},
+        define_all=True,
+        namespace=namespace,
+    )
+    return namespace
+
+
+@pytest.mark.hooks
+def test_model_construction():
+    """
+    GIVEN hooks for all the events
+    WHEN models with a many to many relationship are constructed
+    THEN the hooks are called with the artifacts of the models.
+    """
+    mocked_hooks = {event: mock.MagicMock() for event in hooks.EVENTS}
+
+    with contextlib.ExitStack() as stack:
+        for event, hook in mocked_hooks.items():
+            stack.enter_context(hooks.registered(event=event, hook=hook))
+        namespace = _init()
+
+    before_names = [
+        call[1]["name"]
+        for call in mocked_hooks[hooks.BEFORE_PREPARE_SCHEMA].call_args_list
+    ]
+    assert before_names == ["Employee", "Project"]
+    project_before = mocked_hooks[hooks.BEFORE_PREPARE_SCHEMA].call_args_list[1][1]
+    assert "allOf" in project_before["schema"]
+    project_after = mocked_hooks[hooks.AFTER_PREPARE_SCHEMA].call_args_list[1][1]
+    assert project_after["schema"]["x-tablename"] == "project"
+
+    column_calls = [
+        (call[1]["name"], call[1]["logical_name"])
+        for call in mocked_hooks[hooks.AFTER_COLUMN].call_args_list
+    ]
+    assert column_calls == [
+        ("Employee", "id"),
+        ("Employee", "projects"),
+        ("Project", "id"),
+    ]
+    projects_call = mocked_hooks[hooks.AFTER_COLUMN].call_args_list[1][1]
+    assert projects_call["class_vars"][0][0] == "projects"
+
+    mocked_hooks[hooks.AFTER_MODEL].assert_any_call(
+        name="Employee", model=namespace.Employee
+    )
+    mocked_hooks[hooks.AFTER_MODEL].assert_any_call(
+        name="Project", model=namespace.Project
+    )
+    mocked_hooks[hooks.AFTER_ASSOCIATION].assert_called_once_with(
+        name="employee_project", table=namespace.employee_project
+    )
+    assert isinstance(namespace.employee_project, sqlalchemy.Table)
+
+
+@pytest.mark.hooks
+def test_shared_artifacts():
+    """
+    GIVEN hooks for all the events and shared artifacts
+    WHEN the models are constructed for multiple bases
+    THEN the hooks for the schemas and columns are called once for all bases and the
+        hooks for the models and association tables once for each base.
+    """
+    mocked_hooks = {event: mock.MagicMock() for event in hooks.EVENTS}
+    artifacts = shared_artifacts.SharedArtifacts()
+    spec = {"components": {"schemas": dict(SPEC["components"]["schemas"])}}
+
+    with contextlib.ExitStack() as stack:
+        for event, hook in mocked_hooks.items():
+            stack.enter_context(hooks.registered(event=event, hook=hook))
+        namespaces = []
+        for _ in range(2):
+            namespace = types.SimpleNamespace()
+            open_alchemy.init_model_factory(
+                base=declarative.declarative_base(),
+                spec=spec,
+                define_all=True,
+                namespace=namespace,
+                shared_artifacts=artifacts,
+            )
+            namespaces.append(namespace)
+
+    assert mocked_hooks[hooks.BEFORE_PREPARE_SCHEMA].call_count == 2
+    assert mocked_hooks[hooks.AFTER_PREPARE_SCHEMA].call_count == 2
+    assert mocked_hooks[hooks.AFTER_COLUMN].call_count == 3
+    assert mocked_hooks[hooks.AFTER_MODEL].call_count == 4
+    assert mocked_hooks[hooks.AFTER_ASSOCIATION].call_args_list == [
+        mock.call(name="employee_project", table=namespace.employee_project)
+        for namespace in namespaces
+    ]
+
+
+@pytest.mark.hooks
+@pytest.mark.parametrize(
+    "check",
+    [
+        pytest.param(open_alchemy.validate_spec, id="validate_spec"),
+        pytest.param(open_alchemy.validation.lint_spec, id="lint_spec"),
+    ],
+)
+def test_validation(check):
+    """
+    GIVEN hooks for all the events
+    WHEN the specification is checked
+    THEN no hooks are called.
+    """
+    mocked_hooks = {event: mock.MagicMock() for event in hooks.EVENTS}
+
+    with contextlib.ExitStack() as stack:
+        for event, hook in mocked_hooks.items():
+            stack.enter_context(hooks.registered(event=event, hook=hook))
+        report = check(spec=SPEC)
+
+    assert report.valid
+    for hook in mocked_hooks.values():
+        hook.assert_not_called()
+
+
+@pytest.mark.hooks
+def test_post_process_model():
+    """
+    GIVEN hook for after the model is created that sets an attribute
+    WHEN the models are constructed
+    THEN the attribute is set on the models.
+    """
+
+    def hook(*, name, model):
+        """Set an attribute on the model."""
+        model.hooked = name
+
+    with hooks.registered(event=hooks.AFTER_MODEL, hook=hook):
+        namespace = _init()
+
+    assert namespace.Employee.hooked == "Employee"
+    assert namespace.Project.hooked == "Project"
+
+
+@pytest.mark.hooks
+def test_no_hooks():
+    """
+    GIVEN no registered hooks
+    WHEN the models are constructed
+    THEN no hooks are called.
+    """
+    with mock.patch.object(hooks, "call") as mocked_call:
+        _init()
+
+    mocked_call.assert_not_called()
@@ -0,0 +1,221 @@
+"""Integration tests for the asynchronous model utilities."""
+# pylint: disable=no-member
+
+import asyncio
+import types
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+sqlalchemy_asyncio = pytest.importorskip("sqlalchemy.ext.asyncio")
+sqlalchemy_future = pytest.importorskip("sqlalchemy.future")
+pytest.importorskip("aiosqlite")
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+            "Project": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "project",
+                "type": "object",
+            },
+            "Team": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "projects": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Project"},
+                    },
+                },
+                "x-tablename": "team",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+async def _session(namespace):
+    """Create the tables in an in memory database and open a session."""
+    engine = sqlalchemy_asyncio.create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(namespace.Base.metadata.create_all)
+    return engine, sqlalchemy_asyncio.AsyncSession(engine, expire_on_commit=False)
+
+
+def _run(test):
+    """Construct the models and run the test with them and a session."""
+    namespace = types.SimpleNamespace()
+    open_alchemy.init_model_factory(
+        base=declarative.declarative_base(),
+        spec=SPEC,
+        define_all=True,
+        namespace=namespace,
+    )
+
+    async def run():
+        engine, session = await _session(namespace)
+        try:
+            await test(namespace, session)
+        finally:
+            await session.close()
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+def _count_selects(session):
+    """Record the SELECT statements executed by the session."""
+    statements = []
+
+    def before_cursor_execute(*args):
+        statement = args[2]
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(
+        session.bind.sync_engine, "before_cursor_execute", before_cursor_execute
+    )
+    return statements
+
+
+@pytest.mark.integration
+def test_to_dicts_async():
+    """
+    GIVEN employees in divisions and teams with projects in the database
+    WHEN the employees and teams are queried and to_dicts_async is called
+    THEN the dictionaries include the relationships, which are loaded with the same
+        number of queries for any number of instances.
+    """
+
+    async def test(namespace, session):
+        division_1 = namespace.Division(id=1, name="division 1")
+        division_2 = namespace.Division(id=2, name="division 2")
+        session.add_all(
+            [
+                namespace.Employee(id=1, name="employee 1", division=division_1),
+                namespace.Employee(id=2, name="employee 2", division=division_2),
+                namespace.Employee(id=3, name="employee 3", division=division_1),
+                namespace.Team(
+                    id=1,
+                    projects=[
+                        namespace.Project(id=1, name="project 1"),
+                        namespace.Project(id=2, name="project 2"),
+                    ],
+                ),
+            ]
+        )
+        await session.commit()
+        session.expunge_all()
+        employees = (
+            (
+                await session.execute(
+                    sqlalchemy_future.select(namespace.Employee).order_by(
+                        namespace.Employee.id
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        (team,) = (
+            (await session.execute(sqlalchemy_future.select(namespace.Team)))
+            .scalars()
+            .all()
+        )
+        statements = _count_selects(session)
+
+        dicts = await open_alchemy.utility_base.UtilityBase.to_dicts_async(
+            [*employees, team], session=session
+        )
+
+        assert dicts == [
+            {
+                "id": 1,
+                "name": "employee 1",
+                "division": {"id": 1, "name": "division 1"},
+            },
+            {
+                "id": 2,
+                "name": "employee 2",
+                "division": {"id": 2, "name": "division 2"},
+            },
+            {
+                "id": 3,
+                "name": "employee 3",
+                "division": {"id": 1, "name": "division 1"},
+            },
+            {
+                "id": 1,
+                "projects": [
+                    {"id": 1, "name": "project 1"},
+                    {"id": 2, "name": "project 2"},
+                ],
+            },
+        ]
+        assert len(statements) == 4
+        assert await employees[0].to_dict_async(session=session) == dicts[0]
+
+    _run(test)
+
+
+@pytest.mark.integration
+def test_bulk_insert_upsert_async():
+    """
+    GIVEN models
+    WHEN bulk_insert_async is called with dictionaries and then bulk_upsert_async is
+        called with dictionaries for existing and new rows
+    THEN the existing rows are updated and the new rows are inserted.
+    """
+
+    async def test(namespace, session):
+        model = namespace.Division
+        inserted = await model.bulk_insert_async(
+            [{"id": 1, "name": "division 1"}, {"id": 2, "name": "division 2"}],
+            session=session,
+        )
+        assert [division.id for division in inserted] == [1, 2]
+        await session.commit()
+
+        upserted = await model.bulk_upsert_async(
+            [{"id": 2, "name": "division 2 new"}, {"id": 3, "name": "division 3"}],
+            session=session,
+        )
+        await session.commit()
+
+        assert upserted[0] is inserted[1]
+        divisions = (
+            (await session.execute(sqlalchemy_future.select(model).order_by(model.id)))
+            .scalars()
+            .all()
+        )
+        assert [division.to_dict() for division in divisions] == [
+            {"id": 1, "name": "division 1"},
+            {"id": 2, "name": "division 2 new"},
+            {"id": 3, "name": "division 3"},
+        ]
+
+    _run(test)
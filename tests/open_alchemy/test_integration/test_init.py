@@ -1,13 +1,17 @@
 """Integration tests for initialization."""
 
+import copy
 import json
+import types
 from unittest import mock
 
 import pytest
 import sqlalchemy
 import yaml
+from sqlalchemy.ext import declarative
 
 import open_alchemy
+from open_alchemy import exceptions
 
 
 @pytest.mark.integration
@@ -25,7 +29,14 @@ def test_init_optional_base_none_call(
     open_alchemy._init_optional_base(base=None, spec=spec, define_all=True)
 
     mocked_init_model_factory.assert_called_once_with(
-        base=mocked_declarative_base.return_value, spec=spec, define_all=True
+        base=mocked_declarative_base.return_value,
+        spec=spec,
+        define_all=True,
+        include=None,
+        exclude=None,
+        namespace=None,
+        compile_validators=False,
+        collect_all_errors=False,
     )
 
 
@@ -60,7 +71,14 @@ def test_init_optional_base_def_call(mocked_init_model_factory: mock.MagicMock):
     open_alchemy._init_optional_base(base=base, spec=spec, define_all=True)
 
     mocked_init_model_factory.assert_called_once_with(
-        base=base, spec=spec, define_all=True
+        base=base,
+        spec=spec,
+        define_all=True,
+        include=None,
+        exclude=None,
+        namespace=None,
+        compile_validators=False,
+        collect_all_errors=False,
     )
 
 
@@ -244,6 +262,125 @@ def test_init_yaml(engine, sessionmaker, tmp_path):
     assert queried_model.column == value
 
 
+@pytest.mark.parametrize(
+    "init_func, dump",
+    [(open_alchemy.init_yaml, yaml.dump), (open_alchemy.init_json, json.dumps)],
+    ids=["yaml", "json"],
+)
+@pytest.mark.integration
+def test_init_schemas_only(tmp_path, init_func, dump):
+    """
+    GIVEN specification with paths stored in a file
+    WHEN the init function is called with the file and schemas_only
+    THEN the models are constructed.
+    """
+    spec = {**BASIC_SPEC, "paths": {"/table": {"get": {"responses": {}}}}}
+    spec_file = tmp_path / "spec"
+    spec_file.write_text(dump(spec))
+
+    _, model_factory = init_func(str(spec_file), schemas_only=True)
+
+    assert model_factory(name="Table").__tablename__ == "table"
+
+
+@pytest.mark.integration
+def test_init_yaml_remote_refs(engine, sessionmaker, tmp_path):
+    """
+    GIVEN specification stored in a YAML file that references schemas in other files
+    WHEN init_yaml is called with the file
+    THEN the models are constructed from the referenced schemas and files that are not
+        referenced are not loaded.
+    """
+    directory = tmp_path / "specs"
+    (directory / "common").mkdir(parents=True)
+    common = {
+        "components": {
+            "schemas": {
+                "Id": {"type": "integer", "x-primary-key": True},
+                "Division": {
+                    "properties": {
+                        "id": {"$ref": "#/components/schemas/Id"},
+                        "name": {"type": "string"},
+                    },
+                    "x-tablename": "division",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    (directory / "common" / "common.yaml").write_text(yaml.dump(common))
+    (directory / "common" / "unused.yaml").write_text("invalid: [")
+    spec = {
+        "components": {
+            "schemas": {
+                "Division": {"$ref": "common/common.yaml#/components/schemas/Division"},
+                "Employee": {
+                    "properties": {
+                        "id": {"$ref": "common/common.yaml#/components/schemas/Id"},
+                        "division": {"$ref": "#/components/schemas/Division"},
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    spec_file = directory / "spec.yaml"
+    spec_file.write_text(yaml.dump(spec))
+
+    base, _ = open_alchemy.init_yaml(str(spec_file))
+
+    base.metadata.create_all(engine)
+    session = sessionmaker()
+    session.add(
+        open_alchemy.models.Employee.from_dict(
+            id=1, division={"id": 2, "name": "division 1"}
+        )
+    )
+    session.flush()
+    queried_model = session.query(open_alchemy.models.Employee).first()
+    assert queried_model.division.name == "division 1"
+
+
+@pytest.mark.integration
+def test_init_yaml_remote_model_not_in_schemas(tmp_path):
+    """
+    GIVEN specification that references a model in another file without a schema
+        with the name of the model
+    WHEN init_yaml is called with the file
+    THEN MalformedSchemaError is raised.
+    """
+    division = {
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        "x-tablename": "division",
+        "type": "object",
+    }
+    (tmp_path / "common.yaml").write_text(
+        yaml.dump({"components": {"schemas": {"Division": division}}})
+    )
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "division": {
+                            "$ref": "common.yaml#/components/schemas/Division"
+                        },
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                }
+            }
+        }
+    }
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(yaml.dump(spec))
+
+    with pytest.raises(exceptions.MalformedSchemaError):
+        open_alchemy.init_yaml(str(spec_file), namespace=types.SimpleNamespace())
+
+
 @pytest.mark.integration
 def test_init_yaml_import_error():
     """
@@ -385,3 +522,153 @@ def test_import_many_to_many_association(engine, sessionmaker, tmp_path):
     # Querying session
     queried_association = session.query(association).first()
     assert queried_association == (12, 11)
+
+
+@pytest.mark.integration
+def test_init_model_factory_include():
+    """
+    GIVEN specification with a many to one relationship and a separate schema
+    WHEN init_model_factory is called with define_all and the referencing schema as
+        include
+    THEN only the referencing and referenced models are defined.
+    """
+    # pylint: disable=no-member
+    spec = {
+        "components": {
+            "schemas": {
+                "RefTable": {
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-tablename": "ref_table",
+                    "type": "object",
+                },
+                "Table": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "ref_table": {"$ref": "#/components/schemas/RefTable"},
+                    },
+                    "x-tablename": "table",
+                    "type": "object",
+                },
+                "OtherTable": {
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-tablename": "other_table",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    base = declarative.declarative_base()
+
+    open_alchemy.init_model_factory(
+        base=base, spec=spec, define_all=True, include=["Table"]
+    )
+
+    assert hasattr(open_alchemy.models, "Table")
+    assert hasattr(open_alchemy.models, "RefTable")
+    assert not hasattr(open_alchemy.models, "OtherTable")
+    assert set(base.metadata.tables.keys()) == {"table", "ref_table"}
+
+
+@pytest.mark.parametrize(
+    "define_all, include, expected_exception",
+    [(True, "Table", TypeError), (False, ["Table"], ValueError)],
+    ids=["include string", "include without define_all"],
+)
+@pytest.mark.integration
+def test_init_model_factory_include_invalid(define_all, include, expected_exception):
+    """
+    GIVEN include that is a string or that is passed without define_all
+    WHEN init_model_factory is called with include
+    THEN the expected exception is raised.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Table": {
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-tablename": "table",
+                    "type": "object",
+                }
+            }
+        }
+    }
+
+    with pytest.raises(expected_exception):
+        open_alchemy.init_model_factory(
+            base=declarative.declarative_base(),
+            spec=spec,
+            define_all=define_all,
+            include=include,
+            namespace=types.SimpleNamespace(),
+        )
+
+
+ONE_TO_MANY_SPEC = {
+    "components": {
+        "schemas": {
+            "RefTable": {
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                "x-tablename": "ref_table",
+                "type": "object",
+            },
+            "Table": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "ref_tables": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/RefTable"},
+                    },
+                },
+                "x-tablename": "table",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "shared_artifacts",
+    [None, open_alchemy.SharedArtifacts()],
+    ids=["not shared", "shared"],
+)
+@pytest.mark.integration
+def test_init_model_factory_spec_not_modified(shared_artifacts):
+    """
+    GIVEN specification with a one to many relationship
+    WHEN init_model_factory is called with define_all
+    THEN the specification is not modified and the foreign key is added to the
+        referenced model.
+    """
+    spec = copy.deepcopy(ONE_TO_MANY_SPEC)
+    base = declarative.declarative_base()
+
+    open_alchemy.init_model_factory(
+        base=base, spec=spec, define_all=True, shared_artifacts=shared_artifacts
+    )
+
+    assert spec == ONE_TO_MANY_SPEC
+    assert "table_id" in base.metadata.tables["ref_table"].columns
+
+
+@pytest.mark.integration
+def test_init_model_factory_frozen_spec():
+    """
+    GIVEN frozen specification with a one to many relationship
+    WHEN init_model_factory is called with define_all for multiple bases
+    THEN the models are defined for every base.
+    """
+    spec = open_alchemy.freeze_spec(ONE_TO_MANY_SPEC)
+    bases = [declarative.declarative_base() for _ in range(2)]
+
+    for base in bases:
+        open_alchemy.init_model_factory(
+            base=base, spec=spec, define_all=True, namespace=types.SimpleNamespace()
+        )
+    # The mappers are configured while all the models are referenced, otherwise a
+    # model may be garbage collected before the models that reference it
+    sqlalchemy.orm.configure_mappers()
+
+    for base in bases:
+        assert set(base.metadata.tables.keys()) == {"table", "ref_table"}
+        assert "table_id" in base.metadata.tables["ref_table"].columns
@@ -0,0 +1,90 @@
+"""Integration tests for models in separate namespaces."""
+# pylint: disable=no-member
+
+import types
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Project": {
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                "x-tablename": "project",
+                "x-secondary": "employee_project",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                    "projects": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Project"},
+                    },
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+@pytest.mark.integration
+def test_separate_namespaces(engine, sessionmaker):
+    """
+    GIVEN specification with relationships and two namespaces with separate bases
+    WHEN init_model_factory is called for each namespace
+    THEN the models and association tables are constructed separately on each
+        namespace, open_alchemy.models is not modified and from_dict constructs the
+        referenced models of the same namespace.
+    """
+    primary_base = declarative.declarative_base()
+    primary = types.SimpleNamespace()
+    analytics_base = declarative.declarative_base()
+    analytics = types.SimpleNamespace()
+
+    open_alchemy.init_model_factory(
+        base=primary_base, spec=SPEC, define_all=True, namespace=primary
+    )
+    open_alchemy.init_model_factory(
+        base=analytics_base, spec=SPEC, define_all=True, namespace=analytics
+    )
+
+    assert primary.Base is primary_base
+    assert analytics.Base is analytics_base
+    assert primary.Employee is not analytics.Employee
+    assert primary.employee_project is not analytics.employee_project
+    assert primary.employee_project.metadata is primary_base.metadata
+    assert analytics.employee_project.metadata is analytics_base.metadata
+    assert not hasattr(open_alchemy.models, "Employee")
+    assert not hasattr(open_alchemy.models, "Base")
+
+    employee = analytics.Employee.from_dict(
+        id=1, division={"id": 2, "name": "engineering"}, projects=[{"id": 3}]
+    )
+    assert isinstance(employee.division, analytics.Division)
+    assert isinstance(employee.projects[0], analytics.Project)
+
+    analytics_base.metadata.create_all(engine)
+    session = sessionmaker()
+    session.add(employee)
+    session.flush()
+    queried_employee = session.query(analytics.Employee).first()
+    assert queried_employee.to_dict() == {
+        "id": 1,
+        "division": {"id": 2, "name": "engineering"},
+        "projects": [{"id": 3}],
+    }
@@ -0,0 +1,81 @@
+"""Integration tests for constructing models from multiple threads."""
+
+import random
+import time
+import types
+from concurrent import futures
+from unittest import mock
+
+import pytest
+from sqlalchemy import orm
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import model_factory
+
+_MODEL_COUNT = 40
+
+
+def _spec():
+    """Construct specification with many to one and one to many relationships."""
+    schemas = {}
+    for idx in range(_MODEL_COUNT):
+        properties = {"id": {"type": "integer", "x-primary-key": True}}
+        if idx > 0:
+            properties["parent"] = {"$ref": f"#/components/schemas/Model{idx - 1}"}
+        if idx < _MODEL_COUNT - 1:
+            properties["children"] = {
+                "type": "array",
+                "items": {"$ref": f"#/components/schemas/Child{idx}"},
+            }
+            schemas[f"Child{idx}"] = {
+                "x-tablename": f"child_{idx}",
+                "type": "object",
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+            }
+        schemas[f"Model{idx}"] = {
+            "x-tablename": f"model_{idx}",
+            "type": "object",
+            "properties": properties,
+        }
+    return {"components": {"schemas": schemas}}
+
+
+@pytest.mark.integration
+def test_concurrent_construction(engine):
+    """
+    GIVEN specification with many models with relationships and a slow model factory
+    WHEN the model factory is called concurrently for every model from a thread pool
+    THEN every model is constructed exactly once, every call for a model returns the
+        same class, the mappers can be configured and the database can be created.
+    """
+    real_model_factory = model_factory.model_factory
+
+    def slow_model_factory(**kwargs):
+        """Widen the window in which threads may race."""
+        time.sleep(0.001)
+        return real_model_factory(**kwargs)
+
+    spec = _spec()
+    names = list(spec["components"]["schemas"].keys()) * 8
+    random.shuffle(names)
+    base = declarative.declarative_base()
+    namespace = types.SimpleNamespace()
+
+    with mock.patch.object(
+        model_factory, "model_factory", side_effect=slow_model_factory
+    ) as mocked_model_factory:
+        factory = open_alchemy.init_model_factory(
+            base=base, spec=spec, namespace=namespace
+        )
+        with futures.ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(lambda name: (name, factory(name=name)), names))
+
+    constructed = {}
+    for name, model in results:
+        assert constructed.setdefault(name, model) is model
+        assert getattr(namespace, name) is model
+    assert mocked_model_factory.call_count == len(spec["components"]["schemas"])
+    orm.configure_mappers()
+    base.metadata.create_all(engine)
+    assert len(base.metadata.tables) == len(spec["components"]["schemas"])
@@ -1,6 +1,7 @@
 """Integration tests for from_dict and to_dict."""
 
 import pytest
+import sqlalchemy
 from sqlalchemy.ext import declarative
 
 import open_alchemy
@@ -14,8 +15,12 @@ import open_alchemy
             {"type": "string", "format": "date-time", "x-primary-key": True},
             "2000-01-01T01:01:01",
         ),
+        (
+            {"type": "string", "format": "uuid", "x-primary-key": True},
+            "12345678-1234-5678-1234-567812345678",
+        ),
     ],
-    ids=["integer", "date-time"],
+    ids=["integer", "date-time", "uuid"],
 )
 @pytest.mark.integration
 def test_basic_types(engine, sessionmaker, column_schema, value):
@@ -54,6 +59,162 @@ def test_basic_types(engine, sessionmaker, column_schema, value):
     assert queried_instance.to_dict() == model_dict
 
 
+@pytest.mark.integration
+def test_to_from_dict_json(engine, sessionmaker):
+    """
+    GIVEN specification that has a schema with object and array properties stored in
+        JSON columns
+    WHEN model is defined based on schema and constructed using from_dict
+    THEN the values are stored in columns of the table and when to_dict is called the
+        construction dictionary is returned.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "details": {
+                                "type": "object",
+                                "properties": {"key": {"type": "string"}},
+                                "x-json": True,
+                            },
+                            "tags": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "x-json": True,
+                            },
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    }
+                }
+            }
+        },
+    )
+    model = model_factory(name="Table")
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Constructing and turning back to dictionary
+    model_dict = {
+        "id": 1,
+        "details": {"key": "value", "nested": {"list": [1, 2]}},
+        "tags": ["tag 1", "tag 2"],
+    }
+    instance = model.from_dict(**model_dict)
+    session = sessionmaker()
+    session.add(instance)
+    session.flush()
+    assert set(base.metadata.tables) == {"table"}
+    queried_instance = session.query(model).first()
+    assert queried_instance.to_dict() == model_dict
+
+
+@pytest.mark.integration
+def test_to_from_dict_array(engine, sessionmaker):
+    """
+    GIVEN specification that has a schema with an array of a primitive type
+    WHEN model is defined based on schema and constructed using from_dict
+    THEN the array is stored in a column of the table and when to_dict is called the
+        construction dictionary is returned.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "tags": {"type": "array", "items": {"type": "string"}},
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    }
+                }
+            }
+        },
+    )
+    model = model_factory(name="Table")
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Constructing and turning back to dictionary
+    model_dict = {"id": 1, "tags": ["tag 1", "tag 2"]}
+    instance = model.from_dict(**model_dict)
+    session = sessionmaker()
+    session.add(instance)
+    session.flush()
+    assert set(base.metadata.tables) == {"table"}
+    queried_instance = session.query(model).first()
+    assert queried_instance.to_dict() == model_dict
+    with pytest.raises(open_alchemy.exceptions.MalformedModelDictionaryError):
+        model.from_dict(id=2, tags=[1])
+
+
+@pytest.mark.parametrize(
+    "enum_code, expected_stored",
+    [(False, "value 2"), (True, 1)],
+    ids=["enum", "x-enum-code"],
+)
+@pytest.mark.integration
+def test_to_from_dict_enum(engine, sessionmaker, enum_code, expected_stored):
+    """
+    GIVEN specification that has a schema with a string enum
+    WHEN model is defined based on schema and constructed using from_dict
+    THEN the value or its code is stored, when to_dict is called the construction
+        dictionary is returned and values that are not in the enum are rejected.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "status": {
+                                "type": "string",
+                                "enum": ["value 1", "value 2"],
+                                "x-enum-code": enum_code,
+                            },
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    }
+                }
+            }
+        },
+    )
+    model = model_factory(name="Table")
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Constructing and turning back to dictionary
+    model_dict = {"id": 1, "status": "value 2"}
+    instance = model.from_dict(**model_dict)
+    session = sessionmaker()
+    session.add(instance)
+    session.flush()
+    queried_instance = session.query(model).first()
+    assert queried_instance.to_dict() == model_dict
+    (status,) = session.execute(sqlalchemy.text('SELECT status FROM "table"')).first()
+    assert status == expected_stored
+    with pytest.raises(open_alchemy.exceptions.MalformedModelDictionaryError):
+        model.from_dict(id=2, status="value 3")
+    if not enum_code:
+        assert model.__table__.c.status.type.name == "table_status"
+
+
 @pytest.mark.integration
 def test_to_from_dict_many_to_one(engine, sessionmaker):
     """
@@ -102,6 +263,65 @@ def test_to_from_dict_many_to_one(engine, sessionmaker):
     assert queried_instance.to_dict() == model_dict
 
 
+@pytest.mark.integration
+def test_to_from_dict_many_to_one_uuid(engine, sessionmaker):
+    """
+    GIVEN specification that has a schema with a many to one relationship to a schema
+        with a uuid primary key
+    WHEN model is defined based on schema and constructed using from_dict
+    THEN the foreign key is stored as 16 bytes and when to_dict is called the
+        construction dictionary is returned.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "RefTable": {
+                        "properties": {
+                            "id": {
+                                "type": "string",
+                                "format": "uuid",
+                                "x-primary-key": True,
+                            }
+                        },
+                        "x-tablename": "ref_table",
+                        "type": "object",
+                    },
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "ref_table": {"$ref": "#/components/schemas/RefTable"},
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    },
+                }
+            }
+        },
+    )
+    model_factory(name="RefTable")
+    model = model_factory(name="Table")
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Constructing and turning back to dictionary
+    ref_id = "12345678-1234-5678-1234-567812345678"
+    model_dict = {"id": 11, "ref_table": {"id": ref_id}}
+    instance = model.from_dict(**model_dict)
+    session = sessionmaker()
+    session.add(instance)
+    session.flush()
+    queried_instance = session.query(model).first()
+    assert queried_instance.to_dict() == model_dict
+    (ref_table_id,) = session.execute(
+        sqlalchemy.text('SELECT ref_table_id FROM "table"')
+    ).first()
+    assert ref_table_id == bytes.fromhex(ref_id.replace("-", ""))
+
+
 @pytest.mark.integration
 def test_to_from_dict_many_to_one_read_only(engine, sessionmaker):
     """
@@ -497,3 +717,54 @@ def test_to_from_dict_many_to_many_read_only(engine, sessionmaker):
     session.flush()
     queried_ref_instance = session.query(ref_model).first()
     assert queried_ref_instance.to_dict() == {"id": 12, "tables": [{"id": 11}]}
+
+
+@pytest.mark.integration
+def test_from_dict_nested_errors():
+    """
+    GIVEN specification with a one to many relationship and collect_all_errors
+    WHEN from_dict is called with a dictionary with errors in a nested dictionary
+    THEN the errors have the path from the outer dictionary.
+    """
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "RefTable": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "name": {"type": "string", "maxLength": 2},
+                        },
+                        "x-tablename": "ref_table",
+                        "type": "object",
+                    },
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "ref_tables": {
+                                "type": "array",
+                                "items": {"$ref": "#/components/schemas/RefTable"},
+                            },
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    },
+                }
+            }
+        },
+        define_all=True,
+        collect_all_errors=True,
+    )
+    model = model_factory(name="Table")
+
+    with pytest.raises(open_alchemy.exceptions.MalformedModelDictionaryError) as exc:
+        model.from_dict(
+            id=1, ref_tables=[{"id": 2}, {"id": 3, "name": "long", "other": 1}]
+        )
+
+    assert [(error.path, error.keyword) for error in exc.value.errors] == [
+        (("ref_tables", 1, "name"), "maxLength"),
+        (("ref_tables", 1, "other"), "additionalProperties"),
+    ]
@@ -0,0 +1,418 @@
+"""Tests for loading specifications from files."""
+
+import json
+import types
+from unittest import mock
+
+import pytest
+import yaml
+
+from open_alchemy import loader
+from open_alchemy.helpers.resolve_ref import clear_cache as clear_ref_cache
+
+SCHEMAS = {
+    "Table": {
+        "properties": {"column": {"type": "integer", "x-primary-key": True}},
+        "x-tablename": "table",
+        "type": "object",
+    }
+}
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "test", "version": "1"},
+    "paths": {"/table": {"get": {"responses": {"200": {"description": "OK"}}}}},
+    "components": {"schemas": SCHEMAS, "responses": {"NotFound": {}}},
+}
+
+
+@pytest.mark.loader
+def test_yaml_loader():
+    """
+    GIVEN pyyaml with libyaml
+    WHEN yaml_loader is called
+    THEN CSafeLoader is returned.
+    """
+    if not yaml.__with_libyaml__:  # pragma: no cover
+        pytest.skip("pyyaml was built without libyaml")
+
+    assert loader.yaml_loader() is yaml.CSafeLoader
+
+
+@pytest.mark.loader
+def test_yaml_loader_fallback():
+    """
+    GIVEN pyyaml without libyaml
+    WHEN yaml_loader is called
+    THEN SafeLoader is returned.
+    """
+    pure_yaml = types.SimpleNamespace(SafeLoader=yaml.SafeLoader)
+
+    with mock.patch.dict("sys.modules", {"yaml": pure_yaml}):
+        returned_loader = loader.yaml_loader()
+
+    assert returned_loader is yaml.SafeLoader
+
+
+@pytest.mark.parametrize("schemas_only", [False, True], ids=["spec", "schemas only"])
+@pytest.mark.loader
+def test_load_yaml_fallback(tmp_path, schemas_only):
+    """
+    GIVEN YAML specification file and pyyaml without libyaml
+    WHEN load_yaml is called with the file
+    THEN the specification is loaded using SafeLoader.
+    """
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(yaml.dump(SPEC))
+
+    with mock.patch.object(loader, "yaml_loader", return_value=yaml.SafeLoader):
+        spec = loader.load_yaml(str(spec_file), schemas_only=schemas_only)
+
+    assert spec["components"]["schemas"] == SCHEMAS
+
+
+@pytest.mark.loader
+def test_load_yaml(tmp_path):
+    """
+    GIVEN YAML specification file
+    WHEN load_yaml is called with the file
+    THEN the whole specification is returned.
+    """
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(yaml.dump(SPEC))
+
+    spec = loader.load_yaml(str(spec_file))
+
+    assert spec == SPEC
+
+
+@pytest.mark.parametrize(
+    "content, expected_spec",
+    [
+        (yaml.dump(SPEC), {"components": {"schemas": SCHEMAS}}),
+        ("", {}),
+        ("openapi: 3.0.0", {}),
+        ("- components", {}),
+        ("components: value", {"components": {}}),
+        ("components: {responses: {}}", {"components": {}}),
+        (
+            """
+common: &common
+  type: integer
+paths:
+  /table: {}
+components:
+  schemas:
+    Table:
+      type: object
+      x-tablename: table
+      properties:
+        column:
+          <<: *common
+          x-primary-key: true
+""",
+            {"components": {"schemas": SCHEMAS}},
+        ),
+        (
+            """
+base: &base
+  schemas:
+    Table:
+      type: object
+components:
+  <<: *base
+""",
+            {"components": {"schemas": {"Table": {"type": "object"}}}},
+        ),
+    ],
+    ids=[
+        "spec",
+        "empty",
+        "components missing",
+        "not object",
+        "components not object",
+        "schemas missing",
+        "anchor outside schemas",
+        "merge key",
+    ],
+)
+@pytest.mark.loader
+def test_load_yaml_schemas_only(tmp_path, content, expected_spec):
+    """
+    GIVEN YAML specification file
+    WHEN load_yaml is called with the file and schemas_only
+    THEN only the schemas are returned.
+    """
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(content)
+
+    spec = loader.load_yaml(str(spec_file), schemas_only=True)
+
+    assert spec == expected_spec
+
+
+@pytest.mark.parametrize(
+    "orjson, schemas_only, expected_spec",
+    [
+        (False, False, SPEC),
+        (False, True, {"components": {"schemas": SCHEMAS}}),
+        (True, False, SPEC),
+        (True, True, {"components": {"schemas": SCHEMAS}}),
+    ],
+    ids=["json spec", "json schemas only", "orjson spec", "orjson schemas only"],
+)
+@pytest.mark.loader
+def test_load_json(tmp_path, orjson, schemas_only, expected_spec):
+    """
+    GIVEN JSON specification file and whether orjson is installed
+    WHEN load_json is called with the file
+    THEN the specification is returned.
+    """
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(SPEC))
+    # orjson is an optional dependency that is emulated using the json module
+    mock_orjson = types.SimpleNamespace(loads=mock.MagicMock(side_effect=json.loads))
+
+    with mock.patch.dict("sys.modules", {"orjson": mock_orjson if orjson else None}):
+        spec = loader.load_json(str(spec_file), schemas_only=schemas_only)
+
+    assert spec == expected_spec
+    assert mock_orjson.loads.call_count == (1 if orjson else 0)
+
+
+@pytest.mark.parametrize(
+    "content, expected_spec",
+    [
+        ("{}", {}),
+        ('{"components": {}}', {"components": {}}),
+    ],
+    ids=["components missing", "schemas missing"],
+)
+@pytest.mark.loader
+def test_load_json_schemas_only_missing(tmp_path, content, expected_spec):
+    """
+    GIVEN JSON specification file without schemas
+    WHEN load_json is called with the file and schemas_only
+    THEN the specification without the schemas is returned.
+    """
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(content)
+
+    spec = loader.load_json(str(spec_file), schemas_only=True)
+
+    assert spec == expected_spec
+
+
+@pytest.mark.parametrize("schemas_only", [False, True], ids=["spec", "schemas only"])
+@pytest.mark.parametrize("extension", ["yaml", "json"])
+@pytest.mark.loader
+def test_load_remote_refs(tmp_path, extension, schemas_only):
+    """
+    GIVEN specification file in a directory with local and remote references
+    WHEN the specification is loaded
+    THEN the remote references are changed to use absolute filenames and the local
+        references are not changed.
+    """
+    spec_file = tmp_path / "specs" / f"spec.{extension}"
+    spec_file.parent.mkdir()
+    schemas = {
+        "Local": {"$ref": "#/components/schemas/Other"},
+        "Remote": {
+            "allOf": [{"$ref": "common.yaml#/components/schemas/Address"}],
+            "properties": {"item": {"$ref": "../items.json#/components/schemas/Item"}},
+        },
+    }
+    spec_file.write_text(json.dumps({"components": {"schemas": schemas}}))
+    load = loader.load_yaml if extension == "yaml" else loader.load_json
+
+    spec = load(str(spec_file), schemas_only=schemas_only)
+
+    returned_schemas = spec["components"]["schemas"]
+    address_ref = f"{tmp_path / 'specs' / 'common.yaml'}#/components/schemas/Address"
+    assert returned_schemas["Local"] == {"$ref": "#/components/schemas/Other"}
+    assert returned_schemas["Remote"] == {
+        "allOf": [{"$ref": address_ref}],
+        "properties": {
+            "item": {"$ref": f"{tmp_path / 'items.json'}#/components/schemas/Item"}
+        },
+    }
+
+
+FINGERPRINT_SCHEMAS = {
+    "IdBase": {"properties": {"id": {"type": "integer", "x-primary-key": True}}},
+    "Name": {"type": "string"},
+    "Parent": {
+        "allOf": [
+            {"$ref": "#/components/schemas/IdBase"},
+            {
+                "x-tablename": "parent",
+                "type": "object",
+                "properties": {
+                    "children": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Child"},
+                    }
+                },
+            },
+        ]
+    },
+    "Child": {
+        "x-tablename": "child",
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            "name": {"$ref": "#/components/schemas/Name"},
+            "parent": {"$ref": "#/components/schemas/Parent"},
+        },
+    },
+    "Other": {
+        "x-tablename": "other",
+        "type": "object",
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+    },
+}
+
+
+@pytest.mark.loader
+def test_fingerprints_stable():
+    """
+    GIVEN specification
+    WHEN fingerprints is called with separate copies of the specification
+    THEN the same fingerprint is returned for every schema, which differ between
+        schemas.
+    """
+    spec = {"components": {"schemas": FINGERPRINT_SCHEMAS}}
+
+    first = loader.fingerprints(spec)
+    second = loader.fingerprints(json.loads(json.dumps(spec)))
+
+    assert first == second
+    assert set(first) == set(FINGERPRINT_SCHEMAS)
+    assert len(set(first.values())) == len(first)
+
+
+@pytest.mark.parametrize(
+    "name, modify, expected_changed",
+    [
+        pytest.param(
+            "Name",
+            lambda schema: schema.update(maxLength=255),
+            {"Name", "Child", "Parent"},
+            id="$ref",
+        ),
+        pytest.param(
+            "IdBase",
+            lambda schema: schema.update(description="Base."),
+            {"IdBase", "Child", "Parent"},
+            id="allOf",
+        ),
+        pytest.param(
+            "Child",
+            lambda schema: schema.update(description="Child."),
+            {"Child", "Parent"},
+            id="cycle",
+        ),
+        pytest.param(
+            "Other",
+            lambda schema: schema.update(description="Other."),
+            {"Other"},
+            id="not referenced",
+        ),
+    ],
+)
+@pytest.mark.loader
+def test_fingerprints_changes(name, modify, expected_changed):
+    """
+    GIVEN specification and a schema that is modified
+    WHEN the fingerprints before and after the modification are compared
+    THEN the modified schema and every schema referencing it have changed.
+    """
+    previous_spec = {"components": {"schemas": FINGERPRINT_SCHEMAS}}
+    current_spec = json.loads(json.dumps(previous_spec))
+    modify(current_spec["components"]["schemas"][name])
+
+    returned_changes = loader.changes(
+        previous=loader.fingerprints(previous_spec),
+        current=loader.fingerprints(current_spec),
+    )
+
+    assert returned_changes == loader.Changes(
+        added=set(), removed=set(), changed=expected_changed
+    )
+
+
+@pytest.mark.loader
+def test_fingerprints_added_removed():
+    """
+    GIVEN fingerprints of specifications where a schema was added and another removed
+    WHEN changes is called
+    THEN the added and removed schemas are returned.
+    """
+    previous_spec = {"components": {"schemas": {"A": {"type": "string"}}}}
+    current_spec = {"components": {"schemas": {"B": {"type": "string"}}}}
+
+    returned_changes = loader.changes(
+        previous=loader.fingerprints(previous_spec),
+        current=loader.fingerprints(current_spec),
+    )
+
+    assert returned_changes == loader.Changes(added={"B"}, removed={"A"}, changed=set())
+
+
+@pytest.mark.loader
+def test_fingerprints_long_ref_chain():
+    """
+    GIVEN specification with a $ref chain longer than the recursion limit
+    WHEN fingerprints is called
+    THEN a fingerprint is returned for every schema.
+    """
+    length = 2000
+    schemas = {
+        f"Schema{index}": {"$ref": f"#/components/schemas/Schema{index + 1}"}
+        for index in range(length)
+    }
+    schemas[f"Schema{length}"] = {"type": "string"}
+
+    returned_fingerprints = loader.fingerprints({"components": {"schemas": schemas}})
+
+    assert len(returned_fingerprints) == length + 1
+
+
+@pytest.mark.loader
+def test_fingerprints_remote(tmp_path):
+    """
+    GIVEN specification with schemas that reference a schema in another file
+    WHEN the schema in the other file is modified and the fingerprints before and
+        after the modification are compared
+    THEN every schema referencing it directly or transitively has changed.
+    """
+    common_file = tmp_path / "common.json"
+    address = {"type": "object", "properties": {"zip": {"type": "string"}}}
+    common_file.write_text(
+        json.dumps({"components": {"schemas": {"Address": address}}})
+    )
+    spec = {
+        "components": {
+            "schemas": {
+                "Address": {"$ref": f"{common_file}#/components/schemas/Address"},
+                "Employee": {
+                    "properties": {"address": {"$ref": "#/components/schemas/Address"}}
+                },
+                "Other": {"type": "string"},
+            }
+        }
+    }
+    clear_ref_cache()
+    previous = loader.fingerprints(spec)
+    address["properties"]["zip"]["maxLength"] = 5
+    common_file.write_text(
+        json.dumps({"components": {"schemas": {"Address": address}}})
+    )
+    clear_ref_cache()
+
+    current = loader.fingerprints(spec)
+
+    clear_ref_cache()
+    assert set(current) == {"Address", "Employee", "Other"}
+    assert loader.changes(previous=previous, current=current) == loader.Changes(
+        added=set(), removed=set(), changed={"Address", "Employee"}
+    )
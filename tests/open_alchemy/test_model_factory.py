@@ -433,6 +433,39 @@ def test_schema(schemas, expected_schema):
     assert model._schema == expected_schema
 
 
+@pytest.mark.model
+def test_schema_shared():
+    """
+    GIVEN schemas with two schemas with an identical property
+    WHEN model_factory is called with the name of each schema
+    THEN the models share the schema of the property which cannot be modified.
+    """
+    schemas = {
+        name: {
+            "x-tablename": name.lower(),
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer", "x-primary-key": True},
+                "name": {"type": "string", "maxLength": 255},
+            },
+        }
+        for name in ("Schema1", "Schema2")
+    }
+
+    model_1 = model_factory.model_factory(
+        name="Schema1", base=mock.MagicMock, schemas=schemas
+    )
+    model_2 = model_factory.model_factory(
+        name="Schema2", base=mock.MagicMock, schemas=schemas
+    )
+
+    assert model_1._schema["properties"]["name"] is (
+        model_2._schema["properties"]["name"]
+    )
+    with pytest.raises(TypeError):
+        model_1._schema["properties"]["name"]["maxLength"] = 1
+
+
 @pytest.mark.model
 def test_table_args_unique():
     """
@@ -0,0 +1,173 @@
+"""Tests for profiling model construction."""
+
+import json
+import types
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import profiling
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Parent": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "children": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Child"},
+                    },
+                },
+                "x-tablename": "parent",
+                "type": "object",
+            },
+            "Child": {
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                "x-tablename": "child",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+def _init(*, define_all=False, include=None):
+    """Initialize the models for the specification in a separate namespace."""
+    return open_alchemy.init_model_factory(
+        base=declarative.declarative_base(),
+        spec={"components": {"schemas": dict(SPEC["components"]["schemas"])}},
+        define_all=define_all,
+        include=include,
+        namespace=types.SimpleNamespace(),
+    )
+
+
+@pytest.mark.profiling
+def test_inactive():
+    """
+    GIVEN profiling is not active
+    WHEN a model is recorded and calls are counted
+    THEN nothing is recorded.
+    """
+    with profiling.record_model(name="Model"):
+        profiling.count(profiling.PEEK)
+        profiling.record_foreign_key(model="Other", column="id", constructed=False)
+
+    with profiling.profile() as report:
+        pass
+
+    assert report.models == []
+
+
+@pytest.mark.profiling
+def test_profile_define_all():
+    """
+    GIVEN specification with a one to many relationship
+    WHEN the models are defined while profiling
+    THEN the construction of each model and the foreign key of the relationship are
+        recorded.
+    """
+    with profiling.profile() as report:
+        _init(define_all=True)
+
+    assert [record.name for record in report.models] == ["Parent", "Child"]
+    parent, child = report.models
+    assert parent.foreign_keys == [
+        profiling.ForeignKeyFixUp(model="Child", column="parent_id", constructed=False)
+    ]
+    assert child.foreign_keys == []
+    for record in report.models:
+        assert record.seconds > 0
+        for call in profiling.COUNTED_CALLS:
+            assert record.calls[call] > 0
+    assert report.seconds >= parent.seconds + child.seconds
+
+
+@pytest.mark.profiling
+def test_profile_constructed():
+    """
+    GIVEN specification with a one to many relationship
+    WHEN the child and then the parent are constructed while profiling
+    THEN the foreign key added to the constructed child is recorded.
+    """
+    model_factory = _init()
+
+    with profiling.profile() as report:
+        model_factory(name="Child")
+        model_factory(name="Parent")
+
+    assert report.models[1].foreign_keys == [
+        profiling.ForeignKeyFixUp(model="Child", column="parent_id", constructed=True)
+    ]
+
+
+@pytest.mark.profiling
+def test_profile_other_calls():
+    """
+    GIVEN specification
+    WHEN define_all selects models using include while profiling
+    THEN the calls made to select the models are recorded separately.
+    """
+    with profiling.profile() as report:
+        _init(define_all=True, include=["Parent"])
+
+    assert report.other_calls[profiling.PREPARE_SCHEMA] > 0
+
+
+@pytest.mark.profiling
+def test_report():
+    """
+    GIVEN profile with models
+    WHEN the profile is converted to a table and a dictionary
+    THEN the models are ordered by time in the table and the dictionary can be
+        serialized to JSON.
+    """
+    report = profiling.Profile(
+        models=[
+            profiling.ModelRecord(name="Fast", seconds=0.1),
+            profiling.ModelRecord(
+                name="Slow",
+                seconds=0.25,
+                foreign_keys=[
+                    profiling.ForeignKeyFixUp(
+                        model="Fast", column="slow_id", constructed=False
+                    )
+                ],
+            ),
+        ],
+        seconds=0.5,
+    )
+    report.models[0].calls[profiling.PEEK] = 3
+    report.models[1].calls[profiling.PEEK] = 4
+    report.other_calls[profiling.PEEK] = 1
+
+    assert report.table().splitlines() == [
+        "model   seconds  prepare_schema  peek  get_ext_prop  foreign keys",
+        "-----  --------  --------------  ----  ------------  ------------",
+        "Slow   0.250000               0     4             0             1",
+        "Fast   0.100000               0     3             0             0",
+        "-----  --------  --------------  ----  ------------  ------------",
+        "total  0.500000               0     8             0             1",
+    ]
+    assert json.loads(json.dumps(report.as_dict())) == {
+        "seconds": 0.5,
+        "models": [
+            {
+                "name": "Fast",
+                "seconds": 0.1,
+                "calls": {"prepare_schema": 0, "peek": 3, "get_ext_prop": 0},
+                "foreign_keys": [],
+            },
+            {
+                "name": "Slow",
+                "seconds": 0.25,
+                "calls": {"prepare_schema": 0, "peek": 4, "get_ext_prop": 0},
+                "foreign_keys": [
+                    {"model": "Fast", "column": "slow_id", "constructed": False}
+                ],
+            },
+        ],
+        "other_calls": {"prepare_schema": 0, "peek": 1, "get_ext_prop": 0},
+    }
@@ -0,0 +1,286 @@
+"""Tests for sharing model artifacts between bases."""
+# pylint: disable=no-member
+
+import copy
+import types
+from unittest import mock
+
+import pytest
+import sqlalchemy
+from sqlalchemy import orm
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+from open_alchemy import helpers
+from open_alchemy import hooks
+from open_alchemy import model_factory
+from open_alchemy import shared_artifacts
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Pet": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                },
+                "x-tablename": "pet",
+                "type": "object",
+            },
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string", "x-index": True},
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Project": {
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                "x-tablename": "project",
+                "x-secondary": "employee_project",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "division": {
+                        "allOf": [
+                            {"$ref": "#/components/schemas/Division"},
+                            {"x-backref": "employees"},
+                        ]
+                    },
+                    "projects": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Project"},
+                    },
+                    "pets": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Pet"},
+                    },
+                },
+                "x-tablename": "employee",
+                "x-composite-index": ["id", "name"],
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+@pytest.mark.model
+def test_get_different_schemas():
+    """
+    GIVEN shared artifacts that were used with schemas
+    WHEN get is called with different schemas
+    THEN MalformedSpecificationError is raised.
+    """
+    schemas = copy.deepcopy(SPEC["components"]["schemas"])
+    artifacts = shared_artifacts.SharedArtifacts()
+    artifacts.get(name="Pet", schemas=schemas)
+
+    with pytest.raises(exceptions.MalformedSpecificationError):
+        artifacts.get(name="Pet", schemas=copy.deepcopy(schemas))
+
+
+@pytest.mark.model
+def test_get_cached():
+    """
+    GIVEN shared artifacts
+    WHEN get is called multiple times for a model
+    THEN the same artifacts are returned.
+    """
+    schemas = copy.deepcopy(SPEC["components"]["schemas"])
+    artifacts = shared_artifacts.SharedArtifacts()
+
+    first = artifacts.get(name="Employee", schemas=schemas)
+    second = artifacts.get(name="Employee", schemas=schemas)
+
+    assert first is second
+    assert [name for name, _ in first.associations] == ["employee_project"]
+    assert first.foreign_keys == ["Pet"]
+
+
+@pytest.mark.model
+def test_get_foreign_key_added():
+    """
+    GIVEN shared artifacts with the artifacts of a model
+    WHEN another model adds a foreign key to the model
+    THEN the artifacts of the model are gathered again and include the foreign key.
+    """
+    schemas = copy.deepcopy(SPEC["components"]["schemas"])
+    artifacts = shared_artifacts.SharedArtifacts()
+    pet_artifacts = artifacts.get(name="Pet", schemas=schemas)
+
+    artifacts.get(name="Employee", schemas=schemas)
+    updated_pet_artifacts = artifacts.get(name="Pet", schemas=schemas)
+
+    assert updated_pet_artifacts is not pet_artifacts
+    assert [name for name, _ in pet_artifacts.model.class_vars] == ["id", "name"]
+    assert [name for name, _ in updated_pet_artifacts.model.class_vars] == [
+        "id",
+        "name",
+        "employee_id",
+    ]
+
+
+@pytest.mark.parametrize(
+    "order, expected_gather_count",
+    [
+        (["Pet", "Division", "Project", "Employee"], 5),
+        (["Employee", "Project", "Division", "Pet"], 4),
+    ],
+    ids=["referenced first", "referencing first"],
+)
+@pytest.mark.model
+def test_multiple_bases(order, expected_gather_count, engine, sessionmaker):
+    """
+    GIVEN specification with relationships and shared artifacts
+    WHEN models are constructed for multiple bases in a given order
+    THEN the artifacts of every model are only gathered once for every version of its
+        schema and the models of every base work with the database.
+    """
+    spec = copy.deepcopy(SPEC)
+    artifacts = shared_artifacts.SharedArtifacts()
+    namespaces = []
+
+    with mock.patch.object(
+        model_factory,
+        "gather_artifacts",
+        side_effect=model_factory.gather_artifacts,
+    ) as mocked_gather_artifacts:
+        for _ in range(3):
+            namespace = types.SimpleNamespace()
+            base = declarative.declarative_base()
+            factory = open_alchemy.init_model_factory(
+                base=base,
+                spec=spec,
+                namespace=namespace,
+                shared_artifacts=artifacts,
+            )
+            for name in order:
+                factory(name=name)
+            namespaces.append(namespace)
+
+    # Pet is gathered again if Employee adds the foreign key after Pet was gathered
+    assert mocked_gather_artifacts.call_count == expected_gather_count
+    bases = {namespace.Base for namespace in namespaces}
+    assert len(bases) == 3
+
+    for namespace in namespaces:
+        metadata = namespace.Base.metadata
+        assert set(metadata.tables.keys()) == {
+            "pet",
+            "division",
+            "project",
+            "employee",
+            "employee_project",
+        }
+        assert "employee_id" in metadata.tables["pet"].columns
+        (index,) = [
+            index
+            for index in metadata.tables["employee"].indexes
+            if len(index.columns) == 2
+        ]
+        assert index.table is metadata.tables["employee"]
+
+        metadata.create_all(engine)
+        employee = namespace.Employee.from_dict(
+            id=1,
+            name="employee 1",
+            division={"id": 2, "name": "division 1"},
+            projects=[{"id": 3}],
+            pets=[{"id": 4, "name": "pet 1"}],
+        )
+        session = sessionmaker()
+        session.add(employee)
+        session.flush()
+
+        queried_employee = session.query(namespace.Employee).first()
+        assert queried_employee.to_dict() == {
+            "id": 1,
+            "name": "employee 1",
+            "division": {"id": 2, "name": "division 1"},
+            "projects": [{"id": 3}],
+            "pets": [{"id": 4, "name": "pet 1"}],
+        }
+        assert queried_employee.division.employees == [queried_employee]
+        assert session.query(namespace.employee_project).first() == (1, 3)
+        session.rollback()
+        metadata.drop_all(engine)
+
+
+@pytest.mark.model
+def test_relationship_options():
+    """
+    GIVEN specification, shared artifacts and hook that sets options of a
+        relationship that are not the default
+    WHEN the models are constructed for multiple bases
+    THEN the relationships of every base have the options.
+    """
+
+    def set_options(*, name, logical_name, class_vars, spec):
+        """Replace the division relationship with one with more options."""
+        # pylint: disable=unused-argument
+        if name == "Employee" and logical_name == "division":
+            class_vars[-1] = (
+                "division",
+                helpers.relationships.construct(
+                    "Division",
+                    backref=orm.backref("employees", uselist=True),
+                    lazy="joined",
+                    passive_deletes=True,
+                ),
+            )
+
+    spec = copy.deepcopy(SPEC)
+    artifacts = shared_artifacts.SharedArtifacts()
+    namespaces = []
+    with hooks.registered(event=hooks.AFTER_COLUMN, hook=set_options):
+        for _ in range(2):
+            namespace = types.SimpleNamespace()
+            open_alchemy.init_model_factory(
+                base=declarative.declarative_base(),
+                spec=spec,
+                define_all=True,
+                namespace=namespace,
+                shared_artifacts=artifacts,
+            )
+            namespaces.append(namespace)
+
+    for namespace in namespaces:
+        relationship = sqlalchemy.inspect(namespace.Employee).relationships[
+            "division"
+        ]
+        assert relationship.lazy == "joined"
+        assert relationship.passive_deletes is True
+        backref = sqlalchemy.inspect(namespace.Division).relationships["employees"]
+        assert backref.uselist is True
+
+
+@pytest.mark.model
+def test_columns_not_shared():
+    """
+    GIVEN specification and shared artifacts
+    WHEN a model is constructed for multiple bases
+    THEN the models have separate tables and columns.
+    """
+    spec = copy.deepcopy(SPEC)
+    artifacts = shared_artifacts.SharedArtifacts()
+    models = []
+    for _ in range(2):
+        factory = open_alchemy.init_model_factory(
+            base=declarative.declarative_base(),
+            spec=spec,
+            namespace=types.SimpleNamespace(),
+            shared_artifacts=artifacts,
+        )
+        models.append(factory(name="Division"))
+
+    first, second = models
+    assert first.__table__ is not second.__table__
+    assert first.__table__.c.name is not second.__table__.c.name
+    assert isinstance(second.__table__.c.name.type, sqlalchemy.String)
+    assert second.__table__.c.name.index
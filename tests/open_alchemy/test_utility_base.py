@@ -6,6 +6,7 @@ from unittest import mock
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy import types
 from open_alchemy import utility_base
 
 
@@ -337,6 +338,94 @@ def test_from_dict_read_only_false():
     model.from_dict(**{"key": "value"})
 
 
+@pytest.mark.parametrize(
+    "collect_all_errors, expected_errors",
+    [
+        pytest.param(
+            False,
+            [
+                types.DictionaryError(
+                    path=("key_1",), keyword="type", expected="integer", value="1"
+                )
+            ],
+            id="first",
+        ),
+        pytest.param(
+            True,
+            [
+                types.DictionaryError(
+                    path=("key_1",), keyword="type", expected="integer", value="1"
+                ),
+                types.DictionaryError(
+                    path=("key_2",), keyword="maxLength", expected=1, value="ab"
+                ),
+                types.DictionaryError(
+                    path=("key_3",),
+                    keyword="additionalProperties",
+                    expected=False,
+                    value=3,
+                ),
+                types.DictionaryError(
+                    path=("key_4",), keyword="readOnly", expected=True, value=4
+                ),
+            ],
+            id="all",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_from_dict_errors(collect_all_errors, expected_errors):
+    """
+    GIVEN model that collects all errors or not and dictionary with multiple errors
+    WHEN from_dict is called with the dictionary
+    THEN MalformedModelDictionaryError is raised with the expected errors.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "string", "maxLength": 1},
+                    "key_4": {"type": "integer", "readOnly": True},
+                }
+            },
+            "_collect_all_errors": collect_all_errors,
+            "__init__": __init__,
+        },
+    )
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError) as exc:
+        model.from_dict(key_1="1", key_2="ab", key_3=3, key_4=4)
+
+    assert list(exc.value.errors) == expected_errors
+
+
+@pytest.mark.utility_base
+def test_from_dict_error_message():
+    """
+    GIVEN model and a large dictionary that does not satisfy the schema
+    WHEN from_dict is called with the dictionary and the error is rendered
+    THEN the message describes the error and abbreviates the value.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError) as exc:
+        model.from_dict(key=["value"] * 100_000)
+
+    message = str(exc.value)
+    assert "key does not satisfy type 'integer'" in message
+    assert len(message) < 300
+
+
 @pytest.mark.utility_base
 def test_from_dict_no_type_schema():
     """
@@ -423,6 +512,32 @@ def test_from_dict_date_time():
     )
 
 
+@pytest.mark.utility_base
+def test_from_dict_uuid_malformed():
+    """
+    GIVEN schema with string type and uuid format
+    WHEN from_dict is called with a string that is not a uuid
+    THEN MalformedModelDictionaryError is raised with the error for the property.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key": {"type": "string", "format": "uuid"}}},
+            "__init__": __init__,
+        },
+    )
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError) as exc:
+        model.from_dict(key="not a uuid")
+
+    assert list(exc.value.errors) == [
+        types.DictionaryError(
+            path=("key",), keyword="format", expected="uuid", value="not a uuid"
+        )
+    ]
+
+
 @pytest.mark.utility_base
 def test_from_dict_object_de_ref_missing():
     """
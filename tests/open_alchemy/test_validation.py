@@ -0,0 +1,328 @@
+"""Tests for validating specifications without constructing models."""
+
+import copy
+
+import pytest
+
+import open_alchemy
+from open_alchemy import exceptions
+from open_alchemy import validation
+
+SCHEMAS = {
+    "Division": {
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        "x-tablename": "division",
+        "type": "object",
+    },
+    "Employee": {
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            "division": {"$ref": "#/components/schemas/Division"},
+        },
+        "x-tablename": "employee",
+        "type": "object",
+    },
+    "Project": {
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        "x-tablename": "project",
+        "type": "object",
+    },
+    "Manager": {
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            "projects": {
+                "type": "array",
+                "items": {"$ref": "#/components/schemas/Project"},
+            },
+        },
+        "x-tablename": "manager",
+        "type": "object",
+    },
+    "Address": {"type": "object", "properties": {"street": {"type": "string"}}},
+}
+INVALID_SCHEMAS = {
+    **SCHEMAS,
+    "NoProperties": {"x-tablename": "no_properties", "type": "object"},
+    "BadType": {
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        "x-tablename": "bad_type",
+        "type": "array",
+    },
+    "MissingRef": {
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            "other": {"$ref": "#/components/schemas/Missing"},
+        },
+        "x-tablename": "missing_ref",
+        "type": "object",
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "spec, expected_message",
+    [
+        ({}, '"components"'),
+        ({"components": {}}, '"schemas"'),
+    ],
+    ids=["components missing", "schemas missing"],
+)
+@pytest.mark.validation
+def test_validate_spec_malformed(spec, expected_message):
+    """
+    GIVEN specification without schemas
+    WHEN validate_spec is called with the specification
+    THEN MalformedSpecificationError is raised.
+    """
+    with pytest.raises(exceptions.MalformedSpecificationError) as exc_info:
+        validation.validate_spec(spec=spec)
+
+    assert expected_message in str(exc_info.value)
+
+
+@pytest.mark.validation
+def test_check_schema_valid():
+    """
+    GIVEN schemas where one model requires a foreign key on another
+    WHEN check_schema is called with the model
+    THEN None is returned and the schemas are not modified.
+    """
+    schemas = copy.deepcopy(SCHEMAS)
+
+    error = validation.check_schema(name="Manager", schemas=schemas)
+
+    assert error is None
+    assert schemas == SCHEMAS
+    assert not hasattr(open_alchemy.models, "Manager")
+
+
+@pytest.mark.validation
+def test_check_schema_invalid():
+    """
+    GIVEN schemas with a model without properties
+    WHEN check_schema is called with the model
+    THEN the error is returned.
+    """
+    error = validation.check_schema(name="NoProperties", schemas=INVALID_SCHEMAS)
+
+    assert error == validation.SchemaError(
+        name="NoProperties",
+        error="MalformedSchemaError",
+        message="At least 1 property is required for NoProperties.",
+    )
+    assert str(error) == (
+        "NoProperties: MalformedSchemaError: "
+        "At least 1 property is required for NoProperties."
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2], ids=["serial", "parallel"])
+@pytest.mark.validation
+def test_validate_spec_valid(max_workers):
+    """
+    GIVEN valid specification
+    WHEN validate_spec is called with the specification
+    THEN a valid report is returned.
+    """
+    report = validation.validate_spec(
+        spec={"components": {"schemas": SCHEMAS}}, max_workers=max_workers
+    )
+
+    assert report.valid
+    assert report.errors == []
+    assert str(report) == "No errors found."
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, None], ids=["serial", "2", "cpus"])
+@pytest.mark.validation
+def test_validate_spec_invalid(max_workers):
+    """
+    GIVEN specification with multiple invalid models
+    WHEN validate_spec is called with the specification
+    THEN the errors of all the invalid models are returned in the order of the
+        schemas.
+    """
+    report = open_alchemy.validate_spec(
+        spec={"components": {"schemas": INVALID_SCHEMAS}}, max_workers=max_workers
+    )
+
+    assert not report.valid
+    assert [(error.name, error.error) for error in report.errors] == [
+        ("NoProperties", "MalformedSchemaError"),
+        ("BadType", "FeatureNotImplementedError"),
+        ("MissingRef", "SchemaNotFoundError"),
+    ]
+    assert str(report).splitlines()[0] == "3 error(s) found:"
+
+
+LINT_SCHEMAS = {
+    **SCHEMAS,
+    "IdBase": {"properties": {"id": {"type": "integer", "x-primary-key": True}}},
+    "Many": {
+        "allOf": [
+            {"$ref": "#/components/schemas/IdBase"},
+            {
+                "x-tablename": "many",
+                "type": "object",
+                "properties": {
+                    "untyped": {},
+                    "a~b/c": {"type": "string", "maxLength": "1"},
+                    "other": {"$ref": "#/components/schemas/Missing"},
+                },
+            },
+        ],
+        # Only schemas with x-tablename at the top level are checked
+        "x-tablename": "many",
+    },
+    "Unresolved": {"allOf": [{"$ref": "#/components/schemas/Missing"}]},
+}
+
+
+@pytest.mark.validation
+def test_lint_schema_valid():
+    """
+    GIVEN schemas where one model requires a foreign key on another
+    WHEN lint_schema is called with the model
+    THEN no errors are returned and the schemas are not modified.
+    """
+    schemas = copy.deepcopy(SCHEMAS)
+
+    errors = validation.lint_schema(name="Manager", schemas=schemas)
+
+    assert errors == []
+    assert schemas == SCHEMAS
+    assert not hasattr(open_alchemy.models, "Manager")
+
+
+@pytest.mark.validation
+def test_lint_schema_properties():
+    """
+    GIVEN schemas with a model with multiple invalid properties defined in allOf
+    WHEN lint_schema is called with the model
+    THEN the errors of all the properties are returned with pointers to the
+        properties.
+    """
+    errors = validation.lint_schema(name="Many", schemas=LINT_SCHEMAS)
+
+    assert [(error.pointer, error.error) for error in errors] == [
+        ("/components/schemas/Many/allOf/1/properties/untyped", "TypeMissingError"),
+        ("/components/schemas/Many/allOf/1/properties/a~0b~1c", "MalformedSchemaError"),
+        ("/components/schemas/Many/allOf/1/properties/other", "SchemaNotFoundError"),
+    ]
+    assert str(errors[0]) == (
+        "/components/schemas/Many/allOf/1/properties/untyped: TypeMissingError: "
+        "Every property requires a type."
+    )
+
+
+@pytest.mark.validation
+def test_lint_schema_model():
+    """
+    GIVEN schemas with a model that is not an object and has no properties
+    WHEN lint_schema is called with the model
+    THEN both errors are returned with pointers to the model.
+    """
+    schemas = {"Invalid": {"x-tablename": "invalid", "type": "array"}}
+
+    errors = validation.lint_schema(name="Invalid", schemas=schemas)
+
+    assert [(error.pointer, error.error) for error in errors] == [
+        ("/components/schemas/Invalid", "FeatureNotImplementedError"),
+        ("/components/schemas/Invalid", "MalformedSchemaError"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "spec, expected_pointer",
+    [
+        ({}, "/components"),
+        ({"components": {}}, "/components/schemas"),
+        ({"components": {"schemas": []}}, "/components/schemas"),
+    ],
+    ids=["components missing", "schemas missing", "schemas not dictionary"],
+)
+@pytest.mark.validation
+def test_lint_spec_malformed(spec, expected_pointer):
+    """
+    GIVEN specification without schemas
+    WHEN lint_spec is called with the specification
+    THEN the error is returned.
+    """
+    report = validation.lint_spec(spec=spec)
+
+    assert [(error.pointer, error.error) for error in report.errors] == [
+        (expected_pointer, "MalformedSpecificationError")
+    ]
+
+
+@pytest.mark.parametrize(
+    "schemas, expected_pointers",
+    [
+        ({"Invalid": "invalid"}, ["/components/schemas/Invalid"]),
+        (
+            {
+                "Invalid": {
+                    "x-tablename": "invalid",
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": "string",
+                        "code": ["string"],
+                    },
+                }
+            },
+            [
+                "/components/schemas/Invalid/properties/name",
+                "/components/schemas/Invalid/properties/code",
+            ],
+        ),
+        (
+            {
+                "Invalid": {
+                    "x-tablename": "invalid",
+                    "type": "object",
+                    "properties": "id",
+                }
+            },
+            ["/components/schemas/Invalid/properties"],
+        ),
+    ],
+    ids=["schema", "property schema", "properties"],
+)
+@pytest.mark.validation
+def test_lint_spec_not_dictionary(schemas, expected_pointers):
+    """
+    GIVEN specification with a schema, property schemas or properties that are not
+        dictionaries
+    WHEN lint_spec is called with the specification
+    THEN an error is returned for each of them.
+    """
+    report = validation.lint_spec(spec={"components": {"schemas": schemas}})
+
+    assert [(error.pointer, error.error) for error in report.errors] == [
+        (pointer, "MalformedSchemaError") for pointer in expected_pointers
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2], ids=["serial", "parallel"])
+@pytest.mark.validation
+def test_lint_spec(max_workers):
+    """
+    GIVEN specification with invalid models and a schema with an invalid $ref
+    WHEN lint_spec is called with the specification
+    THEN all the errors are returned in the order of the schemas.
+    """
+    report = validation.lint_spec(
+        spec={"components": {"schemas": {**INVALID_SCHEMAS, **LINT_SCHEMAS}}},
+        max_workers=max_workers,
+    )
+
+    assert [error.pointer for error in report.errors] == [
+        "/components/schemas/NoProperties",
+        "/components/schemas/BadType",
+        "/components/schemas/MissingRef/properties/other",
+        "/components/schemas/Many/allOf/1/properties/untyped",
+        "/components/schemas/Many/allOf/1/properties/a~0b~1c",
+        "/components/schemas/Many/allOf/1/properties/other",
+        "/components/schemas/Unresolved/allOf/0/$ref",
+    ]
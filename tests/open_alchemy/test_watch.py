@@ -0,0 +1,431 @@
+"""Tests for rebuilding the models when the specification file changes."""
+# pylint: disable=no-member,redefined-outer-name
+
+import copy
+import json
+import os
+import time
+import types
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from open_alchemy import exceptions
+from open_alchemy import loader
+from open_alchemy import watch
+
+SPEC_DIVISION = {
+    "properties": {
+        "id": {"type": "integer", "x-primary-key": True},
+        "name": {"type": "string"},
+    },
+    "x-tablename": "division",
+    "type": "object",
+}
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": SPEC_DIVISION,
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+            "Project": {
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                "x-tablename": "project",
+                "x-secondary": "team_project",
+                "type": "object",
+            },
+            "Team": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "projects": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Project"},
+                    },
+                },
+                "x-tablename": "team",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+class _SpecFile:
+    """Writes versions of a specification with increasing modification times."""
+
+    def __init__(self, path):
+        """Construct."""
+        self.path = str(path)
+        self._time = 1_000_000_000_000_000_000
+
+    def write(self, spec):
+        """Write a version of the specification."""
+        with open(self.path, "w") as out_file:
+            json.dump(spec, out_file)
+        self._time += 1_000_000_000
+        os.utime(self.path, ns=(self._time, self._time))
+
+
+@pytest.fixture
+def spec_file(tmp_path):
+    """A file with SPEC."""
+    spec_file = _SpecFile(tmp_path / "spec.json")
+    spec_file.write(SPEC)
+    return spec_file
+
+
+def _watcher(spec_file, **kwargs):
+    """Construct a watcher for the file on a separate namespace."""
+    namespace = types.SimpleNamespace()
+    watcher = watch.Watcher(
+        spec_file.path, load=loader.load_json, namespace=namespace, **kwargs
+    )
+    return watcher, namespace
+
+
+@pytest.mark.watch
+def test_groups():
+    """
+    GIVEN schemas with models related in either direction and unrelated models
+    WHEN _groups is called with the schemas
+    THEN related models share a group.
+    """
+    groups = watch._groups(  # pylint: disable=protected-access
+        schemas=SPEC["components"]["schemas"]
+    )
+
+    assert groups == {
+        "Division": {"Division", "Employee"},
+        "Employee": {"Division", "Employee"},
+        "Project": {"Project", "Team"},
+        "Team": {"Project", "Team"},
+    }
+
+
+@pytest.mark.watch
+def test_init(spec_file):
+    """
+    GIVEN file with a specification
+    WHEN Watcher is constructed for the file
+    THEN all the models are set on the namespace together with the Base and the
+        association tables.
+    """
+    watcher, namespace = _watcher(spec_file)
+
+    assert namespace.Base is watcher.base
+    for name in ("Division", "Employee", "Project", "Team"):
+        assert getattr(namespace, name).__tablename__ == name.lower()
+    assert namespace.team_project.name == "team_project"
+    assert watcher(name="Employee") is namespace.Employee
+    assert watcher.check() is None
+
+
+@pytest.mark.watch
+def test_check_changed(spec_file):
+    """
+    GIVEN watcher for a file
+    WHEN a schema of a model is changed and check is called
+    THEN the model and the models in its group are rebuilt on the same base, the
+        other models are kept and the metadata of the base has all the tables.
+    """
+    watcher, namespace = _watcher(spec_file)
+    base = watcher.base
+    employee = namespace.Employee
+    division = namespace.Division
+    team = namespace.Team
+    team_project = namespace.team_project
+    spec = copy.deepcopy(SPEC)
+    spec["components"]["schemas"]["Division"]["properties"]["code"] = {"type": "string"}
+    spec_file.write(spec)
+
+    changes = watcher.check()
+
+    assert changes.changed == {"Division", "Employee"}
+    assert watcher.base is base
+    assert namespace.Base is base
+    assert namespace.Division is not division
+    assert namespace.Employee is not employee
+    assert set(base.metadata.tables) == {
+        "division",
+        "employee",
+        "project",
+        "team",
+        "team_project",
+    }
+    assert base.metadata.tables["division"] is namespace.Division.__table__
+    assert "code" in namespace.Division.__table__.columns
+    employee = namespace.Employee.from_dict(
+        id=1, division={"id": 2, "name": "name 1", "code": "code 1"}
+    )
+    assert employee.division.code == "code 1"
+    assert namespace.Team is team
+    assert namespace.team_project is team_project
+    assert watcher(name="Division") is namespace.Division
+
+
+@pytest.mark.watch
+def test_check_association_table(spec_file):
+    """
+    GIVEN watcher for a file with a many to many relationship
+    WHEN a model of the relationship is changed and check is called
+    THEN the association table is constructed again.
+    """
+    watcher, namespace = _watcher(spec_file)
+    team_project = namespace.team_project
+    spec = copy.deepcopy(SPEC)
+    spec["components"]["schemas"]["Project"]["properties"]["name"] = {"type": "string"}
+    spec_file.write(spec)
+
+    watcher.check()
+
+    assert namespace.team_project is not team_project
+    assert watcher.base.metadata.tables["team_project"] is namespace.team_project
+
+
+@pytest.mark.watch
+def test_check_added_removed(spec_file):
+    """
+    GIVEN watcher for a file
+    WHEN a model is removed, a model is added and check is called
+    THEN the removed model and its association table are removed from the namespace
+        and the added model is set on it.
+    """
+    watcher, namespace = _watcher(spec_file)
+    spec = copy.deepcopy(SPEC)
+    del spec["components"]["schemas"]["Team"]
+    spec["components"]["schemas"]["Office"] = {
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        "x-tablename": "office",
+        "type": "object",
+    }
+    spec_file.write(spec)
+
+    changes = watcher.check()
+
+    assert changes.added == {"Office"}
+    assert changes.removed == {"Team"}
+    assert not hasattr(namespace, "Team")
+    assert not hasattr(namespace, "team_project")
+    assert set(watcher.base.metadata.tables) == {
+        "division",
+        "employee",
+        "office",
+        "project",
+    }
+    assert namespace.Office.__tablename__ == "office"
+    assert namespace.Project.__tablename__ == "project"
+
+
+@pytest.mark.watch
+def test_check_same_content(spec_file):
+    """
+    GIVEN watcher for a file
+    WHEN the file is written again with the same content and check is called
+    THEN no models are rebuilt.
+    """
+    watcher, namespace = _watcher(spec_file)
+    base = watcher.base
+    employee = namespace.Employee
+    spec_file.write(SPEC)
+
+    changes = watcher.check()
+
+    assert changes == loader.Changes(added=set(), removed=set(), changed=set())
+    assert watcher.base is base
+    assert namespace.Employee is employee
+
+
+@pytest.mark.watch
+def test_check_error(spec_file):
+    """
+    GIVEN watcher for a file
+    WHEN the file is changed to an invalid specification, check is called, the file
+        is fixed and check is called again
+    THEN the first check raises and keeps the models and their tables and the second
+        check rebuilds the models.
+    """
+    watcher, namespace = _watcher(spec_file)
+    employee = namespace.Employee
+    tables = dict(watcher.base.metadata.tables)
+    spec = copy.deepcopy(SPEC)
+    del spec["components"]["schemas"]["Division"]["properties"]["name"]["type"]
+    spec_file.write(spec)
+
+    with pytest.raises(exceptions.TypeMissingError):
+        watcher.check()
+
+    assert namespace.Employee is employee
+    assert watcher.base.metadata.tables == tables
+    spec["components"]["schemas"]["Division"]["properties"]["name"]["type"] = "string"
+    spec["components"]["schemas"]["Division"]["properties"]["code"] = {"type": "string"}
+    spec_file.write(spec)
+
+    changes = watcher.check()
+
+    assert changes.changed == {"Division", "Employee"}
+    assert namespace.Employee is not employee
+    assert "code" in namespace.Division.__table__.columns
+    employee = namespace.Employee.from_dict(
+        id=1, division={"id": 2, "name": "name 1", "code": "code 1"}
+    )
+    assert employee.division.code == "code 1"
+
+
+@pytest.mark.watch
+def test_check_error_mapping(spec_file):
+    """
+    GIVEN watcher for a file
+    WHEN the file is changed so that a model cannot be mapped after its table is
+        constructed and check is called
+    THEN check raises and the previous models and tables are kept on the base.
+    """
+    watcher, namespace = _watcher(spec_file)
+    division = namespace.Division
+    tables = dict(watcher.base.metadata.tables)
+    spec = copy.deepcopy(SPEC)
+    del spec["components"]["schemas"]["Division"]["properties"]["id"]["x-primary-key"]
+    spec_file.write(spec)
+
+    with pytest.raises(sqlalchemy.exc.ArgumentError):
+        watcher.check()
+
+    assert namespace.Division is division
+    assert watcher.base.metadata.tables == tables
+    employee = namespace.Employee.from_dict(id=1, division={"id": 2, "name": "name"})
+    assert employee.division.name == "name"
+
+
+@pytest.mark.watch
+def test_check_define_all_false(spec_file):
+    """
+    GIVEN watcher for a file that does not define all the models
+    WHEN a model is requested, the schemas of the requested and of a model that was
+        not requested are changed and check is called
+    THEN only the models that were requested are constructed again.
+    """
+    watcher, namespace = _watcher(spec_file, define_all=False)
+    assert not hasattr(namespace, "Employee")
+    employee = watcher(name="Employee")
+    division = watcher(name="Division")
+    assert namespace.Employee is employee
+    assert division.metadata is employee.metadata
+    assert not hasattr(namespace, "Team")
+    spec = copy.deepcopy(SPEC)
+    for name in ("Division", "Project"):
+        spec["components"]["schemas"][name]["properties"]["code"] = {"type": "string"}
+    spec_file.write(spec)
+
+    watcher.check()
+
+    assert namespace.Employee is not employee
+    assert "code" in namespace.Division.__table__.columns
+    assert not hasattr(namespace, "Team")
+    assert not hasattr(namespace, "Project")
+
+
+@pytest.mark.watch
+def test_check_remote(tmp_path):
+    """
+    GIVEN watcher for a file that references a model in another file
+    WHEN only the other file is changed and check is called
+    THEN the referenced model and the models in its group are rebuilt.
+    """
+    common_file = _SpecFile(tmp_path / "common.json")
+    common = {"components": {"schemas": {"Division": SPEC_DIVISION}}}
+    common_file.write(common)
+    spec = copy.deepcopy(SPEC)
+    spec["components"]["schemas"]["Division"] = {
+        "$ref": f"{common_file.path}#/components/schemas/Division"
+    }
+    spec_file = _SpecFile(tmp_path / "spec.json")
+    spec_file.write(spec)
+    watcher, namespace = _watcher(spec_file)
+    employee = namespace.Employee
+    team = namespace.Team
+    common = copy.deepcopy(common)
+    common["components"]["schemas"]["Division"]["properties"]["code"] = {
+        "type": "string"
+    }
+    common_file.write(common)
+
+    changes = watcher.check()
+
+    assert changes.changed == {"Division", "Employee"}
+    assert "code" in namespace.Division.__table__.columns
+    assert namespace.Employee is not employee
+    assert namespace.Team is team
+    assert watcher.check() is None
+
+
+@pytest.mark.watch
+def test_init_yaml_watch_base(tmp_path):
+    """
+    GIVEN file with a specification and a declarative base
+    WHEN init_yaml is called with watch and the base, the file is changed and check
+        is called
+    THEN the models are constructed and rebuilt on the base.
+    """
+    spec_file = _SpecFile(tmp_path / "spec.yaml")
+    spec_file.write(SPEC)
+    base = declarative.declarative_base()
+    namespace = types.SimpleNamespace()
+
+    returned_base, model_factory = open_alchemy.init_yaml(
+        spec_file.path, base=base, watch=True, namespace=namespace
+    )
+    try:
+        assert returned_base is base
+        assert namespace.Base is base
+        assert issubclass(namespace.Division, base)
+        spec = copy.deepcopy(SPEC)
+        spec["components"]["schemas"]["Division"]["properties"]["code"] = {
+            "type": "string"
+        }
+        spec_file.write(spec)
+
+        model_factory.check()
+
+        assert issubclass(namespace.Division, base)
+        assert base.metadata.tables["division"] is namespace.Division.__table__
+        assert "code" in base.metadata.tables["division"].columns
+    finally:
+        model_factory.stop()
+
+
+@pytest.mark.watch
+def test_init_json_watch(spec_file):
+    """
+    GIVEN file with a specification
+    WHEN init_json is called with watch and the file is changed
+    THEN the models are rebuilt in the background.
+    """
+    namespace = types.SimpleNamespace()
+    base, model_factory = open_alchemy.init_json(
+        spec_file.path, watch=True, watch_interval=0.01, namespace=namespace
+    )
+    division = namespace.Division
+    try:
+        assert isinstance(model_factory, watch.Watcher)
+        assert namespace.Base is base
+        spec = copy.deepcopy(SPEC)
+        spec["components"]["schemas"]["Division"]["properties"]["code"] = {
+            "type": "string"
+        }
+        spec_file.write(spec)
+
+        deadline = time.monotonic() + 5
+        while namespace.Division is division and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert "code" in namespace.Division.__table__.columns
+        assert model_factory.error is None
+    finally:
+        model_factory.stop()